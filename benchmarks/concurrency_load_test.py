@@ -0,0 +1,154 @@
+# benchmarks/concurrency_load_test.py
+"""Load test: generation throughput against concurrent requests on one worker.
+
+Default (simulated) mode runs the real content routes in-process on a
+single event loop, with the model, Supabase and the retrieval tool replaced
+by stand-ins that only add latency:
+
+* the model waits --llm-latency seconds through its async API (``agenerate``)
+* every Supabase call blocks its thread for --db-latency seconds
+
+With non-blocking handlers, N concurrent lesson-plan requests finish in
+about one request's time, so throughput grows with N until the database
+pool fills. ``--blocking-llm`` makes the model call block the event loop, as
+``llm.invoke`` used to, for comparison. In that mode throughput stays flat.
+
+Against a running server (``uvicorn main:app --workers 1``), pass --url and
+a JSON payload file for a real endpoint:
+    python -m benchmarks.concurrency_load_test --url http://localhost:8001 \
+        --path /api/content/lesson-plan --payload-file payload.json
+
+Run from the repository root:
+    python -m benchmarks.concurrency_load_test --concurrency 1 2 4 8 16 32
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from src.education_ai_system.api import content_routes
+
+LESSON_PLAN = "| WEEK | MAIN TOPIC | SUBTOPICS |\n| 1 | National Identity | Meaning, importance |\n"
+
+
+class SimulatedGenerator:
+    def __init__(self, latency: float, blocking: bool):
+        self.latency = latency
+        self.blocking = blocking
+
+    async def agenerate(self, content_type: str, context: dict, bypass_cache: bool = False,
+                        cache_info: dict = None) -> str:
+        if self.blocking:
+            time.sleep(self.latency)
+        else:
+            await asyncio.sleep(self.latency)
+        return LESSON_PLAN
+
+
+class SimulatedSupabase:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def get_scheme(self, scheme_id):
+        time.sleep(self.latency)
+        return {"id": scheme_id, "context_id": "ctx", "content": LESSON_PLAN,
+                "payload": {"subject": "Civic Education", "grade_level": "Primary Three"}}
+
+    def create_lesson_plan(self, scheme_id, data):
+        time.sleep(self.latency)
+        return f"plan-{time.perf_counter_ns()}"
+
+    def create_lesson_plans(self, scheme_id, items):
+        time.sleep(self.latency)
+        return [f"plan-{time.perf_counter_ns()}-{i}" for i in range(len(items))]
+
+
+class _Ready:
+    """Wraps an object with the aget() the routes call on lazy resources"""
+
+    def __init__(self, instance):
+        self._instance = instance
+
+    async def aget(self):
+        return self._instance
+
+    def __getattr__(self, attribute):
+        return getattr(self._instance, attribute)
+
+
+def simulated_app(args) -> FastAPI:
+    # The routes look these up as module globals
+    content_routes.generator = _Ready(SimulatedGenerator(args.llm_latency, args.blocking_llm))
+    content_routes.session_mgr = _Ready(SimulatedSupabase(args.db_latency))
+    app = FastAPI()
+    app.include_router(content_routes.router, prefix="/api/content")
+    return app
+
+
+async def run_level(client: httpx.AsyncClient, path: str, payload: dict, concurrency: int, total: int):
+    queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+    latencies, failures = [], 0
+
+    async def worker():
+        nonlocal failures
+        while not queue.empty():
+            queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.post(path, json=payload)
+            latencies.append(time.perf_counter() - start)
+            failures += response.status_code != 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return total / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95) - 1], failures
+
+
+async def main_async(args):
+    if args.url:
+        with open(args.payload_file) as f:
+            payload = json.load(f)
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+        path = args.path
+    else:
+        payload = {"scheme_of_work_id": "scheme-1", "week": "1", "limitations": "None"}
+        transport = httpx.ASGITransport(app=simulated_app(args))
+        client = httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=args.timeout)
+        path = "/api/content/lesson-plan"
+
+    async with client:
+        print(f"{'concurrency':>11}{'req/s':>10}{'p50 s':>9}{'p95 s':>9}{'failed':>8}")
+        for concurrency in args.concurrency:
+            total = max(args.requests, concurrency * 2)
+            throughput, p50, p95, failures = await run_level(client, path, payload, concurrency, total)
+            print(f"{concurrency:>11}{throughput:>10.2f}{p50:>9.2f}{p95:>9.2f}{failures:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--requests", type=int, default=32, help="requests per concurrency level (at least 2x)")
+    parser.add_argument("--llm-latency", type=float, default=1.0)
+    parser.add_argument("--db-latency", type=float, default=0.05)
+    parser.add_argument("--blocking-llm", action="store_true", help="simulate the old blocking llm.invoke")
+    parser.add_argument("--url")
+    parser.add_argument("--path", default="/api/content/lesson-plan")
+    parser.add_argument("--payload-file")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    args = parser.parse_args()
+    if args.url and not args.payload_file:
+        parser.error("--url needs --payload-file")
+    # Supabase's module configures INFO logging; keep per-request httpx lines out of the table
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
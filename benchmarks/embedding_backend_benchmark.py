@@ -0,0 +1,89 @@
+# benchmarks/embedding_backend_benchmark.py
+"""Compares the torch and int8 ONNX embedding backends on CPU.
+
+Reports single-query latency, batched throughput, resident memory and the
+cosine agreement of ONNX vectors with torch vectors for the same texts.
+
+Run from the repository root:
+    python -m benchmarks.embedding_backend_benchmark --texts 512 --batch-size 32
+"""
+import argparse
+import resource
+import statistics
+import time
+
+import numpy as np
+
+from src.education_ai_system.embeddings.embedding_service import EmbeddingService
+
+SAMPLE = (
+    "Civic Education Primary Four National Consciousness. Pupils should be able to "
+    "identify national symbols, explain the meaning of the national anthem and pledge, "
+    "and describe ways of showing loyalty to Nigeria in school and in the community."
+)
+
+
+def rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_texts(n: int):
+    words = SAMPLE.split()
+    # Vary lengths so batches exercise padding
+    return [" ".join(words[: 8 + (i * 7) % len(words)]) + f" ({i})" for i in range(n)]
+
+
+def run(backend: str, texts, batch_size: int, queries: int):
+    before = rss_mb()
+    service = EmbeddingService(backend=backend, batch_size=batch_size)
+    service.embed_query("warm up")
+    loaded = rss_mb()
+
+    latencies = []
+    for i in range(queries):
+        start = time.perf_counter()
+        service.embed_query(texts[i % len(texts)][:80])
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    vectors = service.embed(texts)
+    elapsed = time.perf_counter() - start
+    return {
+        "backend": backend,
+        "load_s": service.load_seconds,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": sorted(latencies)[int(len(latencies) * 0.95) - 1],
+        "texts_per_s": len(texts) / elapsed,
+        "rss_mb": loaded - before,
+        "vectors": vectors,
+    }
+
+
+def cosine_rows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return (a * b).sum(axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts)
+    # ru_maxrss is a high-water mark, so run the lighter backend first
+    results = [run(name, texts, args.batch_size, args.queries) for name in ("onnx", "torch")]
+
+    print(f"{'backend':<8}{'load (s)':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}{'texts/s':>10}{'RSS +MB':>10}")
+    for r in results:
+        print(f"{r['backend']:<8}{r['load_s']:>10.2f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+              f"{r['texts_per_s']:>10.1f}{r['rss_mb']:>10.1f}")
+
+    agreement = cosine_rows(results[0]["vectors"], results[1]["vectors"])
+    print(f"\ncosine(onnx, torch): mean={agreement.mean():.4f} min={agreement.min():.4f}")
+
+
+if __name__ == "__main__":
+    main()
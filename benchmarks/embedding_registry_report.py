@@ -0,0 +1,63 @@
+# benchmarks/embedding_registry_report.py
+"""Compares per-request MiniLM loads against the shared embedding registry.
+
+Run from the repository root:
+    python -m benchmarks.embedding_registry_report --requests 5
+"""
+import argparse
+import resource
+import time
+
+from transformers import AutoTokenizer, AutoModel
+
+from src.education_ai_system.embeddings.embedding_service import DEFAULT_MODEL_NAME, get_embedding_service
+
+
+def rss_mb() -> float:
+    # ru_maxrss is reported in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def per_request_loads(n: int):
+    """Old behaviour: every request loads (and keeps) its own model copy"""
+    models, timings = [], []
+    for _ in range(n):
+        start = time.perf_counter()
+        models.append((AutoTokenizer.from_pretrained(DEFAULT_MODEL_NAME),
+                       AutoModel.from_pretrained(DEFAULT_MODEL_NAME)))
+        timings.append(time.perf_counter() - start)
+    return models, timings
+
+
+def shared_loads(n: int):
+    """New behaviour: every request asks the registry for the shared service"""
+    timings = []
+    for _ in range(n):
+        start = time.perf_counter()
+        get_embedding_service().embed_query("warm up")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5)
+    args = parser.parse_args()
+
+    base = rss_mb()
+    shared = shared_loads(args.requests)
+    shared_rss = rss_mb()
+    _, duplicated = per_request_loads(args.requests)
+    duplicated_rss = rss_mb()
+
+    print(f"{'mode':<12}{'first (s)':>12}{'later avg (s)':>16}{'peak RSS +MB':>15}")
+    for name, timings, rss in (
+        ("shared", shared, shared_rss - base),
+        ("per-request", duplicated, duplicated_rss - shared_rss),
+    ):
+        later = sum(timings[1:]) / max(len(timings) - 1, 1)
+        print(f"{name:<12}{timings[0]:>12.3f}{later:>16.3f}{rss:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# benchmarks/import_profile.py
+"""Import-time profile of the API entry point.
+
+Runs ``python -X importtime -c "import main"`` in a fresh interpreter and
+summarises where the time goes: total import time, the slowest top-level
+packages (cumulative) and whether known heavy libraries were imported at
+all. With lazy startup, torch, transformers, langchain, pinecone, supabase
+and pdfplumber should not appear.
+
+Run from the repository root:
+    python -m benchmarks.import_profile --module main --top 15
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+HEAVY = ("torch", "transformers", "langchain", "langchain_core", "langchain_groq", "pinecone",
+         "supabase", "pdfplumber", "onnxruntime", "pandas", "docx")
+
+
+def profile(module: str):
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               capture_output=True, text=True, env=env)
+    rows = []
+    for line in completed.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        head, cumulative_us, name = line.split("|")
+        rows.append((name.strip(), int(head.split(":")[1]), int(cumulative_us)))
+    return completed.returncode, completed.stderr, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    returncode, stderr, rows = profile(args.module)
+    if returncode != 0:
+        print(stderr.strip().splitlines()[-1] if stderr.strip() else f"import {args.module} failed")
+        sys.exit(returncode)
+
+    target = [row for row in rows if row[0] == args.module]
+    total_ms = (target[-1][2] if target else sum(row[1] for row in rows)) / 1000
+    packages = {}
+    for name, _, cumulative in rows:
+        top = name.split(".")[0]
+        packages[top] = max(packages.get(top, 0), cumulative)
+    print(f"import {args.module}: {total_ms:.0f} ms, {len(rows)} modules")
+    print(f"{'package':<32}{'cumulative ms':>14}")
+    for name, cumulative in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{name:<32}{cumulative / 1000:>14.1f}")
+    imported = sorted({name.split(".")[0] for name, *_ in rows} & set(HEAVY))
+    print("heavy libraries imported:", ", ".join(imported) if imported else "none")
+
+
+if __name__ == "__main__":
+    main()
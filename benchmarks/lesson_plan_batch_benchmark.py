@@ -0,0 +1,93 @@
+# benchmarks/lesson_plan_batch_benchmark.py
+"""Benchmark: a term of lesson plans, one request per week vs one batch job.
+
+Runs the real content routes in-process with the simulated model and
+Supabase from concurrency_load_test (each model call waits --llm-latency
+seconds, each database call blocks for --db-latency seconds), against a
+scheme with --weeks weeks.
+
+* serial - POST /lesson-plan once per week, one after another
+* batch  - POST /lesson-plans/batch, then poll the job until it finishes
+
+Run from the repository root:
+    python -m benchmarks.lesson_plan_batch_benchmark --weeks 13 --concurrency 1 4 8 13
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+import httpx
+
+from benchmarks.concurrency_load_test import SimulatedSupabase, _Ready, simulated_app
+
+
+def term_scheme(weeks: int) -> str:
+    rows = "".join(f"| {week} | Topic {week} | Subtopic {week}a, subtopic {week}b |\n" for week in range(1, weeks + 1))
+    return "| WEEK | MAIN TOPIC | SUBTOPICS |\n" + rows
+
+
+class TermSupabase(SimulatedSupabase):
+    def __init__(self, latency: float, weeks: int):
+        super().__init__(latency)
+        self.content = term_scheme(weeks)
+
+    def get_scheme(self, scheme_id):
+        time.sleep(self.latency)
+        return {"id": scheme_id, "context_id": "ctx", "content": self.content,
+                "payload": {"subject": "Civic Education", "grade_level": "Primary Three"}}
+
+
+async def run_serial(client: httpx.AsyncClient, weeks: int) -> float:
+    start = time.perf_counter()
+    for week in range(1, weeks + 1):
+        response = await client.post("/api/content/lesson-plan", json={
+            "scheme_of_work_id": "scheme-1", "week": str(week), "limitations": "None"})
+        response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def run_batch(client: httpx.AsyncClient, concurrency: int):
+    start = time.perf_counter()
+    response = await client.post("/api/content/lesson-plans/batch", json={
+        "scheme_of_work_id": "scheme-1", "limitations": "None", "concurrency": concurrency})
+    response.raise_for_status()
+    status_url = response.json()["status_url"]
+    while True:
+        job = (await client.get(status_url)).json()
+        if job["stage"] in ("completed", "partial", "failed"):
+            return time.perf_counter() - start, job
+        await asyncio.sleep(0.02)
+
+
+async def main_async(args):
+    from src.education_ai_system.api import content_routes
+
+    app = simulated_app(args)
+    content_routes.session_mgr = _Ready(TermSupabase(args.db_latency, args.weeks))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=600) as client:
+        serial = await run_serial(client, args.weeks)
+        print(f"{'mode':>14}{'seconds':>10}{'generations':>13}{'saved':>8}")
+        print(f"{'serial':>14}{serial:>10.2f}{serial / args.llm_latency:>13.1f}{args.weeks:>8}")
+        for concurrency in args.concurrency:
+            seconds, job = await run_batch(client, concurrency)
+            label = f"batch x{job['concurrency']}"
+            print(f"{label:>14}{seconds:>10.2f}{seconds / args.llm_latency:>13.1f}{job['weeks_saved']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--weeks", type=int, default=13)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 13])
+    parser.add_argument("--llm-latency", type=float, default=1.0)
+    parser.add_argument("--db-latency", type=float, default=0.05)
+    args = parser.parse_args()
+    args.blocking_llm = False
+    for name in ("httpx", "LessonPlanBatches"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/metadata_tagger_benchmark.py
+"""Benchmarks the catalog tagger against the old hardcoded regex on a synthetic corpus.
+
+Reports throughput (MB/s, chunks/s) and how many chunks each approach tags
+with the correct subject and grade level.
+
+Run from the repository root:
+    python -m benchmarks.metadata_tagger_benchmark --chunks 20000
+"""
+import argparse
+import random
+import re
+import time
+
+from src.education_ai_system.data_processing.metadata_extractor import (
+    UNKNOWN_GRADE, UNKNOWN_SUBJECT, CurriculumTagger
+)
+from src.education_ai_system.utils.validators import load_predefined_inputs
+
+FILLER = ("pupils should be able to explain describe identify and discuss the lesson with examples "
+          "from their community the teacher guides the class through activities and evaluation").split()
+
+
+def legacy_extract_metadata(chunk):
+    """The original implementation, kept here for comparison"""
+    subject = re.search(r"(Mathematics|Civic Education|Science|English)", chunk, re.IGNORECASE)
+    grade_level = re.search(r"(Primary [One|Two|Three|Four|Five|Six])", chunk, re.IGNORECASE)
+    return (subject.group(0) if subject else UNKNOWN_SUBJECT,
+            grade_level.group(0) if grade_level else UNKNOWN_GRADE)
+
+
+def make_corpus(n: int, words_per_chunk: int = 200):
+    catalog = load_predefined_inputs()
+    combos = [(s["name"], g["name"], t) for s in catalog["subjects"]
+              for g in s["grade_levels"] for t in g["topics"]]
+    corpus = []
+    for _ in range(n):
+        subject, grade, topic = random.choice(combos)
+        words = random.choices(FILLER, k=words_per_chunk)
+        words.insert(random.randrange(len(words)), topic)
+        if random.random() < 0.7:
+            words.insert(random.randrange(len(words)), subject.upper())
+        if random.random() < 0.7:
+            words.insert(random.randrange(len(words)), grade)
+        corpus.append((" ".join(words), subject, grade))
+    return corpus
+
+
+def measure(label, fn, corpus):
+    texts = [text for text, _, _ in corpus]
+    start = time.perf_counter()
+    tags = [fn(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    size_mb = sum(len(text) for text in texts) / 1e6
+    subject_ok = sum(t[0].lower() == s.lower() for t, (_, s, _) in zip(tags, corpus)) / len(tags)
+    grade_ok = sum(t[1].lower() == g.lower() for t, (_, _, g) in zip(tags, corpus)) / len(tags)
+    unknown = sum(t[0] == UNKNOWN_SUBJECT or t[1] == UNKNOWN_GRADE for t in tags) / len(tags)
+    print(f"{label:<10}{elapsed:>9.2f}s{size_mb / elapsed:>9.2f}{len(corpus) / elapsed:>12.0f}"
+          f"{subject_ok:>10.1%}{grade_ok:>10.1%}{unknown:>10.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=20000)
+    args = parser.parse_args()
+
+    random.seed(7)
+    corpus = make_corpus(args.chunks)
+    start = time.perf_counter()
+    tagger = CurriculumTagger()
+    print(f"compiled automaton in {(time.perf_counter() - start) * 1000:.1f} ms\n")
+    print(f"{'tagger':<10}{'time':>10}{'MB/s':>9}{'chunks/s':>12}{'subject':>10}{'grade':>10}{'unknown':>10}")
+    measure("legacy", legacy_extract_metadata, corpus)
+    measure("catalog", tagger.tag, corpus)
+
+
+if __name__ == "__main__":
+    main()
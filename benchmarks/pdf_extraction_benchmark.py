@@ -0,0 +1,71 @@
+# benchmarks/pdf_extraction_benchmark.py
+"""Benchmarks serial vs process-pool PDF text extraction on a synthetic PDF.
+
+Run from the repository root:
+    python -m benchmarks.pdf_extraction_benchmark --pages 500 --workers 1 2 4 8
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.education_ai_system.data_processing import pdf_extractor
+
+LINE = "Pupils identify national symbols and explain the meaning of the pledge {page}.{line}"
+
+
+def write_synthetic_pdf(path: str, pages: int, lines_per_page: int = 45):
+    """Writes a plain-text PDF with one Helvetica content stream per page"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(pages):
+        body = ["BT", "/F1 10 Tf", "12 TL", "40 800 Td"]
+        body += [f"({LINE.format(page=page, line=line)}) '" for line in range(lines_per_page)]
+        body.append("ET")
+        stream = "\n".join(body)
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        content_id = len(objects)
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, obj in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(f"{number} 0 obj\n{obj}\nendobj\n".encode("latin-1"))
+        xref = f.tell()
+        f.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode())
+        for offset in offsets:
+            f.write(f"{offset:010d} 00000 n \n".encode())
+        f.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+                f"startxref\n{xref}\n%%EOF\n".encode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--tables", action="store_true", help="Also extract tables")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "synthetic.pdf")
+        write_synthetic_pdf(path, args.pages)
+
+        baseline = None
+        print(f"{'workers':>8}{'seconds':>10}{'pages/s':>10}{'speedup':>10}")
+        for workers in sorted(set(args.workers)):
+            start = time.perf_counter()
+            pages = list(pdf_extractor.iter_pages(path, include_tables=args.tables, workers=workers))
+            elapsed = time.perf_counter() - start
+            assert [p[0] for p in pages] == list(range(1, args.pages + 1)), "pages out of order"
+            baseline = baseline or elapsed
+            print(f"{workers:>8}{elapsed:>10.2f}{len(pages) / elapsed:>10.1f}{baseline / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
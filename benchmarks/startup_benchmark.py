@@ -0,0 +1,76 @@
+# benchmarks/startup_benchmark.py
+"""Measures API cold start in each STARTUP_MODE.
+
+For every mode, uvicorn is started in a fresh process and polled until
+/health/live answers (the port is bound and requests are served) and until
+/health/ready answers 200 (models, indexes and clients are initialised).
+
+Run from the repository root with the API's environment (.env) available:
+    python -m benchmarks.startup_benchmark --modes eager background lazy --runs 3
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def wait_for(url: str, deadline: float, process) -> float:
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter()
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(url)
+
+
+def start_once(mode: str, port: int, timeout: float):
+    env = {**os.environ, "STARTUP_MODE": mode}
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = start + timeout
+        live = wait_for(f"http://127.0.0.1:{port}/health/live", deadline, process) - start
+        try:
+            ready = wait_for(f"http://127.0.0.1:{port}/health/ready", deadline, process) - start
+        except TimeoutError:
+            ready = None
+        return live, ready
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", nargs="+", default=["eager", "background", "lazy"])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=180.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'live s (median)':>17}{'ready s (median)':>18}")
+    for mode in args.modes:
+        lives, readies = [], []
+        for _ in range(args.runs):
+            live, ready = start_once(mode, args.port, args.timeout)
+            lives.append(live)
+            if ready is not None:
+                readies.append(ready)
+        ready_text = f"{statistics.median(readies):.2f}" if readies else "timeout"
+        print(f"{mode:<12}{statistics.median(lives):>17.2f}{ready_text:>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/upsert_writer_benchmark.py
+"""Exercises UpsertWriter against a local fake index with latency and failures.
+
+Compares one-batch-at-a-time upserts with concurrent, size-aware batches.
+Run from the repository root:
+    python -m benchmarks.upsert_writer_benchmark --vectors 5000 --failure-rate 0.05
+"""
+import argparse
+import random
+import threading
+import time
+
+from src.education_ai_system.embeddings.upsert_writer import UpsertWriter, summarize
+
+
+class FakeIndex:
+    """In-memory stand-in for a Pinecone Index with per-request latency and failures"""
+
+    def __init__(self, latency: float, failure_rate: float, max_request_bytes: int):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.max_request_bytes = max_request_bytes
+        self.vectors = {}
+        self._lock = threading.Lock()
+
+    def upsert(self, vectors, namespace=None):
+        from src.education_ai_system.embeddings.upsert_writer import vector_size
+
+        if sum(vector_size(v) for v in vectors) > self.max_request_bytes:
+            raise ValueError("request too large")
+        time.sleep(self.latency * (1 + len(vectors) / 200))
+        if random.random() < self.failure_rate:
+            raise ConnectionError("simulated transient failure")
+        with self._lock:
+            for vector in vectors:
+                self.vectors[vector["id"]] = vector
+
+
+def make_vectors(n: int):
+    return [{
+        "id": f"chunk-{i}",
+        "values": [random.random() for _ in range(384)],
+        "metadata": {"subject": "Mathematics", "grade_level": "Primary Four",
+                     "content": "fractions " * random.randint(50, 400)}
+    } for i in range(n)]
+
+
+def run(label, vectors, **writer_kwargs):
+    index = FakeIndex(latency=0.02, failure_rate=ARGS.failure_rate, max_request_bytes=2 * 1024 * 1024)
+    start = time.perf_counter()
+    with UpsertWriter(index, backoff_seconds=0.01, **writer_kwargs) as writer:
+        summary = summarize(writer.write(vectors))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed:>8.2f}s{summary['batches']:>8}{summary['retries']:>8}"
+          f"{summary['failed_batches']:>8}{len(index.vectors):>10}")
+
+
+def main():
+    global ARGS
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vectors", type=int, default=5000)
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    ARGS = parser.parse_args()
+
+    vectors = make_vectors(ARGS.vectors)
+    print(f"{'mode':<28}{'time':>9}{'batches':>8}{'retries':>8}{'failed':>8}{'stored':>10}")
+    run("sequential, 100/batch", vectors, max_workers=1, max_batch_vectors=100)
+    run("concurrent x4, 100/batch", vectors, max_workers=4, max_batch_vectors=100)
+    run("concurrent x8, 200/batch", vectors, max_workers=8, max_batch_vectors=200)
+
+
+if __name__ == "__main__":
+    main()
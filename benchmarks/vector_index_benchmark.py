@@ -0,0 +1,116 @@
+# benchmarks/vector_index_benchmark.py
+"""Recall vs latency of the IVF index against exact search in LocalVectorStore.
+
+By default the corpus is synthetic 384-dim unit vectors drawn around topic
+clusters, which is how MiniLM chunk embeddings are distributed. Point
+--from-store at a local store built by real ingestion to use MiniLM vectors
+instead. Queries are held-out perturbations of corpus rows; recall@k is
+measured against exact top-k.
+Run from the repository root:
+    python -m benchmarks.vector_index_benchmark --vectors 200000 --nprobe 1 2 4 8 16 32
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.education_ai_system.embeddings.embedding_service import EMBEDDING_DIMENSION
+from src.education_ai_system.embeddings.vector_store import LocalVectorStore
+
+
+def synthetic_corpus(n: int, clusters: int, spread: float, rng) -> np.ndarray:
+    centers = rng.normal(size=(clusters, EMBEDDING_DIMENSION)).astype(np.float32)
+    labels = rng.integers(0, clusters, n)
+    vectors = centers[labels] + spread * rng.normal(size=(n, EMBEDDING_DIMENSION)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def fill_store(path: Path, vectors: np.ndarray, index: str, batch: int = 5000):
+    """Returns (seconds to upsert everything, slowest single upsert call in seconds)"""
+    store = LocalVectorStore(str(path), index=index, compact_every=10 ** 9)
+    start = time.perf_counter()
+    slowest = 0.0
+    for i in range(0, len(vectors), batch):
+        batch_start = time.perf_counter()
+        store.upsert([{"id": f"v{j}", "values": vectors[j]} for j in range(i, min(i + batch, len(vectors)))])
+        slowest = max(slowest, time.perf_counter() - batch_start)
+    seconds = time.perf_counter() - start
+    # IVF retrains run in the background; let the last one finish before the store is saved
+    store.close()
+    return seconds, slowest
+
+
+def run_queries(store: LocalVectorStore, queries: np.ndarray, top_k: int, nprobe: int = None):
+    results, latencies = [], []
+    # Untimed pass so first-touch page faults and lazily built cell arrays are not counted
+    for query in queries:
+        store.query(query, top_k=top_k, nprobe=nprobe)
+    for query in queries:
+        start = time.perf_counter()
+        response = store.query(query, top_k=top_k, nprobe=nprobe)
+        latencies.append(time.perf_counter() - start)
+        results.append({match["id"] for match in response["matches"]})
+    return results, np.array(latencies) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vectors", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--clusters", type=int, default=400)
+    # ~0.5 cosine between chunks of one topic, like MiniLM chunk embeddings
+    parser.add_argument("--spread", type=float, default=1.0)
+    parser.add_argument("--query-noise", type=float, default=0.05)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=0, help="IVF cells (0 = 4*sqrt(n))")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--from-store", help="Existing local store directory to read vectors from")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    if args.from_store:
+        source = LocalVectorStore(args.from_store, index="exact")
+        live = np.flatnonzero(source._alive)
+        corpus = np.asarray(source._matrix[live], dtype=np.float32)
+        print(f"Loaded {len(corpus)} vectors from {args.from_store}")
+    else:
+        corpus = synthetic_corpus(args.vectors, args.clusters, args.spread, rng)
+    picked = rng.choice(len(corpus), args.queries, replace=False)
+    queries = corpus[picked] + args.query_noise * rng.normal(size=(args.queries, corpus.shape[1])).astype(np.float32)
+
+    workdir = Path(tempfile.mkdtemp(prefix="vector_index_bench_"))
+    try:
+        exact_dir, ivf_dir = workdir / "exact", workdir / "ivf"
+        exact_load, exact_slowest = fill_store(exact_dir, corpus, "exact")
+        os.environ["LOCAL_IVF_NLIST"] = str(args.nlist)
+        os.environ["LOCAL_IVF_MIN_VECTORS"] = "1"
+        ivf_load, ivf_slowest = fill_store(ivf_dir, corpus, "ivf")
+
+        exact = LocalVectorStore(str(exact_dir), index="exact")
+        truth, exact_ms = run_queries(exact, queries, args.top_k)
+        ivf = LocalVectorStore(str(ivf_dir), index="ivf")
+        ivf.wait_for_index()
+        stats = ivf.describe_index_stats()["index"]
+
+        print(f"{len(corpus)} vectors, {args.queries} queries, recall@{args.top_k}; "
+              f"nlist={stats['nlist']}, largest cell={stats['largest_list']}")
+        print(f"ingest: exact {exact_load:.1f}s (slowest upsert {exact_slowest * 1000:.0f} ms), "
+              f"ivf {ivf_load:.1f}s (slowest upsert {ivf_slowest * 1000:.0f} ms, training in the background)")
+        print(f"{'mode':<14}{'recall':>8}{'p50 ms':>9}{'p99 ms':>9}{'speedup':>9}")
+        print(f"{'exact':<14}{1.0:>8.3f}{np.percentile(exact_ms, 50):>9.2f}{np.percentile(exact_ms, 99):>9.2f}{1.0:>8.1f}x")
+        for nprobe in args.nprobe:
+            found, ivf_ms = run_queries(ivf, queries, args.top_k, nprobe)
+            recall = np.mean([len(f & t) / len(t) for f, t in zip(found, truth)])
+            speedup = np.percentile(exact_ms, 50) / np.percentile(ivf_ms, 50)
+            print(f"{'ivf nprobe=' + str(nprobe):<14}{recall:>8.3f}{np.percentile(ivf_ms, 50):>9.2f}"
+                  f"{np.percentile(ivf_ms, 99):>9.2f}{speedup:>8.1f}x")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
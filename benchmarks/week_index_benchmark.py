@@ -0,0 +1,96 @@
+# benchmarks/week_index_benchmark.py
+"""Benchmarks week lookups on long generated schemes of work.
+
+Builds a 13-week scheme in the shape the scheme_of_work prompt produces (a
+week table followed by a detailed section per week) and compares:
+
+* legacy   - the old line-by-line scans, repeated for every lookup
+* parse    - WeekIndex.from_content, paid once when the scheme is created
+* indexed  - topic and section lookups against the stored index
+
+Run from the repository root:
+    python -m benchmarks.week_index_benchmark --weeks 13 --paragraphs 40
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+
+from src.education_ai_system.utils.week_index import WeekIndex
+
+WORDS = ("pupils discuss identify describe explain the community national symbols flag anthem "
+         "pledge teacher guides activities evaluation group work assessment practical").split()
+
+
+def make_scheme(weeks: int, paragraphs: int) -> str:
+    lines = ["TOPIC: National Consciousness", "",
+             "| WEEK | MAIN TOPIC | SUBTOPICS/KEY THEMES |", "|------|------------|----------------------|"]
+    for week in range(1, weeks + 1):
+        lines.append(f"| {week} | Topic {week} | Theme {week}a, Theme {week}b, Theme {week}c |")
+    for week in range(1, weeks + 1):
+        lines += ["", f"## WEEK {week}: Topic {week}"]
+        for _ in range(paragraphs):
+            lines.append(" ".join(random.choices(WORDS, k=60)) + f" {random.randint(1, 400)} minutes.")
+    return "\n".join(lines)
+
+
+def legacy_week_topic(scheme_content: str, week: str) -> str:
+    clean_week = ''.join(filter(str.isdigit, week))
+    for line in scheme_content.split('\n'):
+        if f"| {clean_week} |" in line or f"|{clean_week}|" in line:
+            parts = [p.strip() for p in line.split('|') if p.strip()]
+            if len(parts) >= 3:
+                return parts[1]
+    return "General Topic"
+
+
+def legacy_week_content(content: str, week: str) -> str:
+    week_header = f"WEEK {week}"
+    start_index = content.find(week_header)
+    if start_index == -1:
+        return ""
+    end_index = content.find("WEEK ", start_index + len(week_header))
+    return content[start_index:] if end_index == -1 else content[start_index:end_index]
+
+
+def timed_us(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--weeks", type=int, default=13)
+    parser.add_argument("--paragraphs", type=int, default=40, help="paragraphs per week section")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    random.seed(0)
+    scheme = make_scheme(args.weeks, args.paragraphs)
+    weeks = [str(week) for week in range(1, args.weeks + 1)]
+    index = WeekIndex.from_content(scheme)
+    assert index.weeks() == weeks, index.weeks()
+    # The stored form is what lesson-plan requests load from the scheme row
+    stored = json.loads(json.dumps(index.to_dict()))
+
+    legacy = timed_us(lambda: [(legacy_week_topic(scheme, w), legacy_week_content(scheme, w)) for w in weeks],
+                      args.repeat) / len(weeks)
+    parse = timed_us(lambda: WeekIndex.from_content(scheme), args.repeat)
+    loaded = WeekIndex.from_dict(stored)
+    indexed = timed_us(lambda: [(loaded.topic(w), loaded.section(scheme, w)) for w in weeks],
+                       args.repeat) / len(weeks)
+
+    print(f"scheme: {args.weeks} weeks, {len(scheme) / 1024:.0f} KiB, {scheme.count(chr(10)) + 1} lines")
+    print(f"legacy scan per week lookup   {legacy:9.1f} us")
+    print(f"WeekIndex parse (once)        {parse:9.1f} us")
+    print(f"indexed lookup per week       {indexed:9.2f} us  ({legacy / indexed:,.0f}x faster)")
+    print(f"stored index size             {len(json.dumps(stored)):9d} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 # main.py
 import asyncio
+import os
+import time
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 from src.education_ai_system.api import (
     embeddings_routes,
@@ -9,6 +12,13 @@ from src.education_ai_system.api import (
     evaluation_routes
 )
 from src.education_ai_system.utils.session_manager import SessionManager
+from src.education_ai_system.embeddings.vector_store import open_vector_store, vector_index_name
+from src.education_ai_system.embeddings.embedding_service import get_embedding_service
+from src.education_ai_system.embeddings.query_vector_table import get_query_vector_table
+from src.education_ai_system.utils.executors import executor_stats
+from src.education_ai_system.utils.lazy_resources import (
+    all_ready, lazy_resource, resource_status, warm_up
+)
 
 load_dotenv()
 
@@ -18,7 +28,24 @@ app = FastAPI(
     version="1.0.0"
 )
 
-session_mgr = SessionManager()
+# eager: warm everything before serving (old behaviour)
+# background: serve immediately and warm up in a worker thread
+# lazy: create each resource on first use only
+STARTUP_MODE = os.getenv("STARTUP_MODE", "background").lower()
+
+session_mgr = lazy_resource("session_manager", SessionManager)
+
+
+def _embedding_model():
+    service = get_embedding_service()
+    service.backend  # loads the tokenizer and weights
+    return service
+
+
+lazy_resource("embedding_model", _embedding_model)
+lazy_resource("vector_index", lambda: open_vector_store(vector_index_name()))
+lazy_resource("query_vector_table", get_query_vector_table)
+_warm_up = {"started_at": None, "finished_at": None, "seconds": None}
 
 # Include all routers
 app.include_router(
@@ -46,6 +73,45 @@ app.include_router(
     tags=["Content Evaluation"]
 )
 
+def _run_warm_up():
+    _warm_up["started_at"] = time.time()
+    start = time.perf_counter()
+    warm_up()
+    _warm_up["seconds"] = round(time.perf_counter() - start, 3)
+    _warm_up["finished_at"] = time.time()
+    print(f"Warm-up finished in {_warm_up['seconds']:.1f}s (ready: {all_ready()})")
+
+
+@app.on_event("startup")
+async def start_warm_up():
+    # Opens the shared vector index (one existence check per process), models and clients
+    if STARTUP_MODE == "lazy":
+        return
+    warm_up_future = asyncio.get_running_loop().run_in_executor(None, _run_warm_up)
+    if STARTUP_MODE == "eager":
+        await warm_up_future
+
+
+@app.get("/health/live")
+async def liveness():
+    """The process is up and serving requests"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness():
+    """200 once heavy resources are initialised (always in lazy mode), 503 while warming up or after a failure"""
+    ready = STARTUP_MODE == "lazy" or (_warm_up["finished_at"] is not None and all_ready())
+    body = {
+        "status": "ready" if ready else "warming_up",
+        "startup_mode": STARTUP_MODE,
+        "warm_up_seconds": _warm_up["seconds"],
+        "resources": resource_status(),
+        "executors": executor_stats()
+    }
+    return JSONResponse(body, status_code=200 if ready else 503)
+
+
 @app.get("/")
 async def health_check():
     return {
@@ -53,9 +119,23 @@ async def health_check():
         "version": app.version,
         "endpoints": {
             "process_pdf": "/api/embeddings/process_pdf",
+            "process_pdfs_bulk": "/api/embeddings/process_pdfs",
+            "ingestion_job_status": "/api/embeddings/jobs/{job_id}",
+            "vector_store_stats": "/api/embeddings/vector-store/stats",
+            "liveness": "/health/live",
+            "readiness": "/health/ready",
+            "curriculum_catalog": "/api/content/catalog",
+            "catalog_suggestions": "/api/content/catalog/suggest",
             "generate_lesson_plan": "/api/content/generate/lesson_plan",
             "generate_scheme": "/api/content/generate/scheme_of_work",
             "generate_notes": "/api/content/generate/lesson_notes",
+            "generate_lesson_plans_batch": "/api/content/lesson-plans/batch",
+            "lesson_plan_batch_status": "/api/content/lesson-plans/batch/{job_id}",
+            "stream_scheme": "/api/content/scheme-of-work/stream",
+            "stream_lesson_plan": "/api/content/lesson-plan/stream",
+            "stream_notes": "/api/content/lesson-notes/stream",
+            "stream_stats": "/api/content/stream-stats",
+            "generation_cache": "/api/content/generation-cache",
             "convert_docx": "/api/convert/convert_md_to_docx",
             "evaluate_lesson_plan": "/api/evaluate/lesson_plan",
             "evaluate_scheme": "/api/evaluate/scheme",
@@ -1,114 +1,149 @@
 from fastapi import APIRouter, Body, HTTPException
-from src.education_ai_system.services.generators import ContentGenerator
-from src.education_ai_system.services.pinecone_service import VectorizationService
-from src.education_ai_system.utils.validators import validate_user_input, extract_week_topic, extract_week_content, load_predefined_inputs
+from fastapi.responses import StreamingResponse
+from src.education_ai_system.utils.validators import validate_user_input, load_predefined_inputs
 from src.education_ai_system.utils.session_manager import SessionManager
-from src.education_ai_system.tools.pinecone_exa_tools import PineconeRetrievalTool
+from src.education_ai_system.tools.retrieval_cache import get_retrieval_cache
+from src.education_ai_system.services.generation_cache import get_generation_cache
+from src.education_ai_system.utils.curriculum_catalog import get_catalog
+from src.education_ai_system.utils.week_index import WeekIndex, normalize_week
+from src.education_ai_system.utils.lazy_resources import lazy_resource
+from src.education_ai_system.utils.executors import run_blocking
+from src.education_ai_system.services.lesson_plan_batches import LessonPlanBatch, LessonPlanBatchManager, batch_concurrency
+from collections import deque
+import asyncio
+from typing import Optional
 import json
+import time
 
 router = APIRouter()
-generator = ContentGenerator()
-session_mgr = SessionManager()
 
-# Update generate_scheme endpoint
-@router.post("/scheme-of-work")
-async def generate_scheme(payload: dict = Body(...)):
+
+def _content_generator():
+    # Deferred so importing the routes does not load langchain or build the Groq client
+    from src.education_ai_system.services.generators import ContentGenerator
+    return ContentGenerator()
+
+
+def _retrieval_tool():
+    from src.education_ai_system.tools.pinecone_exa_tools import PineconeRetrievalTool
+    return PineconeRetrievalTool()
+
+
+generator = lazy_resource("content_generator", _content_generator)
+session_mgr = lazy_resource("session_manager", SessionManager)
+retriever = lazy_resource("retrieval_tool", _retrieval_tool)
+_batch_manager = LessonPlanBatchManager()
+
+# Each generation request is split into prepare (validate, look up context) and save
+# (persist, build the response) so the plain and the streaming endpoints share both.
+async def _prepare_scheme(payload: dict):
     if not validate_user_input(payload):
         raise HTTPException(400, detail="Invalid input parameters")
-    
-    try:
-        # Retrieve context from Pinecone
-        retrieval_tool = PineconeRetrievalTool()
-        result = json.loads(retrieval_tool.run(json.dumps(payload)))
-        
-        if result.get('status') != 'valid':
-            raise HTTPException(400, detail="Failed to retrieve context: " + result.get('message', ''))
-        
-        context = result.get('context', '')
-        
-        # Store context in database
-        context_id = session_mgr.supabase.store_context(
-            payload['subject'],
-            payload['grade_level'],
-            payload['topic'],
-            context
-        )
-        
-        # Generate content with retrieved context
-        scheme_content = generator.generate("scheme_of_work", {
-            **payload,
-            "curriculum_context": context
-        })
-        
+
+    # Retrieve context from Pinecone through the shared tool
+    tool = await retriever.aget()
+    result = json.loads(await run_blocking("retrieval", tool.run, json.dumps(payload)))
+
+    if result.get('status') != 'valid':
+        raise HTTPException(400, detail="Failed to retrieve context: " + result.get('message', ''))
+
+    context = result.get('context', '')
+
+    # Store context in database
+    context_id = await run_blocking(
+        "database",
+        session_mgr.supabase.store_context,
+        payload['subject'],
+        payload['grade_level'],
+        payload['topic'],
+        context
+    )
+
+    async def save(scheme_content: str) -> dict:
+        # Parse the week table once so lesson plans and notes never re-scan the markdown
+        week_index = WeekIndex.from_content(scheme_content)
+
         # Store scheme with context reference
-        scheme_id = session_mgr.create_scheme({
-            "payload": payload,
+        scheme_id = await run_blocking("database", session_mgr.create_scheme, {
+            "payload": {**payload, "week_index": week_index.to_dict()},
             "content": scheme_content,
             "context_id": context_id
         })
-        
+
         return {
             "scheme_of_work_id": scheme_id,
             "context_id": context_id,
             "scheme_of_work_output": scheme_content,
+            "weeks": week_index.weeks(),
             "status": "success"
         }
-        
-    except Exception as e:
-        raise HTTPException(500, detail=str(e))
 
-# Update generate_lesson_plan endpoint
-@router.post("/lesson-plan")
-async def generate_lesson_plan(payload: dict = Body(...)):
+    # Generate content with retrieved context
+    return "scheme_of_work", {**payload, "curriculum_context": context}, save
+
+
+async def _load_scheme_for_lesson_plans(scheme_id: str) -> dict:
+    # Get scheme data from database
+    scheme_data = await run_blocking("database", session_mgr.get_scheme, scheme_id) if scheme_id else None
+    if not scheme_data:
+        raise HTTPException(400, detail="Invalid scheme ID")
+
+    # Retrieve context from scheme
+    if not scheme_data.get("context_id"):
+        raise HTTPException(400, detail="No context found for scheme")
+    return scheme_data
+
+
+def _lesson_plan_context(scheme_data: dict, week_index: WeekIndex, week, limitations: str) -> dict:
+    """Generation context for one week of a scheme, shared by the single and the batch endpoints"""
+    # Week-specific topic from the week index stored with the scheme
+    week_topic = week_index.topic_or_default(week)
+    if not week_topic:
+        raise HTTPException(400, detail=f"No topic found for week {week}")
+
+    # Extract other subject details from scheme payload
+    scheme_payload = scheme_data.get("payload", {})
+    return {
+        "subject": scheme_payload.get("subject", ""),
+        "grade_level": scheme_payload.get("grade_level", ""),
+        "topic": week_topic,
+        "curriculum_context": scheme_data.get("content", ""),
+        "teaching_constraints": limitations,
+        "week": week
+    }
+
+
+def _lesson_plan_record(context: dict, lesson_content: str, context_id: str) -> dict:
+    return {
+        "payload": {
+            "subject": context["subject"],
+            "grade_level": context["grade_level"],
+            "topic": context["topic"],
+            "limitations": context["teaching_constraints"],
+            "week": context["week"],
+            "week_index": WeekIndex.from_content(lesson_content).to_dict()
+        },
+        "content": lesson_content,
+        "context_id": context_id
+    }
+
+
+async def _prepare_lesson_plan(payload: dict):
     scheme_id = payload.get("scheme_of_work_id")
     week = payload.get("week")
-    
-    if not scheme_id or not session_mgr.get_scheme(scheme_id):
-        raise HTTPException(400, detail="Invalid scheme ID")
-    
-    try:
-        # Get scheme data from database
-        scheme_data = session_mgr.get_scheme(scheme_id)
-        if not scheme_data:
-            raise HTTPException(404, detail="Associated scheme not found")
-        
-        # Retrieve context from scheme
-        context_id = scheme_data.get("context_id")
-        if not context_id:
-            raise HTTPException(400, detail="No context found for scheme")
-
-        # Extract the full scheme content and then the week-specific topic
-        scheme_content = scheme_data.get("content", "")
-        week_topic = extract_week_topic(scheme_content, week)
-        if not week_topic:
-            raise HTTPException(400, detail=f"No topic found for week {week}")
-
-        # Extract other subject details from scheme payload
-        scheme_payload = scheme_data.get("payload", {})
-
-        # Generate lesson plan content with week-specific topic and constraints
-        lesson_content = generator.generate("lesson_plan", {
-            "subject": scheme_payload.get("subject", ""),
-            "grade_level": scheme_payload.get("grade_level", ""),
-            "topic": week_topic,
-            "curriculum_context": scheme_content,
-            "teaching_constraints": payload.get("limitations", ""),
-            "week": week
-        })
-        
+
+    scheme_data = await _load_scheme_for_lesson_plans(scheme_id)
+    context_id = scheme_data["context_id"]
+
+    # Generate lesson plan content with week-specific topic and constraints
+    context = _lesson_plan_context(
+        scheme_data, WeekIndex.for_record(scheme_data), week, payload.get("limitations", ""))
+
+    async def save(lesson_content: str) -> dict:
         # Store in database
-        lesson_plan_id = session_mgr.create_lesson_plan(scheme_id, {
-            "payload": {
-                "subject": scheme_payload.get("subject", ""),
-                "grade_level": scheme_payload.get("grade_level", ""),
-                "topic": week_topic,
-                "limitations": payload.get("limitations", ""),
-                "week": week
-            },
-            "content": lesson_content,
-            "context_id": context_id
-        })
-        
+        lesson_plan_id = await run_blocking("database", session_mgr.create_lesson_plan, scheme_id,
+                                            _lesson_plan_record(context, lesson_content, context_id))
+
         return {
             "scheme_of_work_id": scheme_id,
             "lesson_plan_id": lesson_plan_id,
@@ -117,15 +152,11 @@ async def generate_lesson_plan(payload: dict = Body(...)):
             "week": week,
             "status": "success"
         }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(500, detail=str(e))
 
-# Update generate_lesson_notes endpoint
-@router.post("/lesson-notes")
-async def generate_notes(payload: dict = Body(...)):
+    return "lesson_plan", context, save
+
+
+async def _prepare_lesson_notes(payload: dict):
     required_fields = ["scheme_of_work_id", "lesson_plan_id", "week"]
     if any(field not in payload for field in required_fields):
         raise HTTPException(400, detail="Missing required fields in payload")
@@ -133,36 +164,30 @@ async def generate_notes(payload: dict = Body(...)):
     scheme_id = payload["scheme_of_work_id"]
     lesson_plan_id = payload["lesson_plan_id"]
     week = payload["week"]
-    
-    try:
-        # Get database records
-        scheme = session_mgr.get_scheme(scheme_id)
-        lesson_plan = session_mgr.get_lesson_plan(lesson_plan_id)
-        
-        if not scheme or not lesson_plan:
-            raise HTTPException(404, detail="Associated content not found")
-
-        # Extract context ID from scheme
-        context_id = scheme.get("context_id")
-        if not context_id:
-            raise HTTPException(400, detail="Scheme is missing context ID")
-
-        # Extract week-specific content
-        scheme_week_content = extract_week_content(scheme.get("content", ""), week)
-        lesson_plan_week_content = extract_week_content(lesson_plan.get("content", ""), week)
-
-        # Generate notes with week-specific content
-        notes_content = generator.generate("lesson_notes", {
-            "subject": payload.get("subject", scheme.get("payload", {}).get("subject", "")),
-            "grade_level": payload.get("grade_level", scheme.get("payload", {}).get("grade_level", "")),
-            "topic": payload.get("topic", scheme.get("payload", {}).get("topic", "")),
-            "week": week,
-            "scheme_context": scheme_week_content,
-            "lesson_plan_context": lesson_plan_week_content
-        })
-        
+
+    # Get database records
+    scheme, lesson_plan = await asyncio.gather(
+        run_blocking("database", session_mgr.get_scheme, scheme_id),
+        run_blocking("database", session_mgr.get_lesson_plan, lesson_plan_id)
+    )
+
+    if not scheme or not lesson_plan:
+        raise HTTPException(404, detail="Associated content not found")
+
+    # Extract context ID from scheme
+    context_id = scheme.get("context_id")
+    if not context_id:
+        raise HTTPException(400, detail="Scheme is missing context ID")
+
+    # Extract week-specific content
+    scheme_week_content = WeekIndex.for_record(scheme).section(scheme.get("content", ""), week)
+    lesson_plan_week_content = WeekIndex.for_record(lesson_plan).section(lesson_plan.get("content", ""), week)
+
+    async def save(notes_content: str) -> dict:
         # Store in database with context_id
-        notes_id = session_mgr.create_lesson_notes(
+        notes_id = await run_blocking(
+            "database",
+            session_mgr.create_lesson_notes,
             scheme_id,
             lesson_plan_id,
             {
@@ -175,7 +200,7 @@ async def generate_notes(payload: dict = Body(...)):
                 "context_id": context_id  # Add context ID to lesson notes
             }
         )
-        
+
         return {
             "scheme_of_work_id": scheme_id,
             "lesson_plan_id": lesson_plan_id,
@@ -185,6 +210,261 @@ async def generate_notes(payload: dict = Body(...)):
             "week": week,
             "status": "success"
         }
-        
+
+    # Generate notes with week-specific content
+    return "lesson_notes", {
+        "subject": payload.get("subject", scheme.get("payload", {}).get("subject", "")),
+        "grade_level": payload.get("grade_level", scheme.get("payload", {}).get("grade_level", "")),
+        "topic": payload.get("topic", scheme.get("payload", {}).get("topic", "")),
+        "week": week,
+        "scheme_context": scheme_week_content,
+        "lesson_plan_context": lesson_plan_week_content
+    }, save
+
+
+async def _prepare(prepare, payload: dict, error_prefix: str = ""):
+    try:
+        # In STARTUP_MODE=lazy the first request creates these; keep that off the event loop too
+        await asyncio.gather(generator.aget(), session_mgr.aget())
+        return await prepare(payload)
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(500, detail=f"Generation failed: {str(e)}")
\ No newline at end of file
+        raise HTTPException(500, detail=f"{error_prefix}{str(e)}")
+
+
+async def _generate(prepare, payload: dict, error_prefix: str = "") -> dict:
+    # Per-request opt-out of the generation cache; popped so it is not stored with the content
+    bypass_cache = bool(payload.pop("bypass_cache", False))
+    content_type, context, save = await _prepare(prepare, payload, error_prefix)
+    try:
+        cache_info = {}
+        content = await generator.agenerate(content_type, context, bypass_cache=bypass_cache, cache_info=cache_info)
+        return {**(await save(content)), "generation_cached": cache_info.get("cached", False)}
+    except Exception as e:
+        raise HTTPException(500, detail=f"{error_prefix}{str(e)}")
+
+
+@router.post("/scheme-of-work")
+async def generate_scheme(payload: dict = Body(...)):
+    return await _generate(_prepare_scheme, payload)
+
+
+@router.post("/lesson-plan")
+async def generate_lesson_plan(payload: dict = Body(...)):
+    return await _generate(_prepare_lesson_plan, payload)
+
+
+@router.post("/lesson-notes")
+async def generate_notes(payload: dict = Body(...)):
+    return await _generate(_prepare_lesson_notes, payload, "Generation failed: ")
+
+
+@router.post("/lesson-plans/batch")
+async def generate_lesson_plans_batch(payload: dict = Body(...)):
+    """Generates every week's lesson plan for a scheme concurrently; poll status_url for per-week progress.
+
+    Optional fields: weeks (subset of the scheme's weeks), concurrency (capped by
+    LESSON_PLAN_BATCH_MAX_CONCURRENCY), limitations and bypass_cache.
+    """
+    scheme_id = payload.get("scheme_of_work_id")
+    bypass_cache = bool(payload.get("bypass_cache", False))
+    limitations = payload.get("limitations", "")
+    try:
+        concurrency = batch_concurrency(int(payload["concurrency"]) if payload.get("concurrency") else None)
+    except (TypeError, ValueError):
+        raise HTTPException(400, detail="concurrency must be a positive integer")
+
+    scheme_data = await _prepare(_load_scheme_for_lesson_plans, scheme_id)
+    context_id = scheme_data["context_id"]
+
+    # Discover the weeks once from the index stored with the scheme
+    week_index = WeekIndex.for_record(scheme_data)
+    weeks = week_index.weeks()
+    if payload.get("weeks"):
+        requested = [normalize_week(week) for week in payload["weeks"]]
+        unknown = [week for week in requested if week not in weeks]
+        if unknown:
+            raise HTTPException(400, detail=f"Weeks not found in scheme: {', '.join(unknown)}")
+        weeks = list(dict.fromkeys(requested))
+    if not weeks:
+        raise HTTPException(400, detail="No weeks found in scheme of work")
+
+    contexts = {week: _lesson_plan_context(scheme_data, week_index, week, limitations) for week in weeks}
+
+    async def generate(week: str):
+        cache_info = {}
+        content = await generator.agenerate(
+            "lesson_plan", contexts[week], bypass_cache=bypass_cache, cache_info=cache_info)
+        return content, cache_info.get("cached", False)
+
+    async def persist(generated):
+        # One insert for the whole batch instead of one round trip per week
+        return await run_blocking("database", session_mgr.create_lesson_plans, scheme_id, [
+            _lesson_plan_record(contexts[week], content, context_id) for week, content in generated
+        ])
+
+    job = _batch_manager.submit(LessonPlanBatch(scheme_id, weeks, concurrency), generate, persist)
+    return {
+        "status": "queued",
+        "message": f"{len(weeks)} lesson plans queued for generation",
+        "job_id": job.id,
+        "scheme_of_work_id": scheme_id,
+        "weeks": weeks,
+        "concurrency": concurrency,
+        "status_url": f"/api/content/lesson-plans/batch/{job.id}"
+    }
+
+
+@router.get("/lesson-plans/batch/{job_id}")
+async def get_lesson_plan_batch(job_id: str):
+    job = _batch_manager.get(job_id)
+    if not job:
+        raise HTTPException(404, detail="Job not found")
+    return job.to_dict()
+
+
+@router.get("/lesson-plans/batch")
+async def list_lesson_plan_batches():
+    return {"jobs": _batch_manager.list()}
+
+
+# Time-to-first-token and total stream time of recent streamed generations, per content type
+_stream_latencies = {}
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _stream_events(content_type: str, context: dict, save, started: float, bypass_cache: bool = False):
+    """start, token..., then done (with the saved ids) or error; content is persisted only when complete"""
+    yield _sse("start", {"content_type": content_type})
+    parts = []
+    generation_started = time.perf_counter()
+    first_token_at = None
+    cache_info = {}
+    try:
+        async for text in generator.astream(content_type, context, bypass_cache=bypass_cache, cache_info=cache_info):
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            parts.append(text)
+            yield _sse("token", {"text": text})
+        if not parts:
+            raise ValueError("The model returned no content")
+        result = await save("".join(parts))
+    except Exception as e:
+        yield _sse("error", {"detail": f"Generation failed: {str(e)}"})
+        return
+
+    finished = time.perf_counter()
+    timings = {
+        "time_to_first_token_ms": round((first_token_at - started) * 1000, 1),
+        "model_first_token_ms": round((first_token_at - generation_started) * 1000, 1),
+        "total_ms": round((finished - started) * 1000, 1),
+        "generation_cached": cache_info.get("cached", False)
+    }
+    if not timings["generation_cached"]:
+        # Cache hits would flatter the model's time-to-first-token
+        _stream_latencies.setdefault(content_type, deque(maxlen=500)).append(
+            (timings["time_to_first_token_ms"], timings["total_ms"]))
+    yield _sse("done", {**result, **timings})
+
+
+async def _stream(prepare, payload: dict, error_prefix: str = "") -> StreamingResponse:
+    started = time.perf_counter()
+    bypass_cache = bool(payload.pop("bypass_cache", False))
+    content_type, context, save = await _prepare(prepare, payload, error_prefix)
+    return StreamingResponse(
+        _stream_events(content_type, context, save, started, bypass_cache),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/scheme-of-work/stream")
+async def stream_scheme(payload: dict = Body(...)):
+    """Server-sent events variant of /scheme-of-work"""
+    return await _stream(_prepare_scheme, payload)
+
+
+@router.post("/lesson-plan/stream")
+async def stream_lesson_plan(payload: dict = Body(...)):
+    """Server-sent events variant of /lesson-plan"""
+    return await _stream(_prepare_lesson_plan, payload)
+
+
+@router.post("/lesson-notes/stream")
+async def stream_notes(payload: dict = Body(...)):
+    """Server-sent events variant of /lesson-notes"""
+    return await _stream(_prepare_lesson_notes, payload, "Generation failed: ")
+
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@router.get("/stream-stats")
+async def stream_stats():
+    """Time-to-first-token and total time percentiles over recent streamed generations"""
+    stats = {}
+    for content_type, samples in list(_stream_latencies.items()):
+        ttft = [sample[0] for sample in samples]
+        total = [sample[1] for sample in samples]
+        stats[content_type] = {
+            "streams": len(samples),
+            "time_to_first_token_ms": {"p50": _percentile(ttft, 0.5), "p95": _percentile(ttft, 0.95)},
+            "total_ms": {"p50": _percentile(total, 0.5), "p95": _percentile(total, 0.95)}
+        }
+    return stats
+
+
+@router.get("/retrieval-cache")
+async def retrieval_cache_stats():
+    """Hit/miss counters and size of the shared retrieval cache"""
+    return get_retrieval_cache().stats()
+
+
+@router.delete("/retrieval-cache")
+async def invalidate_retrieval_cache(subject: Optional[str] = None, grade_level: Optional[str] = None):
+    """Drops cached retrievals for a subject and/or grade, or everything when neither is given"""
+    cache = get_retrieval_cache()
+    return {"invalidated": cache.invalidate(subject, grade_level), **cache.stats()}
+
+
+@router.get("/generation-cache")
+async def generation_cache_stats():
+    """Hit rates per tier, sizes and evictions of the generation cache"""
+    cache = get_generation_cache()
+    return cache.stats() if cache is not None else {"enabled": False}
+
+
+@router.delete("/generation-cache")
+async def clear_generation_cache():
+    """Drops every cached completion from memory and disk"""
+    cache = get_generation_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"cleared": await run_blocking("database", cache.clear), **cache.stats()}
+
+
+@router.get("/catalog")
+async def curriculum_catalog():
+    """Full subject -> grade level -> topic tree from predefined_input.yaml"""
+    catalog = get_catalog()
+    catalog.refresh()
+    return {"subjects": catalog.data.get("subjects", []), **catalog.stats()}
+
+
+@router.get("/catalog/suggest")
+async def suggest_catalog_entries(field: str, q: str = "", subject: Optional[str] = None,
+                                  grade_level: Optional[str] = None, limit: int = 10):
+    """Prefix, then fuzzy, matches for a dropdown field; an empty q lists every option in catalog order"""
+    try:
+        suggestions = get_catalog().suggest(field, q, subject, grade_level, max(1, min(limit, 200)))
+    except ValueError as e:
+        raise HTTPException(400, detail=str(e))
+    except KeyError as e:
+        raise HTTPException(404, detail=str(e.args[0]))
+    return {"field": field, "query": q, "suggestions": suggestions}
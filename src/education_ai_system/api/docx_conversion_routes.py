@@ -5,9 +5,11 @@ from src.education_ai_system.utils.file_operations import convert_md_to_docx
 from pathlib import Path
 import os
 from datetime import datetime
-from src.education_ai_system.utils.supabase_manager import SupabaseManager
+from src.education_ai_system.utils.session_manager import SessionManager
+from src.education_ai_system.utils.lazy_resources import lazy_resource
 
 router = APIRouter()
+session_mgr = lazy_resource("session_manager", SessionManager)
 
 def cleanup_files(md_path: Path, docx_path: Path):
     """Cleanup temporary files after response is sent"""
@@ -33,7 +35,7 @@ async def generate_document(
 
     try:
         content = None
-        supabase = SupabaseManager()
+        supabase = session_mgr.supabase
 
         if content_type == "scheme":
             scheme = supabase.get_scheme(scheme_of_work_id)
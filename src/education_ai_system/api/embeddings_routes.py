@@ -1,21 +1,111 @@
-from fastapi import APIRouter, UploadFile, File
+import shutil
+import zipfile
+from collections import Counter
+from pathlib import Path
+from typing import List
+from fastapi import APIRouter, UploadFile, File, HTTPException
+from starlette.concurrency import run_in_threadpool
 from src.education_ai_system.services.pinecone_service import VectorizationService
-import os
+from src.education_ai_system.services.ingestion_jobs import IngestionJobManager
+from src.education_ai_system.embeddings.vector_store import vector_store_stats
 
 router = APIRouter()
+_job_manager = None
+
+def get_job_manager() -> IngestionJobManager:
+    """One job manager (and one shared VectorizationService) per process"""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = IngestionJobManager(VectorizationService)
+    return _job_manager
+
+def _spool_upload(file: UploadFile, path):
+    with open(path, "wb") as f:
+        shutil.copyfileobj(file.file, f, length=1024 * 1024)
 
 @router.post("/process_pdf")
 async def process_pdf(file: UploadFile = File(...)):
     try:
-        file_path = f"temp_{file.filename}"
-        with open(file_path, "wb") as f:
-            f.write(await file.read())
-        
-        service = VectorizationService()
-        service.process_and_store_pdf(file_path)
-        
-        os.remove(file_path)
-        
-        return {"status": "success", "message": "PDF processed and stored"}
+        job_manager = get_job_manager()
+        spool_path = job_manager.spool_path(file.filename)
+        # Spool to disk off the event loop, then hand off to the worker pool
+        await run_in_threadpool(_spool_upload, file, spool_path)
+        job = job_manager.submit(file.filename, spool_path)
+
+        return {
+            "status": "queued",
+            "message": "PDF queued for processing",
+            "job_id": job.id,
+            "status_url": f"/api/embeddings/jobs/{job.id}"
+        }
     except Exception as e:
-        return {"status": "error", "message": str(e)}
\ No newline at end of file
+        return {"status": "error", "message": str(e)}
+
+def _spool_bulk_upload(job_manager: IngestionJobManager, file: UploadFile):
+    """Spools one upload; zip archives are expanded into their PDF members"""
+    spool_path = job_manager.spool_path(file.filename)
+    _spool_upload(file, spool_path)
+    if not zipfile.is_zipfile(spool_path):
+        return [(file.filename, spool_path)]
+
+    spooled = []
+    try:
+        with zipfile.ZipFile(spool_path) as archive:
+            for member in archive.infolist():
+                name = Path(member.filename).name
+                if member.is_dir() or not name.lower().endswith(".pdf") or name.startswith("."):
+                    continue
+                member_path = job_manager.spool_path(name)
+                with archive.open(member) as src, open(member_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=1024 * 1024)
+                # The member's full path is its document ID, so p4/maths.pdf and p5/maths.pdf stay distinct
+                spooled.append((f"{file.filename}/{member.filename}", member_path))
+    finally:
+        spool_path.unlink(missing_ok=True)
+    return spooled
+
+@router.post("/process_pdfs")
+async def process_pdfs(files: List[UploadFile] = File(...)):
+    """Bulk ingestion: many PDFs and/or zip archives of PDFs in one request, one shared pipeline"""
+    try:
+        job_manager = get_job_manager()
+        spooled = []
+        for file in files:
+            spooled.extend(await run_in_threadpool(_spool_bulk_upload, job_manager, file))
+        if not spooled:
+            raise HTTPException(400, detail="No PDF files found in upload")
+        # Names become document IDs; a repeated one would mark the earlier file's chunks stale
+        duplicates = sorted(name for name, count in Counter(name for name, _ in spooled).items() if count > 1)
+        if duplicates:
+            for _, path in spooled:
+                path.unlink(missing_ok=True)
+            raise HTTPException(400, detail=f"Duplicate file names in upload: {', '.join(duplicates)}")
+        job = job_manager.submit_bulk(spooled)
+
+        return {
+            "status": "queued",
+            "message": f"{len(spooled)} PDFs queued for processing",
+            "job_id": job.id,
+            "files": [name for name, _ in spooled],
+            "status_url": f"/api/embeddings/jobs/{job.id}"
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = get_job_manager().get(job_id)
+    if not job:
+        raise HTTPException(404, detail="Job not found")
+    return job.to_dict()
+
+@router.get("/jobs")
+async def list_jobs():
+    return {"jobs": get_job_manager().list()}
+
+@router.get("/vector-store/stats")
+async def get_vector_store_stats():
+    """Shared index handles, control-plane calls and connection-pool usage"""
+    return vector_store_stats()
@@ -1,30 +1,40 @@
 from fastapi import APIRouter, Body, HTTPException
-from src.education_ai_system.services.evaluation_service import ContentEvaluator
 from src.education_ai_system.utils.session_manager import SessionManager
+from src.education_ai_system.utils.lazy_resources import lazy_resource
+from src.education_ai_system.utils.executors import run_blocking
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("SupabaseManager")
-session_mgr = SessionManager()
 router = APIRouter()
-evaluator = ContentEvaluator()
+
+
+def _content_evaluator():
+    # Deferred so importing the routes does not load langchain or build the Groq client
+    from src.education_ai_system.services.evaluation_service import ContentEvaluator
+    return ContentEvaluator(supabase=session_mgr.supabase)
+
+
+session_mgr = lazy_resource("session_manager", SessionManager)
+evaluator = lazy_resource("content_evaluator", _content_evaluator)
 
 # Update evaluate_scheme to use context_id
 @router.post("/scheme")
 async def evaluate_scheme(context_id: str = Body(..., embed=True)):
     try:
         # First ensure context exists
-        context_data = session_mgr.supabase.get_context_by_id(context_id)
+        supabase = (await session_mgr.aget()).supabase
+        context_data = await run_blocking("database", supabase.get_context_by_id, context_id)
         if not context_data:
             raise HTTPException(404, detail="Context not found")
         
-        scheme = session_mgr.supabase.get_scheme_by_context(context_id)
+        scheme = await run_blocking("database", supabase.get_scheme_by_context, context_id)
         if not scheme:
             raise HTTPException(404, detail="Associated scheme not found")
         
         print(f"\n[EVALUATION REQUEST] Scheme with context ID: {context_id}")
-        result = evaluator.evaluate_content_by_context("scheme_of_work", context_id)
+        result = await (await evaluator.aget()).aevaluate_content_by_context("scheme_of_work", context_id)
         
         # Add debug information to error responses
         if result.get('status') == 'error':
@@ -46,7 +56,8 @@ async def evaluate_scheme(context_id: str = Body(..., embed=True)):
 async def evaluate_lesson_plan(lesson_plan_id: str = Body(..., embed=True)):  # Change to lesson_plan_id
     try:
         # Get lesson plan using ID
-        lesson_plan = session_mgr.supabase.get_lesson_plan(lesson_plan_id)
+        supabase = (await session_mgr.aget()).supabase
+        lesson_plan = await run_blocking("database", supabase.get_lesson_plan, lesson_plan_id)
         if not lesson_plan:
             raise HTTPException(404, detail="Lesson plan not found")
         
@@ -55,7 +66,7 @@ async def evaluate_lesson_plan(lesson_plan_id: str = Body(..., embed=True)):  #
         if not context_id:
             raise HTTPException(400, detail="No context associated with lesson plan")
             
-        result = evaluator.evaluate_content_by_context("lesson_plan", context_id)
+        result = await (await evaluator.aget()).aevaluate_content_by_context("lesson_plan", context_id)
         return result
     except Exception as e:
         return {
@@ -70,7 +81,8 @@ async def evaluate_lesson_notes(lesson_notes_id: str = Body(..., embed=True)):
     try:
         logger.info(f"Starting evaluation for lesson_notes_id: {lesson_notes_id}")
         
-        lesson_notes = session_mgr.supabase.get_lesson_notes(lesson_notes_id)
+        supabase = (await session_mgr.aget()).supabase
+        lesson_notes = await run_blocking("database", supabase.get_lesson_notes, lesson_notes_id)
         if not lesson_notes:
             logger.error(f"Lesson notes not found: {lesson_notes_id}")
             raise HTTPException(404, detail="Lesson notes not found")
@@ -78,7 +90,7 @@ async def evaluate_lesson_notes(lesson_notes_id: str = Body(..., embed=True)):
         scheme_id = lesson_notes.get("scheme_id")
         logger.info(f"Found associated scheme_id: {scheme_id}")
         
-        scheme = session_mgr.supabase.get_scheme(scheme_id)
+        scheme = await run_blocking("database", supabase.get_scheme, scheme_id)
         if not scheme:
             logger.error(f"Scheme not found: {scheme_id}")
             raise HTTPException(404, detail="Associated scheme not found")
@@ -91,7 +103,7 @@ async def evaluate_lesson_notes(lesson_notes_id: str = Body(..., embed=True)):
             raise HTTPException(400, detail="No context found for scheme")
         
         logger.info(f"Starting evaluation for context_id: {context_id}")
-        result = evaluator.evaluate_content_by_context("lesson_notes", context_id)
+        result = await (await evaluator.aget()).aevaluate_content_by_context("lesson_notes", context_id)
         
         logger.info(f"Evaluation completed: {result.get('status')}")
         return result
@@ -1,8 +1,173 @@
 # src/project_name/data_processing/metadata_extractor.py
 
 import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
 
-def extract_metadata(chunk):
-    subject = re.search(r"(Mathematics|Civic Education|Science|English)", chunk, re.IGNORECASE)
-    grade_level = re.search(r"(Primary [One|Two|Three|Four|Five|Six])", chunk, re.IGNORECASE)
-    return subject.group(0) if subject else "Unknown Subject", grade_level.group(0) if grade_level else "Unknown Grade Level"
\ No newline at end of file
+from src.education_ai_system.utils.validators import load_predefined_inputs
+
+UNKNOWN_SUBJECT = "Unknown Subject"
+UNKNOWN_GRADE = "Unknown Grade Level"
+
+GRADE_NUMBERS = {"One": "1", "Two": "2", "Three": "3", "Four": "4", "Five": "5", "Six": "6"}
+
+# Extra spellings seen in curriculum PDFs for catalog names
+ALIASES = {
+    "English Languauge": ["English Language"],
+    "Igbo Languauge": ["Igbo Language"],
+    "Information Technology (IT)": ["Information Technology", "Computer Studies"],
+}
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class ChunkTags(NamedTuple):
+    subject: str
+    grade_level: str
+    topics: List[str]
+
+
+class CurriculumTagger:
+    """Tags chunks with subject, grade level and topics from predefined_input.yaml"""
+
+    def __init__(self, predefined_inputs: Dict = None):
+        predefined_inputs = predefined_inputs or load_predefined_inputs()
+        # normalised spelling -> (kind, canonical name)
+        self.patterns: Dict[str, Tuple[str, str]] = {}
+        # topic -> {(subject, grade)} so topics can vote when a chunk never names its subject
+        self.topic_owners: Dict[str, set] = {}
+        for subject in predefined_inputs.get("subjects", []):
+            self._add("subject", subject["name"])
+            for grade in subject.get("grade_levels", []):
+                self._add("grade", grade["name"])
+                for topic in grade.get("topics", []):
+                    self._add("topic", topic)
+                    self.topic_owners.setdefault(topic, set()).add((subject["name"], grade["name"]))
+        self.matcher = self._compile(self.patterns)
+
+    def _add(self, kind: str, name: str):
+        spellings = [name] + ALIASES.get(name, [])
+        if kind == "grade":
+            prefix, _, number = name.rpartition(" ")
+            if number in GRADE_NUMBERS:
+                spellings.append(f"{prefix} {GRADE_NUMBERS[number]}")
+        for spelling in spellings:
+            self.patterns.setdefault(_normalize(spelling), (kind, name))
+
+    @staticmethod
+    def _compile(patterns):
+        """Compiles every catalog name into one prefix-trie regex, once.
+
+        Names sharing leading words share a branch ("primary one|two|...",
+        "basic science|technology"), so the engine walks a trie instead of
+        retrying each name at every position. Optional tails are greedy, so
+        the longest name wins, and words may be split by line breaks or
+        repeated spaces as they are in extracted PDF text.
+        """
+        trie = {}
+        for name in patterns:
+            node = trie
+            for word in name.split():
+                node = node.setdefault(word, {})
+            node[""] = {}
+
+        def to_regex(node):
+            branches = []
+            for word, child in sorted(node.items()):
+                if not word:
+                    continue
+                rest = {key: value for key, value in child.items() if key}
+                piece = re.escape(word)
+                if rest:
+                    # Optional when a shorter name ends here, greedy so the longer one wins
+                    piece += r"(?:\s+" + to_regex(rest) + ")" + ("?" if "" in child else "")
+                branches.append(piece)
+            return "(?:" + "|".join(branches) + ")"
+
+        return re.compile(rf"(?<!\w){to_regex(trie)}(?!\w)", re.IGNORECASE)
+
+    def mentions(self, text: str) -> Dict[str, Counter]:
+        """Subject, grade and topic mention counts from a single scan of the precompiled matcher"""
+        counts = {"subject": Counter(), "grade": Counter(), "topic": Counter()}
+        patterns = self.patterns
+        for match in self.matcher.finditer(text):
+            kind, name = patterns[_normalize(match.group(0))]
+            counts[kind][name] += 1
+        return counts
+
+    def tag(self, text: str) -> ChunkTags:
+        """Tags a chunk in a single scan of the precompiled matcher"""
+        return self._resolve(self.mentions(text))
+
+    def tag_document(self, chunk_mentions: Iterable[Dict[str, Counter]]) -> ChunkTags:
+        """Tags a document from the summed mentions of some of its text, e.g. its title pages"""
+        totals = {"subject": Counter(), "grade": Counter(), "topic": Counter()}
+        for counts in chunk_mentions:
+            for kind, counter in counts.items():
+                totals[kind].update(counter)
+        return self._resolve(totals)
+
+    def tag_in_document(self, counts: Dict[str, Counter], document: ChunkTags) -> ChunkTags:
+        """Chunk tags carrying the document's subject and grade, keeping the chunk's own where the document has none.
+
+        Most chunk windows never name their subject or grade; tagged on their
+        own they would land in the unassigned namespace or under an unknown grade.
+        """
+        own = self._resolve(counts)
+        return ChunkTags(
+            document.subject if document.subject != UNKNOWN_SUBJECT else own.subject,
+            document.grade_level if document.grade_level != UNKNOWN_GRADE else own.grade_level,
+            own.topics
+        )
+
+    def _resolve(self, counts) -> ChunkTags:
+        topics = [name for name, _ in counts["topic"].most_common()]
+        subject = self._most_common(counts["subject"])
+        grade = self._most_common(counts["grade"])
+        # Let topic mentions vote for a subject/grade the chunk never names
+        if subject is None:
+            votes = Counter()
+            for topic, hits in counts["topic"].items():
+                for owner_subject in {s for s, _ in self.topic_owners[topic]}:
+                    votes[owner_subject] += hits
+            subject = self._most_common(votes)
+        if grade is None and subject is not None:
+            votes = Counter()
+            for topic, hits in counts["topic"].items():
+                for owner_subject, owner_grade in self.topic_owners[topic]:
+                    if owner_subject == subject:
+                        votes[owner_grade] += hits
+            grade = self._most_common(votes)
+        return ChunkTags(subject or UNKNOWN_SUBJECT, grade or UNKNOWN_GRADE, topics)
+
+    @staticmethod
+    def _most_common(counter: Counter) -> Optional[str]:
+        if not counter:
+            return None
+        (best, best_count), *rest = counter.most_common(2)
+        # A tie carries no signal
+        if rest and rest[0][1] == best_count:
+            return None
+        return best
+
+
+_tagger: Optional[CurriculumTagger] = None
+_tagger_lock = threading.Lock()
+
+
+def get_tagger() -> CurriculumTagger:
+    """Compiles the catalog automaton once per process"""
+    global _tagger
+    if _tagger is None:
+        with _tagger_lock:
+            if _tagger is None:
+                _tagger = CurriculumTagger()
+    return _tagger
+
+
+def extract_metadata(chunk) -> ChunkTags:
+    """Returns (subject, grade_level, topics); meta[0]/meta[1] match the old (subject, grade) pair"""
+    return get_tagger().tag(chunk)
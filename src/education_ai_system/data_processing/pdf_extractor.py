@@ -1,14 +1,79 @@
 # src/project_name/data_processing/pdf_extractor.py
 
-import pdfplumber
-import pandas as pd
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+def _default_workers():
+    return int(os.getenv("PDF_EXTRACT_WORKERS", "1"))
+
+def _extract_page(page, include_tables):
+    text = page.extract_text() or ""
+    tables = page.extract_tables() if include_tables else []
+    page.flush_cache()
+    return text, tables
+
+def _extract_page_range(pdf_path, start, stop, include_tables):
+    """Worker entry point: extracts pages [start, stop) from its own file handle"""
+    import pdfplumber
+
+    results = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for index in range(start, stop):
+            text, tables = _extract_page(pdf.pages[index], include_tables)
+            results.append((index + 1, text, tables))
+    return results
+
+def count_pages(pdf_path):
+    import pdfplumber
 
-def extract_text_and_tables(pdf_path):
-    extracted_text = ""
-    tables = []
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            extracted_text += page.extract_text() or ""
-            for table in page.extract_tables():
-                tables.append(pd.DataFrame(table[1:], columns=table[0]))
-    return extracted_text, tables
\ No newline at end of file
+        return len(pdf.pages)
+
+def iter_pages(pdf_path, include_tables=False, workers=None, shard_size=None):
+    """Yields (page_number, text, tables) in page order.
+
+    With workers == 1 pages are read one at a time in-process, so memory stays
+    bounded by a single page. With more workers, page ranges are sharded across
+    a process pool; shards are still yielded in page order, and at most
+    two shards per worker are in flight at once.
+    """
+    import pdfplumber
+
+    workers = workers or _default_workers()
+    ranges = []
+    if workers > 1:
+        total = count_pages(pdf_path)
+        shard_size = shard_size or max(1, min(25, -(-total // workers)))
+        ranges = [(start, min(start + shard_size, total)) for start in range(0, total, shard_size)]
+    if len(ranges) <= 1:
+        # One shard gains nothing from a pool but would still pay its startup
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_number, page in enumerate(pdf.pages, start=1):
+                text, tables = _extract_page(page, include_tables)
+                yield page_number, text, tables
+        return
+
+    # Spawned, not forked: the API process runs threads (torch, executors) that a fork could deadlock on
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pending = []
+        next_range = 0
+        # Keep a bounded number of shards in flight and drain them in order
+        while next_range < len(ranges) or pending:
+            while next_range < len(ranges) and len(pending) < workers * 2:
+                start, stop = ranges[next_range]
+                pending.append(pool.submit(_extract_page_range, pdf_path, start, stop, include_tables))
+                next_range += 1
+            for page in pending.pop(0).result():
+                yield page
+
+def extract_text_and_tables(pdf_path, include_tables=True, workers=None):
+    import pandas as pd
+
+    texts = []
+    tables = []
+    for _, text, page_tables in iter_pages(pdf_path, include_tables=include_tables, workers=workers):
+        texts.append(text)
+        for table in page_tables:
+            tables.append(pd.DataFrame(table[1:], columns=table[0]))
+    return "".join(texts), tables
@@ -1,8 +1,98 @@
 # src/project_name/data_processing/text_chunker.py
 
+from typing import List, NamedTuple
+
 def split_text_into_chunks(text, chunk_size=512, overlap=20):
     words = text.split()
     chunks = []
     for i in range(0, len(words), chunk_size - overlap):
         chunks.append(' '.join(words[i:i + chunk_size]))
     return chunks
+
+def iter_chunks(texts, chunk_size=512, overlap=20):
+    """Streaming version of split_text_into_chunks over an iterable of texts (e.g. pages).
+
+    Only the current window of words is kept in memory; chunks are yielded
+    as soon as enough words have arrived.
+    """
+    step = chunk_size - overlap
+    buffer = []
+    for text in texts:
+        buffer.extend(text.split())
+        while len(buffer) >= chunk_size:
+            yield ' '.join(buffer[:chunk_size])
+            buffer = buffer[step:]
+    while buffer:
+        yield ' '.join(buffer[:chunk_size])
+        buffer = buffer[step:]
+
+class TokenChunk(NamedTuple):
+    text: str
+    token_ids: List[int]
+
+SENTENCE_ENDINGS = (".", "!", "?", ":", ";")
+
+def _boundary_score(text, end, next_start):
+    """Scores a cut after a token ending at ``end``: 2 = heading/paragraph, 1 = sentence, 0 = none"""
+    if "\n" in text[end:next_start]:
+        return 2
+    if text[end - 1:end] in SENTENCE_ENDINGS:
+        return 1
+    return 0
+
+def iter_token_chunks(texts, tokenize, max_tokens=254, overlap=0, snap_tokens=48):
+    """Token-exact chunking driven by the embedder's own tokenizer.
+
+    ``tokenize`` maps text to (token_ids, char_offsets) without special tokens,
+    e.g. EmbeddingService.tokenize_with_offsets. Each text is tokenized once;
+    every chunk holds at most ``max_tokens`` word-pieces, so nothing is cut off
+    by the model's truncation and, with ``overlap=0``, every token is embedded
+    exactly once. Cuts snap back to the last paragraph/heading or sentence
+    boundary within the final ``snap_tokens`` tokens of a window.
+    """
+    if overlap >= max_tokens:
+        raise ValueError("overlap must be smaller than max_tokens")
+    buffer_text = ""
+    ids, starts, ends = [], [], []
+    fresh = 0  # tokens at the tail of the buffer that no chunk has covered yet
+
+    def cut_point():
+        limit = max_tokens
+        best, best_score = limit, 0
+        for cut in range(limit, max(limit - snap_tokens, overlap + 1) - 1, -1):
+            next_start = starts[cut] if cut < len(ids) else len(buffer_text)
+            score = _boundary_score(buffer_text, ends[cut - 1], next_start)
+            if score > best_score:
+                best, best_score = cut, score
+                if score == 2:
+                    break
+        return best
+
+    def emit(cut):
+        nonlocal buffer_text, ids, starts, ends, fresh
+        fresh = len(ids) - cut
+        chunk = TokenChunk(buffer_text[starts[0]:ends[cut - 1]].strip(), ids[:cut])
+        keep = max(cut - overlap, 0)
+        shift = starts[keep] if keep < len(ids) else len(buffer_text)
+        buffer_text = buffer_text[shift:]
+        ids = ids[keep:]
+        starts = [s - shift for s in starts[keep:]]
+        ends = [e - shift for e in ends[keep:]]
+        return chunk
+
+    for text in texts:
+        if not text.strip():
+            continue
+        base = len(buffer_text) + 1 if buffer_text else 0
+        buffer_text = f"{buffer_text}\n{text}" if buffer_text else text
+        page_ids, offsets = tokenize(text)
+        ids.extend(page_ids)
+        starts.extend(base + start for start, _ in offsets)
+        ends.extend(base + end for _, end in offsets)
+        fresh += len(page_ids)
+        # Hold one extra token so the boundary after a full window can be inspected
+        while len(ids) > max_tokens:
+            yield emit(cut_point())
+
+    if fresh:
+        yield emit(len(ids))
@@ -0,0 +1,104 @@
+# src/education_ai_system/embeddings/chunk_manifest.py
+"""Local record of which chunk IDs each ingested document has in the index.
+
+Vector IDs are content hashes, so the same chunk always maps to the same ID
+in every process. Comparing a re-upload against the manifest tells the
+pipeline which chunks are new (embed + upsert), unchanged (skip) and gone
+(delete, unless another document still references the same content in the
+same namespace).
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+# A vector is identified by its content-hash ID and the namespace it lives in
+ChunkKey = Tuple[str, str]
+
+
+def chunk_id(text: str) -> str:
+    """Stable, content-addressed vector ID for a chunk"""
+    return "chunk-" + hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+class ChunkManifest:
+    def __init__(self, path: str = None):
+        self.path = Path(path or os.getenv("INGEST_MANIFEST_PATH", "ingest_manifest.json"))
+        self._lock = threading.RLock()
+        self._documents: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self):
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._documents = json.load(f).get("documents", {})
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"documents": self._documents}, f)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _entry_keys(entry: Dict) -> Set[ChunkKey]:
+        keys = {(cid, namespace) for cid, namespace in entry.get("chunks", [])}
+        # Manifests written before namespaces existed only list IDs in the default namespace
+        keys.update((cid, "") for cid in entry.get("chunk_ids", []))
+        return keys
+
+    def document_keys(self, document_id: str) -> Set[ChunkKey]:
+        """(chunk ID, namespace) pairs currently indexed for a document"""
+        with self._lock:
+            return self._entry_keys(self._documents.get(document_id, {}))
+
+    def indexed_keys(self) -> Set[ChunkKey]:
+        """(chunk ID, namespace) pairs indexed for any document"""
+        with self._lock:
+            keys = set()
+            for entry in self._documents.values():
+                keys.update(self._entry_keys(entry))
+            return keys
+
+    def replace_document(self, document_id: str, keys: Iterable[ChunkKey]) -> List[ChunkKey]:
+        """Records a document's new chunk set and returns keys no document references any more"""
+        with self._lock:
+            old_keys = self.document_keys(document_id)
+            new_keys = list(dict.fromkeys(tuple(key) for key in keys))
+            self._documents[document_id] = {
+                "chunks": [list(key) for key in new_keys],
+                "updated_at": datetime.now().isoformat()
+            }
+            still_referenced = self.indexed_keys()
+            self._save()
+            return sorted(old_keys - still_referenced)
+
+    def add_keys(self, document_id: str, keys: Iterable[ChunkKey]):
+        """Adds keys to a document's record without dropping the ones it already has.
+
+        Used when a document fails partway through ingestion: the chunks it did
+        upsert stay tracked, so the next successful run or removal can delete them.
+        """
+        with self._lock:
+            entry = self._documents.get(document_id, {})
+            merged = list(dict.fromkeys([tuple(key) for key in entry.get("chunks", [])] +
+                                        [tuple(key) for key in keys]))
+            self._documents[document_id] = {
+                **entry,
+                "chunks": [list(key) for key in merged],
+                "updated_at": datetime.now().isoformat()
+            }
+            self._save()
+
+    def remove_document(self, document_id: str) -> List[ChunkKey]:
+        """Forgets a document and returns the keys that can be deleted from the index"""
+        with self._lock:
+            old_keys = self.document_keys(document_id)
+            self._documents.pop(document_id, None)
+            still_referenced = self.indexed_keys()
+            self._save()
+            return sorted(old_keys - still_referenced)
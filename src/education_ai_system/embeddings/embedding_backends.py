@@ -0,0 +1,151 @@
+# src/education_ai_system/embeddings/embedding_backends.py
+"""Inference backends for the MiniLM sentence encoder.
+
+Both backends share the Hugging Face tokenizer and attention-mask mean
+pooling, so they produce vectors for the same 384-dim cosine index:
+
+- "torch": full-precision PyTorch (default)
+- "onnx":  ONNX Runtime on CPU with an int8 dynamically quantized export
+
+Export and quantize the ONNX model ahead of deployment with:
+    python -m src.education_ai_system.embeddings.embedding_backends
+"""
+
+import inspect
+import os
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+DEFAULT_ONNX_DIR = Path.home() / ".cache" / "education_ai_system" / "onnx"
+
+
+def load_tokenizer(model_name: str):
+    # transformers is imported on first use so importing the API does not pay for it
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(model_name)
+
+
+def mean_pool(hidden: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """Averages token vectors over real tokens only so padding does not dilute shorter texts"""
+    mask = attention_mask[..., None].astype(hidden.dtype)
+    summed = (hidden * mask).sum(axis=1)
+    counts = np.clip(mask.sum(axis=1), 1e-9, None)
+    return (summed / counts).astype(np.float32, copy=False)
+
+
+class TorchBackend:
+    """Full-precision PyTorch encoder"""
+    name = "torch"
+
+    def __init__(self, model_name: str):
+        import torch
+        from transformers import AutoModel
+
+        self._torch = torch
+        self.model_name = model_name
+        self.tokenizer = load_tokenizer(model_name)
+        self.model = AutoModel.from_pretrained(model_name)
+        self.model.eval()
+
+    def embed_batch(self, encoded: Dict[str, np.ndarray]) -> np.ndarray:
+        torch = self._torch
+        inputs = {key: torch.from_numpy(value) for key, value in encoded.items()}
+        with torch.inference_mode():
+            hidden = self.model(**inputs).last_hidden_state.cpu().numpy()
+        return mean_pool(hidden, encoded["attention_mask"])
+
+
+class OnnxBackend:
+    """int8-quantized ONNX Runtime encoder for CPU-only pods"""
+    name = "onnx"
+
+    def __init__(self, model_name: str, model_dir: Path = None):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise RuntimeError("The onnx embedding backend requires the 'onnxruntime' package") from e
+
+        self.model_name = model_name
+        self.model_dir = Path(model_dir or os.getenv("ONNX_MODEL_DIR", DEFAULT_ONNX_DIR))
+        self.tokenizer = load_tokenizer(model_name)
+        model_path = quantized_model_path(model_name, self.model_dir)
+        if not model_path.exists():
+            export_quantized_model(model_name, self.model_dir)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        threads = int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(str(model_path), options, providers=["CPUExecutionProvider"])
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def embed_batch(self, encoded: Dict[str, np.ndarray]) -> np.ndarray:
+        feeds = {key: value.astype(np.int64) for key, value in encoded.items() if key in self._input_names}
+        hidden = self.session.run(["last_hidden_state"], feeds)[0]
+        return mean_pool(hidden, encoded["attention_mask"])
+
+
+def quantized_model_path(model_name: str, model_dir: Path) -> Path:
+    return Path(model_dir) / model_name.replace("/", "__") / "model.int8.onnx"
+
+
+def export_quantized_model(model_name: str, model_dir: Path = None) -> Path:
+    """Exports the encoder to ONNX and applies int8 dynamic quantization"""
+    import torch
+    from transformers import AutoModel
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    model_dir = Path(model_dir or os.getenv("ONNX_MODEL_DIR", DEFAULT_ONNX_DIR))
+    target = quantized_model_path(model_name, model_dir)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fp32_path = target.with_name("model.fp32.onnx")
+
+    tokenizer = load_tokenizer(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    # Positional export args bind by forward()'s parameter order, not the tokenizer's key order
+    # (BERT tokenizers emit token_type_ids before attention_mask), so order them to match
+    forward_params = inspect.signature(model.forward).parameters
+    input_names = [name for name in forward_params if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    with torch.inference_mode():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14
+        )
+    quantize_dynamic(str(fp32_path), str(target), weight_type=QuantType.QInt8)
+    fp32_path.unlink(missing_ok=True)
+    print(f"Exported int8 ONNX model for '{model_name}' to {target}")
+    return target
+
+
+BACKENDS = {
+    TorchBackend.name: TorchBackend,
+    OnnxBackend.name: OnnxBackend
+}
+
+
+def create_backend(name: str, model_name: str):
+    try:
+        backend_cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown embedding backend '{name}'. Choose one of: {', '.join(BACKENDS)}")
+    return backend_cls(model_name)
+
+
+if __name__ == "__main__":
+    from src.education_ai_system.embeddings.embedding_service import DEFAULT_MODEL_NAME
+
+    export_quantized_model(os.getenv("EMBEDDING_MODEL_NAME", DEFAULT_MODEL_NAME))
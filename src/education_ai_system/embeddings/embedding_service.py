@@ -0,0 +1,150 @@
+# src/education_ai_system/embeddings/embedding_service.py
+
+import os
+import threading
+import time
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from src.education_ai_system.embeddings.embedding_backends import create_backend
+
+DEFAULT_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_BACKEND = "torch"
+EMBEDDING_DIMENSION = 384
+# all-MiniLM-L6-v2 was trained with a 256 word-piece window (including [CLS]/[SEP])
+DEFAULT_MAX_TOKENS = 256
+
+
+class EmbeddingService:
+    """Lazily loaded MiniLM encoder shared by retrieval and ingestion"""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME, backend: str = DEFAULT_BACKEND,
+                 batch_size: int = None):
+        self.model_name = model_name
+        self.backend_name = backend
+        self.batch_size = batch_size or int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+        self.max_tokens = int(os.getenv("EMBEDDING_MAX_TOKENS", str(DEFAULT_MAX_TOKENS)))
+        self._backend = None
+        self._load_lock = threading.Lock()
+        # Fast tokenizers are not safe to call from several threads at once
+        self._tokenizer_lock = threading.Lock()
+        self.load_seconds = None
+        self.calls = 0
+        self.texts_embedded = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._backend is not None
+
+    def _ensure_loaded(self):
+        if self._backend is not None:
+            return
+        with self._load_lock:
+            if self._backend is not None:
+                return
+            start = time.perf_counter()
+            backend = create_backend(self.backend_name, self.model_name)
+            self._backend = backend
+            self.load_seconds = time.perf_counter() - start
+            print(f"Loaded embedding model '{self.model_name}' ({self.backend_name}) in {self.load_seconds:.2f}s")
+
+    @property
+    def backend(self):
+        self._ensure_loaded()
+        return self._backend
+
+    @property
+    def tokenizer(self):
+        return self.backend.tokenizer
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        backend = self.backend
+        with self._tokenizer_lock:
+            encoded = dict(backend.tokenizer(texts, return_tensors="np", padding=True, truncation=True,
+                                             max_length=self.max_tokens))
+        return backend.embed_batch(encoded)
+
+    @property
+    def content_tokens(self) -> int:
+        """Word-pieces available per text once [CLS] and [SEP] are added"""
+        return self.max_tokens - self.tokenizer.num_special_tokens_to_add()
+
+    def tokenize_with_offsets(self, text: str) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """Tokenizes text without special tokens or truncation, returning ids and char offsets"""
+        tokenizer = self.tokenizer
+        with self._tokenizer_lock:
+            encoded = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True,
+                                truncation=False, verbose=False)
+        return encoded["input_ids"], encoded["offset_mapping"]
+
+    def _encode_token_ids(self, token_ids: List[List[int]]) -> Dict[str, np.ndarray]:
+        tokenizer = self.tokenizer
+        sequences = [tokenizer.build_inputs_with_special_tokens(ids[:self.content_tokens]) for ids in token_ids]
+        width = max(len(seq) for seq in sequences)
+        input_ids = np.full((len(sequences), width), tokenizer.pad_token_id, dtype=np.int64)
+        attention_mask = np.zeros((len(sequences), width), dtype=np.int64)
+        for row, seq in enumerate(sequences):
+            input_ids[row, :len(seq)] = seq
+            attention_mask[row, :len(seq)] = 1
+        return {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask,
+            "token_type_ids": np.zeros_like(input_ids)
+        }
+
+    def embed_token_ids(self, token_ids: List[List[int]], batch_size: int = None) -> np.ndarray:
+        """Embeds already-tokenized texts, skipping a second tokenizer pass"""
+        batch_size = batch_size or self.batch_size
+        if not token_ids:
+            return np.empty((0, EMBEDDING_DIMENSION), dtype=np.float32)
+        backend = self.backend
+        batches = [backend.embed_batch(self._encode_token_ids(token_ids[i:i + batch_size]))
+                   for i in range(0, len(token_ids), batch_size)]
+        self.calls += 1
+        self.texts_embedded += len(token_ids)
+        return np.vstack(batches).astype(np.float32, copy=False)
+
+    def embed(self, texts: List[str], batch_size: int = None) -> np.ndarray:
+        """Embeds texts in padded batches and returns an (n, 384) float32 array"""
+        batch_size = batch_size or self.batch_size
+        if not texts:
+            return np.empty((0, EMBEDDING_DIMENSION), dtype=np.float32)
+        batches = [self._embed_batch(texts[i:i + batch_size]) for i in range(0, len(texts), batch_size)]
+        self.calls += 1
+        self.texts_embedded += len(texts)
+        return np.vstack(batches).astype(np.float32, copy=False)
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embeds a single query string"""
+        return self.embed([text])[0].tolist()
+
+    def stats(self) -> Dict[str, Union[str, int, float, bool, None]]:
+        return {
+            "model_name": self.model_name,
+            "backend": self.backend_name,
+            "loaded": self.is_loaded,
+            "load_seconds": round(self.load_seconds, 3) if self.load_seconds is not None else None,
+            "calls": self.calls,
+            "texts_embedded": self.texts_embedded
+        }
+
+
+# Process-wide registry so every caller shares one copy of each model/backend
+_registry: Dict[Tuple[str, str], EmbeddingService] = {}
+_registry_lock = threading.Lock()
+
+
+def get_embedding_service(model_name: str = None, backend: str = None) -> EmbeddingService:
+    """Returns the shared EmbeddingService for a model and backend, creating it on first use"""
+    model_name = model_name or os.getenv("EMBEDDING_MODEL_NAME", DEFAULT_MODEL_NAME)
+    backend = backend or os.getenv("EMBEDDING_BACKEND", DEFAULT_BACKEND)
+    key = (model_name, backend)
+    service = _registry.get(key)
+    if service is None:
+        with _registry_lock:
+            service = _registry.get(key)
+            if service is None:
+                service = EmbeddingService(model_name, backend)
+                _registry[key] = service
+    return service
@@ -0,0 +1,124 @@
+# src/education_ai_system/embeddings/hybrid_retrieval.py
+"""Fuses BM25 and dense scores for PineconeRetrievalTool.
+
+RETRIEVAL_MODE selects how a query is answered:
+
+* ``dense`` - vector search only (the original behaviour).
+* ``hybrid`` (default) - a dense query and a BM25 search run side by side;
+  lexical hits the dense query missed are fetched and scored against the
+  query vector, then every candidate is ranked by
+  ``HYBRID_DENSE_WEIGHT * cosine + HYBRID_LEXICAL_WEIGHT * bm25 / max_bm25``.
+* ``lexical_prefilter`` - BM25 picks the candidates and only those are
+  fetched and dense-scored, skipping the vector search; falls back to
+  ``hybrid`` when BM25 finds fewer than top_k chunks.
+
+With an empty lexical index every mode behaves like ``dense``.
+"""
+
+import os
+from typing import Dict, List
+
+import numpy as np
+
+RETRIEVAL_MODES = ("dense", "hybrid", "lexical_prefilter")
+
+
+def retrieval_settings() -> Dict:
+    mode = os.getenv("RETRIEVAL_MODE", "hybrid").lower()
+    if mode not in RETRIEVAL_MODES:
+        raise ValueError(f"Unknown RETRIEVAL_MODE '{mode}'. Expected one of {', '.join(RETRIEVAL_MODES)}")
+    return {
+        "mode": mode,
+        "dense_weight": float(os.getenv("HYBRID_DENSE_WEIGHT", "0.7")),
+        "lexical_weight": float(os.getenv("HYBRID_LEXICAL_WEIGHT", "0.3")),
+        "candidates": int(os.getenv("HYBRID_CANDIDATES", "20"))
+    }
+
+
+def _scope_kwargs(namespace: str, filter: Dict) -> Dict:
+    kwargs = {}
+    if namespace:
+        kwargs["namespace"] = namespace
+    if filter:
+        kwargs["filter"] = filter
+    return kwargs
+
+
+def _fetch(index, ids: List[str], namespace: str) -> Dict[str, Dict]:
+    if not ids:
+        return {}
+    response = index.fetch(ids=ids, namespace=namespace) if namespace else index.fetch(ids=ids)
+    return {cid: {"values": vector["values"], "metadata": vector.get("metadata") or {}}
+            for cid, vector in response["vectors"].items()}
+
+
+def _fuse(vector, dense: List[Dict], lexical: List[Dict], fetched: Dict[str, Dict], top_k: int,
+          settings: Dict) -> List[Dict]:
+    candidates = {match["id"]: {"id": match["id"], "dense_score": float(match["score"]),
+                                "metadata": match.get("metadata") or {}} for match in dense}
+    if fetched:
+        query = np.asarray(vector, dtype=np.float32)
+        query /= np.linalg.norm(query) or 1.0
+        ids = list(fetched)
+        values = np.asarray([fetched[cid]["values"] for cid in ids], dtype=np.float32)
+        values /= np.linalg.norm(values, axis=1, keepdims=True).clip(min=1e-12)
+        for cid, score in zip(ids, values @ query):
+            candidates[cid] = {"id": cid, "dense_score": float(score), "metadata": fetched[cid]["metadata"]}
+
+    top_lexical = max((hit["score"] for hit in lexical), default=0.0) or 1.0
+    lexical_scores = {hit["id"]: hit["score"] / top_lexical for hit in lexical}
+    for cid, candidate in candidates.items():
+        candidate["lexical_score"] = round(lexical_scores.get(cid, 0.0), 4)
+        candidate["score"] = (settings["dense_weight"] * max(candidate["dense_score"], 0.0)
+                              + settings["lexical_weight"] * lexical_scores.get(cid, 0.0))
+    return sorted(candidates.values(), key=lambda candidate: candidate["score"], reverse=True)[:top_k]
+
+
+def _fetch_hits(index, hits: List[Dict]) -> Dict[str, Dict]:
+    by_namespace = {}
+    for hit in hits:
+        by_namespace.setdefault(hit["namespace"], []).append(hit["id"])
+    fetched = {}
+    for namespace, ids in by_namespace.items():
+        fetched.update(_fetch(index, ids, namespace))
+    return fetched
+
+
+def _by_score(matches: List[Dict]) -> List[Dict]:
+    return sorted(matches, key=lambda match: match["score"], reverse=True)
+
+
+def hybrid_query(index, lexical_index, vector: List[float], text: str, top_k: int,
+                 namespace: str = "", filter: Dict = None, settings: Dict = None,
+                 namespaces: List[str] = None) -> Dict:
+    """Returns {"matches": [...], "mode": ...} with Pinecone-shaped matches plus dense/lexical scores.
+
+    ``namespaces`` searches several namespaces as one candidate pool. Every
+    candidate is then scored on one scale: raw cosine, plus BM25 divided by the
+    best BM25 hit across all of them (the lexical index scores every namespace
+    with the same corpus statistics).
+    """
+    settings = settings or retrieval_settings()
+    namespaces = list(namespaces) if namespaces else [namespace]
+    mode = settings["mode"]
+    lexical = []
+    if mode != "dense" and lexical_index is not None and len(lexical_index):
+        for scope in namespaces:
+            lexical.extend({**hit, "namespace": scope}
+                           for hit in lexical_index.search(text, settings["candidates"], scope, filter))
+        lexical = _by_score(lexical)[:settings["candidates"]]
+
+    if mode == "lexical_prefilter" and len(lexical) >= top_k:
+        return {"matches": _fuse(vector, [], lexical, _fetch_hits(index, lexical), top_k, settings), "mode": mode}
+
+    dense_k = top_k if not lexical else max(top_k, settings["candidates"])
+    dense = []
+    for scope in namespaces:
+        response = index.query(vector=vector, top_k=dense_k, include_metadata=True, **_scope_kwargs(scope, filter))
+        dense.extend(response.get("matches", []))
+    if not lexical:
+        return {"matches": _by_score(dense)[:top_k], "mode": "dense"}
+
+    dense_ids = {match["id"] for match in dense}
+    fetched = _fetch_hits(index, [hit for hit in lexical if hit["id"] not in dense_ids])
+    return {"matches": _fuse(vector, dense, lexical, fetched, top_k, settings), "mode": "hybrid"}
@@ -0,0 +1,187 @@
+# src/education_ai_system/embeddings/ivf_index.py
+"""Inverted-file (IVF) approximate index for LocalVectorStore.
+
+Unit vectors are clustered into ``nlist`` cells with spherical k-means. A
+query scores the centroids, then searches only the rows in its ``nprobe``
+closest cells, so each query touches roughly ``nprobe / nlist`` of the matrix
+instead of all of it. ``nprobe`` trades recall for latency.
+
+New rows are assigned to their nearest centroid as they are upserted, so
+ingestion never waits for a rebuild. Centroids are retrained once the store
+has grown well past the size they were trained on. LocalVectorStore runs the
+retrain (``fit`` + ``nearest``) on a background thread and only holds its
+lock for the final ``install`` swap.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+
+class IVFIndex:
+    def __init__(self, dimension: int, nlist: int = None, nprobe: int = None, min_vectors: int = None,
+                 retrain_growth: float = 4.0, seed: int = 0):
+        self.dimension = dimension
+        # 0 means derive from the number of vectors at training time
+        self.nlist = nlist if nlist is not None else int(os.getenv("LOCAL_IVF_NLIST", "0"))
+        self.nprobe = nprobe or int(os.getenv("LOCAL_IVF_NPROBE", "8"))
+        self.min_vectors = min_vectors if min_vectors is not None else int(os.getenv("LOCAL_IVF_MIN_VECTORS", "20000"))
+        self.retrain_growth = retrain_growth
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        self.trained_on = 0
+        # Cell of every slot, -1 when the slot is empty or not yet assigned
+        self.assignments = np.full(0, -1, dtype=np.int32)
+        self._lists: List[List[int]] = []
+        self._list_arrays: List[Optional[np.ndarray]] = []
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def needs_training(self, live_vectors: int) -> bool:
+        if live_vectors < self.min_vectors:
+            return False
+        return not self.is_trained or live_vectors > self.trained_on * self.retrain_growth
+
+    def _nlist_for(self, n: int) -> int:
+        # ~4*sqrt(n) cells keeps both the centroid scan and each cell small
+        return max(1, min(self.nlist or int(4 * np.sqrt(n)), n))
+
+    def fit(self, matrix: np.ndarray, slots: np.ndarray, iterations: int = 10,
+            sample_per_list: int = 64) -> np.ndarray:
+        """Spherical k-means centroids from a sample of the live rows; leaves the index untouched"""
+        rng = np.random.default_rng(self.seed)
+        nlist = self._nlist_for(len(slots))
+        sample_size = min(len(slots), nlist * sample_per_list)
+        sample = np.asarray(matrix[np.sort(rng.choice(slots, sample_size, replace=False))], dtype=np.float32)
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=nlist)
+            empty = counts == 0
+            # Re-seed empty cells from random sample rows
+            sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = sums / np.where(norms == 0, 1, norms)
+        return centroids.astype(np.float32)
+
+    def nearest(self, matrix: np.ndarray, slots, centroids: np.ndarray = None) -> np.ndarray:
+        """Cell of each slot's row under the given (default: current) centroids"""
+        centroids = self.centroids if centroids is None else centroids
+        slots = np.asarray(slots, dtype=np.int64)
+        cells = np.empty(len(slots), dtype=np.int32)
+        for start in range(0, len(slots), 65536):
+            chunk = slots[start:start + 65536]
+            cells[start:start + 65536] = np.argmax(np.asarray(matrix[chunk], dtype=np.float32) @ centroids.T, axis=1)
+        return cells
+
+    def install(self, centroids: np.ndarray, slots: np.ndarray, cells: np.ndarray):
+        """Swaps in new centroids with precomputed cells for ``slots``; every other slot becomes unassigned"""
+        slots = np.asarray(slots, dtype=np.int64)
+        size = max(len(self.assignments), int(slots.max()) + 1 if len(slots) else 0)
+        self.centroids = centroids
+        self.trained_on = len(slots)
+        self.assignments = np.full(size, -1, dtype=np.int32)
+        self.assignments[slots] = cells
+        self._lists = [[] for _ in range(len(centroids))]
+        self._list_arrays = [None] * len(centroids)
+        for slot, cell in zip(slots.tolist(), cells.tolist()):
+            self._lists[cell].append(slot)
+
+    def train(self, matrix: np.ndarray, slots: np.ndarray, iterations: int = 10, sample_per_list: int = 64):
+        """Runs spherical k-means on a sample of the live rows and reassigns every slot"""
+        centroids = self.fit(matrix, slots, iterations, sample_per_list)
+        self.install(centroids, slots, self.nearest(matrix, slots, centroids))
+
+    def assign(self, matrix: np.ndarray, slots) -> None:
+        """Puts (re)written slots into the cell of their nearest centroid"""
+        if not self.is_trained or not len(slots):
+            return
+        slots = np.asarray(slots, dtype=np.int64)
+        self._grow(int(slots.max()) + 1)
+        cells = self.nearest(matrix, slots)
+        self._invalidate(self.assignments[slots])
+        self.assignments[slots] = cells
+        for slot, cell in zip(slots.tolist(), cells.tolist()):
+            self._lists[cell].append(slot)
+            self._list_arrays[cell] = None
+
+    def remove(self, slots) -> None:
+        # Cell lists are cleaned lazily; an unassigned slot is ignored by candidates()
+        slots = [slot for slot in slots if slot < len(self.assignments)]
+        self._invalidate(self.assignments[slots])
+        self.assignments[slots] = -1
+
+    def _invalidate(self, cells: np.ndarray):
+        for cell in np.unique(cells[cells >= 0]).tolist():
+            self._list_arrays[cell] = None
+
+    def _grow(self, size: int):
+        if size > len(self.assignments):
+            grown = np.full(max(size, len(self.assignments) * 2), -1, dtype=np.int32)
+            grown[:len(self.assignments)] = self.assignments
+            self.assignments = grown
+
+    def _list_array(self, cell: int) -> np.ndarray:
+        array = self._list_arrays[cell]
+        if array is None:
+            slots = np.unique(np.asarray(self._lists[cell], dtype=np.int64))
+            # Drop slots that were deleted or moved to another cell since they were appended
+            array = slots[self.assignments[slots] == cell]
+            self._lists[cell] = array.tolist()
+            self._list_arrays[cell] = array
+        return array
+
+    def candidates(self, query: np.ndarray, nprobe: int = None) -> np.ndarray:
+        """Slots in the nprobe cells whose centroids are closest to the query"""
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+        scores = self.centroids @ query
+        cells = np.argpartition(-scores, nprobe - 1)[:nprobe]
+        return np.concatenate([self._list_array(int(cell)) for cell in cells])
+
+    def save(self, path: Path):
+        if not self.is_trained:
+            return
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez(tmp_path, centroids=self.centroids, assignments=self.assignments,
+                 trained_on=np.int64(self.trained_on))
+        os.replace(tmp_path, path)
+
+    def load(self, path: Path, size: int) -> bool:
+        """Restores centroids and assignments; returns False when there is nothing usable on disk"""
+        if not path.exists():
+            return False
+        with np.load(path) as saved:
+            centroids = saved["centroids"]
+            if centroids.shape[1] != self.dimension:
+                return False
+            self.centroids = centroids
+            self.assignments = saved["assignments"].astype(np.int32)
+            self.trained_on = int(saved["trained_on"])
+        self._grow(size)
+        self.assignments[size:] = -1
+        self._lists = [[] for _ in range(len(self.centroids))]
+        self._list_arrays = [None] * len(self.centroids)
+        assigned = np.flatnonzero(self.assignments >= 0)
+        for slot, cell in zip(assigned.tolist(), self.assignments[assigned].tolist()):
+            self._lists[cell].append(slot)
+        return True
+
+    def stats(self) -> dict:
+        if not self.is_trained:
+            return {"type": "ivf", "trained": False, "min_vectors": self.min_vectors}
+        sizes = np.bincount(self.assignments[self.assignments >= 0], minlength=len(self.centroids))
+        return {
+            "type": "ivf",
+            "trained": True,
+            "nlist": len(self.centroids),
+            "nprobe": self.nprobe,
+            "trained_on": self.trained_on,
+            "largest_list": int(sizes.max()),
+            "empty_lists": int((sizes == 0).sum())
+        }
@@ -0,0 +1,299 @@
+# src/education_ai_system/embeddings/lexical_index.py
+"""BM25 inverted index over ingested chunks.
+
+Curriculum topics are exact phrases ("National Consciousness", "Periodic
+Table") that dense retrieval can rank below looser matches. The index keeps
+unigram and bigram postings so phrase queries score on the phrase itself,
+and is updated by the ingestion pipeline alongside vector upserts.
+
+Postings are stored compactly as CSR arrays (term offsets, int32 doc ids,
+uint16 term frequencies) with small per-term append buffers for new chunks
+that are folded in on save(). Deleted chunks are tombstoned and dropped
+when the index is compacted.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+ChunkKey = Tuple[str, str]
+
+# Per-chunk fields a search can be filtered on with {"field": {"$eq": value}} or {"$in": [...]}
+FILTER_FIELDS = ("subject_key", "grade_key")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the their this to was "
+    "were will with".split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def terms(tokens: List[str]) -> List[str]:
+    """Unigrams plus adjacent bigrams, so exact phrases get their own postings"""
+    return tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+
+class LexicalIndex:
+    def __init__(self, path: str, k1: float = 1.2, b: float = 0.75):
+        self.path = Path(path)
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._load()
+
+    # ----- persistence -------------------------------------------------
+
+    def _load(self):
+        self._terms: Dict[str, int] = {}
+        self._keys: List[Optional[ChunkKey]] = []
+        self._field_values: Dict[str, Dict[str, int]] = {field: {} for field in ("namespace",) + FILTER_FIELDS}
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._post_docs = np.zeros(0, dtype=np.int32)
+        self._post_tfs = np.zeros(0, dtype=np.uint16)
+        doc_len = np.zeros(0, dtype=np.int32)
+        alive = np.zeros(0, dtype=bool)
+        fields = {field: np.zeros(0, dtype=np.int32) for field in self._field_values}
+
+        vocab_path, arrays_path = self.path / "vocab.json", self.path / "postings.npz"
+        if vocab_path.exists() and arrays_path.exists():
+            with open(vocab_path, "r", encoding="utf-8") as f:
+                vocab = json.load(f)
+            self._terms = {term: i for i, term in enumerate(vocab["terms"])}
+            self._keys = [tuple(key) if key else None for key in vocab["keys"]]
+            self._field_values = {field: {value: i for i, value in enumerate(values)}
+                                  for field, values in vocab["fields"].items()}
+            with np.load(arrays_path) as saved:
+                self._offsets = saved["offsets"]
+                self._post_docs = saved["post_docs"]
+                self._post_tfs = saved["post_tfs"]
+                doc_len = saved["doc_len"]
+                alive = saved["alive"]
+                fields = {field: saved[f"field_{field}"] for field in self._field_values}
+
+        self._size = len(self._keys)
+        self._doc_len = doc_len.copy()
+        self._alive = alive.copy()
+        self._fields = {field: column.copy() for field, column in fields.items()}
+        self._doc_of: Dict[ChunkKey, int] = {key: doc for doc, key in enumerate(self._keys) if key is not None}
+        self._live_docs = int(self._alive[:self._size].sum())
+        self._total_len = int(self._doc_len[:self._size][self._alive[:self._size]].sum())
+        # term id -> ([doc ids], [tfs]) added since the last save, and their cached arrays
+        self._buffers: Dict[int, Tuple[List[int], List[int]]] = {}
+        self._buffer_arrays: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._dirty = False
+
+    def save(self):
+        """Folds buffered postings into the CSR arrays (dropping deleted chunks) and writes them to disk"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._compact()
+            self.path.mkdir(parents=True, exist_ok=True)
+            vocab = {
+                "terms": sorted(self._terms, key=self._terms.get),
+                "keys": [list(key) if key else None for key in self._keys],
+                "fields": {field: sorted(values, key=values.get) for field, values in self._field_values.items()}
+            }
+            arrays = {
+                "offsets": self._offsets,
+                "post_docs": self._post_docs,
+                "post_tfs": self._post_tfs,
+                "doc_len": self._doc_len[:self._size],
+                "alive": self._alive[:self._size]
+            }
+            arrays.update({f"field_{field}": column[:self._size] for field, column in self._fields.items()})
+            tmp_arrays = self.path / "postings.tmp.npz"
+            np.savez(tmp_arrays, **arrays)
+            tmp_vocab = self.path / "vocab.json.tmp"
+            with open(tmp_vocab, "w", encoding="utf-8") as f:
+                json.dump(vocab, f)
+            os.replace(tmp_arrays, self.path / "postings.npz")
+            os.replace(tmp_vocab, self.path / "vocab.json")
+            self._dirty = False
+
+    def _compact(self):
+        """Rebuilds the CSR postings with buffers merged in and tombstoned chunks renumbered away"""
+        size = self._size
+        alive = self._alive[:size]
+        new_ids = np.cumsum(alive, dtype=np.int64) - 1
+
+        term_ids = [np.repeat(np.arange(len(self._offsets) - 1), np.diff(self._offsets))]
+        docs, tfs = [self._post_docs], [self._post_tfs]
+        for term_id, (buffer_docs, buffer_tfs) in self._buffers.items():
+            term_ids.append(np.full(len(buffer_docs), term_id))
+            docs.append(np.asarray(buffer_docs, dtype=np.int32))
+            tfs.append(np.asarray(buffer_tfs, dtype=np.uint16))
+        term_ids, docs, tfs = np.concatenate(term_ids), np.concatenate(docs), np.concatenate(tfs)
+        keep = alive[docs] if len(docs) else np.zeros(0, dtype=bool)
+        term_ids, docs, tfs = term_ids[keep], new_ids[docs[keep]].astype(np.int32), tfs[keep]
+        order = np.lexsort((docs, term_ids))
+        counts = np.bincount(term_ids, minlength=len(self._terms))
+
+        self._offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        self._post_docs = docs[order]
+        self._post_tfs = tfs[order]
+        self._keys = [key for key, live in zip(self._keys, alive) if live]
+        self._doc_of = {key: doc for doc, key in enumerate(self._keys)}
+        self._doc_len = self._doc_len[:size][alive]
+        self._fields = {field: column[:size][alive] for field, column in self._fields.items()}
+        self._size = len(self._keys)
+        self._alive = np.ones(self._size, dtype=bool)
+        self._buffers.clear()
+        self._buffer_arrays.clear()
+
+    # ----- writes ------------------------------------------------------
+
+    def _grow(self):
+        if self._size < len(self._alive):
+            return
+        capacity = max(1024, len(self._alive) * 2)
+        self._doc_len = np.concatenate([self._doc_len, np.zeros(capacity - len(self._doc_len), dtype=np.int32)])
+        self._alive = np.concatenate([self._alive, np.zeros(capacity - len(self._alive), dtype=bool)])
+        self._fields = {field: np.concatenate([column, np.zeros(capacity - len(column), dtype=np.int32)])
+                        for field, column in self._fields.items()}
+
+    def _field_code(self, field: str, value: str) -> int:
+        values = self._field_values[field]
+        return values.setdefault(value or "", len(values))
+
+    def add(self, key: ChunkKey, text: str, fields: Dict[str, str] = None):
+        """Indexes a chunk under its (chunk ID, namespace) key, replacing any previous version"""
+        tokens = tokenize(text)
+        counts = Counter(terms(tokens))
+        fields = fields or {}
+        with self._lock:
+            self._remove(key)
+            self._grow()
+            doc = self._size
+            self._size += 1
+            self._keys.append(tuple(key))
+            self._doc_of[tuple(key)] = doc
+            self._doc_len[doc] = len(tokens)
+            self._alive[doc] = True
+            self._fields["namespace"][doc] = self._field_code("namespace", key[1])
+            for field in FILTER_FIELDS:
+                self._fields[field][doc] = self._field_code(field, fields.get(field))
+            for term, tf in counts.items():
+                term_id = self._terms.setdefault(term, len(self._terms))
+                buffer_docs, buffer_tfs = self._buffers.setdefault(term_id, ([], []))
+                buffer_docs.append(doc)
+                buffer_tfs.append(min(tf, 65535))
+                self._buffer_arrays.pop(term_id, None)
+            self._live_docs += 1
+            self._total_len += len(tokens)
+            self._dirty = True
+
+    def _remove(self, key: ChunkKey) -> bool:
+        doc = self._doc_of.pop(tuple(key), None)
+        if doc is None:
+            return False
+        self._keys[doc] = None
+        self._alive[doc] = False
+        self._live_docs -= 1
+        self._total_len -= int(self._doc_len[doc])
+        self._dirty = True
+        return True
+
+    def remove(self, keys: Iterable[ChunkKey]) -> int:
+        with self._lock:
+            return sum(self._remove(key) for key in keys)
+
+    def __contains__(self, key: ChunkKey) -> bool:
+        return tuple(key) in self._doc_of
+
+    def __len__(self) -> int:
+        return self._live_docs
+
+    # ----- reads -------------------------------------------------------
+
+    def _postings(self, term_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self._offsets[term_id:term_id + 2] if term_id + 1 < len(self._offsets) else (0, 0)
+        docs, tfs = self._post_docs[start:end], self._post_tfs[start:end]
+        if term_id in self._buffers:
+            cached = self._buffer_arrays.get(term_id)
+            if cached is None:
+                buffer_docs, buffer_tfs = self._buffers[term_id]
+                cached = (np.asarray(buffer_docs, dtype=np.int32), np.asarray(buffer_tfs, dtype=np.uint16))
+                self._buffer_arrays[term_id] = cached
+            docs, tfs = np.concatenate([docs, cached[0]]), np.concatenate([tfs, cached[1]])
+        return docs, tfs
+
+    def search(self, text: str, top_k: int, namespace: str = "", filter: Dict = None) -> List[Dict]:
+        """BM25 top-k as [{"id", "score"}] within a namespace and optional $eq/$in filter"""
+        query_terms = set(terms(tokenize(text)))
+        with self._lock:
+            if not self._live_docs:
+                return []
+            term_ids = [self._terms[term] for term in query_terms if term in self._terms]
+            if not term_ids:
+                return []
+            n_docs = self._live_docs
+            avg_len = self._total_len / n_docs if n_docs else 1.0
+            all_docs, all_scores = [], []
+            for term_id in term_ids:
+                docs, tfs = self._postings(term_id)
+                docs, tfs = docs[self._alive[docs]], tfs[self._alive[docs]].astype(np.float32)
+                if not len(docs):
+                    continue
+                idf = np.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+                norm = self.k1 * (1 - self.b + self.b * self._doc_len[docs] / avg_len)
+                all_docs.append(docs)
+                all_scores.append(idf * tfs * (self.k1 + 1) / (tfs + norm))
+            if not all_docs:
+                return []
+            docs, inverse = np.unique(np.concatenate(all_docs), return_inverse=True)
+            scores = np.bincount(inverse, weights=np.concatenate(all_scores))
+
+            mask = self._fields["namespace"][docs] == self._field_values["namespace"].get(namespace or "", -1)
+            for field, condition in (filter or {}).items():
+                if field not in FILTER_FIELDS:
+                    raise ValueError(f"Lexical index cannot filter on '{field}'")
+                if isinstance(condition, dict) and "$in" in condition:
+                    codes = [self._field_values[field].get(value, -1) for value in condition["$in"]]
+                    mask &= np.isin(self._fields[field][docs], codes)
+                    continue
+                value = condition.get("$eq") if isinstance(condition, dict) else condition
+                mask &= self._fields[field][docs] == self._field_values[field].get(value, -1)
+            docs, scores = docs[mask], scores[mask]
+            if not len(docs):
+                return []
+            k = min(top_k, len(docs))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [{"id": self._keys[docs[i]][0], "score": float(scores[i])} for i in top]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "chunks": self._live_docs,
+                "terms": len(self._terms),
+                "postings": int(len(self._post_docs) + sum(len(docs) for docs, _ in self._buffers.values())),
+                "buffered_terms": len(self._buffers),
+                "tombstones": self._size - self._live_docs
+            }
+
+
+# One index per vector index name, shared by ingestion and retrieval in this process
+_indexes: Dict[str, LexicalIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_lexical_index(index_name: str) -> LexicalIndex:
+    path = str(Path(os.getenv("LEXICAL_INDEX_DIR", "lexical_index")) / index_name)
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = LexicalIndex(path)
+            _indexes[path] = index
+        return index
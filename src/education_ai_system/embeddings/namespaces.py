@@ -0,0 +1,32 @@
+# src/education_ai_system/embeddings/namespaces.py
+"""Per-subject Pinecone namespaces and normalised metadata keys.
+
+With partitioning enabled, each subject's vectors live in their own
+namespace and carry lowercase subject/grade keys, so a query can be scoped to
+one subject and filtered to one grade instead of searching the whole index.
+"""
+
+import os
+import re
+
+DEFAULT_NAMESPACE = ""
+UNASSIGNED_NAMESPACE = "unassigned"
+
+
+def partitioning_enabled() -> bool:
+    return os.getenv("PINECONE_PARTITION_BY_SUBJECT", "true").lower() in ("1", "true", "yes")
+
+
+def normalize_key(value: str) -> str:
+    """Case- and whitespace-insensitive key used in metadata filters"""
+    return " ".join(str(value).lower().split())
+
+
+def subject_namespace(subject: str) -> str:
+    """Namespace for a subject, e.g. 'Civic Education' -> 'civic-education'"""
+    if not partitioning_enabled():
+        return DEFAULT_NAMESPACE
+    slug = re.sub(r"[^a-z0-9]+", "-", normalize_key(subject)).strip("-")
+    if not slug or slug.startswith("unknown"):
+        return UNASSIGNED_NAMESPACE
+    return slug
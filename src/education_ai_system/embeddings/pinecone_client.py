@@ -0,0 +1,157 @@
+# src/education_ai_system/embeddings/pinecone_client.py
+"""Process-wide Pinecone client and index handles.
+
+Opening an index used to cost a new client, a ``list_indexes()`` control
+plane call and a fresh HTTP connection pool on every PineconeRetrievalTool
+and ContentEvaluator. Here the client is created once, each index is
+checked (and created if missing) once, and the resulting ``Index`` handle,
+with its keep-alive connection pool, is shared by every caller.
+"""
+
+import os
+import threading
+import time
+from typing import Dict
+
+_lock = threading.Lock()
+_client = None
+_indexes: Dict[str, "InstrumentedIndex"] = {}
+_control_plane_calls: Dict[str, int] = {}
+
+
+def _count_control_plane(call: str):
+    _control_plane_calls[call] = _control_plane_calls.get(call, 0) + 1
+
+
+class InstrumentedIndex:
+    """Shared Index handle that counts data-plane calls and their latency"""
+
+    _TRACKED = ("upsert", "query", "delete", "fetch", "describe_index_stats")
+
+    def __init__(self, index, name: str):
+        self._index = index
+        self.name = name
+        self.opened_at = time.time()
+        self._stats_lock = threading.Lock()
+        self._calls: Dict[str, Dict[str, float]] = {}
+        self._in_flight = 0
+
+    def __getattr__(self, attribute):
+        value = getattr(self._index, attribute)
+        if attribute not in self._TRACKED:
+            return value
+
+        def tracked(*args, **kwargs):
+            with self._stats_lock:
+                self._in_flight += 1
+            start = time.perf_counter()
+            error = False
+            try:
+                return value(*args, **kwargs)
+            except Exception:
+                error = True
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._stats_lock:
+                    self._in_flight -= 1
+                    stats = self._calls.setdefault(attribute, {"calls": 0, "errors": 0, "seconds": 0.0})
+                    stats["calls"] += 1
+                    stats["errors"] += error
+                    stats["seconds"] += elapsed
+
+        return tracked
+
+    def _pool_stats(self) -> Dict:
+        # urllib3 pools behind the generated OpenAPI client; layout differs between SDK versions
+        try:
+            api_client = self._index._vector_api.api_client
+            pool_manager = api_client.rest_client.pool_manager
+            pools = [pool_manager.pools[key] for key in list(pool_manager.pools.keys())]
+        except (AttributeError, KeyError):
+            return {"available": False}
+        return {
+            "available": True,
+            "pools": len(pools),
+            "max_connections_per_pool": pool_manager.connection_pool_kw.get("maxsize"),
+            "connections_opened": sum(getattr(pool, "num_connections", 0) for pool in pools),
+            "requests_sent": sum(getattr(pool, "num_requests", 0) for pool in pools)
+        }
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            calls = {
+                name: {
+                    "calls": int(stats["calls"]),
+                    "errors": int(stats["errors"]),
+                    "avg_ms": round(stats["seconds"] / stats["calls"] * 1000, 2) if stats["calls"] else 0.0
+                }
+                for name, stats in self._calls.items()
+            }
+            in_flight = self._in_flight
+        return {"index": self.name, "in_flight": in_flight, "calls": calls, "connection_pool": self._pool_stats()}
+
+
+def get_client():
+    """The single Pinecone client for this process"""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                from pinecone import Pinecone
+
+                api_key = os.getenv("PINECONE_API_KEY")
+                if not api_key:
+                    raise ValueError("Error: Pinecone API key is missing. Check your environment variables.")
+                _client = Pinecone(api_key=api_key, pool_threads=int(os.getenv("PINECONE_POOL_THREADS", "4")))
+    return _client
+
+
+def get_index(index_name: str, dimension: int) -> InstrumentedIndex:
+    """Shared handle for an index; the existence check and creation run once per process"""
+    index = _indexes.get(index_name)
+    if index is not None:
+        return index
+    pc = get_client()
+    with _lock:
+        index = _indexes.get(index_name)
+        if index is not None:
+            return index
+        from pinecone import ServerlessSpec
+
+        _count_control_plane("list_indexes")
+        if index_name not in pc.list_indexes().names():
+            print(f"Index '{index_name}' does not exist. Creating it now...")
+            _count_control_plane("create_index")
+            pc.create_index(
+                name=index_name,
+                dimension=dimension,
+                metric="cosine",
+                spec=ServerlessSpec(cloud=os.getenv("PINECONE_CLOUD", "aws"),
+                                    region=os.getenv("PINECONE_REGION", "us-west-2"))
+            )
+        _count_control_plane("describe_index")
+        host = pc.describe_index(index_name).host
+        index = InstrumentedIndex(
+            pc.Index(
+                host=host,
+                pool_threads=int(os.getenv("PINECONE_POOL_THREADS", "4")),
+                connection_pool_maxsize=int(os.getenv("PINECONE_POOL_MAXSIZE", "16"))
+            ),
+            index_name
+        )
+        _indexes[index_name] = index
+        print(f"✅ Opened shared Pinecone index handle '{index_name}' ({host})")
+        return index
+
+
+def pool_stats() -> Dict:
+    """Control-plane call counts and per-index data-plane/connection-pool statistics"""
+    with _lock:
+        indexes = list(_indexes.values())
+        control_plane = dict(_control_plane_calls)
+    return {
+        "client_created": _client is not None,
+        "control_plane_calls": control_plane,
+        "indexes": [index.stats() for index in indexes]
+    }
@@ -1,43 +1,149 @@
-import os
-import torch
-from pinecone import Pinecone
-from transformers import AutoTokenizer, AutoModel
+import time
 from dotenv import load_dotenv
+from src.education_ai_system.embeddings.embedding_service import get_embedding_service
+from src.education_ai_system.embeddings.chunk_manifest import chunk_id
+from src.education_ai_system.embeddings.upsert_writer import UpsertWriter, summarize
+from src.education_ai_system.embeddings.namespaces import normalize_key, subject_namespace
+from src.education_ai_system.embeddings.vector_store import open_vector_store, vector_index_name
+from src.education_ai_system.embeddings.lexical_index import get_lexical_index
 
 load_dotenv()
 
 class PineconeManager:
-    def __init__(self):
-        self.pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
-        self.index_name = os.getenv("PINECONE_INDEX", "curriculum-builder")
-        self.tokenizer = AutoTokenizer.from_pretrained('sentence-transformers/all-MiniLM-L6-v2')
-        self.model = AutoModel.from_pretrained('sentence-transformers/all-MiniLM-L6-v2')
-        
-        # Initialize index
-        if self.index_name not in self.pc.list_indexes().names():
-            self.pc.create_index(
-                name=self.index_name,
-                dimension=384,
-                metric="cosine"
-            )
-            
-        self.index = self.pc.Index(self.index_name)
-
-    def upsert_content(self, chunks, metadata):
+    def __init__(self, batch_size: int = None):
+        self.index_name = vector_index_name()
+        # Shared, lazily loaded encoder (no per-instance model load)
+        self.embedder = get_embedding_service()
+        self.batch_size = batch_size or self.embedder.batch_size
+
+        # Pinecone index or local store, depending on VECTOR_STORE_BACKEND
+        self.index = open_vector_store(self.index_name)
+        # BM25 postings for hybrid retrieval, kept in step with the vectors
+        self.lexical = get_lexical_index(self.index_name)
+
+    def embed_batch(self, texts):
+        """Embeds a list of texts in a single padded forward pass"""
+        return self.embedder.embed(texts, batch_size=len(texts) or 1)
+
+    def _build_vectors(self, chunks, metadata, token_ids=None):
+        if token_ids is not None:
+            # Chunks were cut by the embedder's tokenizer; reuse those ids
+            vectors = self.embedder.embed_token_ids(token_ids, batch_size=len(token_ids) or 1)
+        else:
+            vectors = self.embed_batch(chunks)
+        return [
+            {
+                "id": chunk_id(chunk),
+                "values": vector.tolist(),
+                "metadata": self._vector_metadata(chunk, meta)
+            }
+            for chunk, meta, vector in zip(chunks, metadata, vectors)
+        ]
+
+    @staticmethod
+    def _vector_metadata(chunk, meta):
+        metadata = {
+            "subject": meta[0],
+            "grade_level": meta[1],
+            "subject_key": normalize_key(meta[0]),
+            "grade_key": normalize_key(meta[1]),
+            "content": chunk
+        }
+        # Catalog topics found by the tagger, used for filtered retrieval
+        if len(meta) > 2 and meta[2]:
+            metadata["topics"] = list(meta[2])
+        return metadata
+
+    def upsert_content(self, chunks, metadata, batch_size: int = None):
+        batch_size = batch_size or self.batch_size
         embeddings = []
-        for chunk, meta in zip(chunks, metadata):
-            inputs = self.tokenizer(chunk, return_tensors="pt", padding=True, truncation=True)
-            with torch.no_grad():
-                embedding = self.model(**inputs).last_hidden_state.mean(dim=1).cpu().numpy()
-            
-            embeddings.append({
-                "id": f"chunk-{hash(chunk)}",
-                "values": embedding[0].tolist(),
-                "metadata": {
-                    "subject": meta[0],
-                    "grade_level": meta[1],
-                    "content": chunk
-                }
+        start = time.perf_counter()
+        for i in range(0, len(chunks), batch_size):
+            embeddings.extend(self._build_vectors(chunks[i:i + batch_size], metadata[i:i + batch_size]))
+        elapsed = time.perf_counter() - start
+
+        with UpsertWriter(self.index) as writer:
+            for namespace, vectors in self._by_namespace(embeddings).items():
+                writer.submit(vectors, namespace)
+                self._index_lexical(vectors, namespace)
+            results = writer.flush()
+        upsert = summarize(results)
+        self.lexical.remove(key for r in results for key in r["failed_ids"])
+        self.lexical.save()
+
+        chunks_per_sec = len(chunks) / elapsed if elapsed > 0 else 0.0
+        print(f"Embedded {len(chunks)} chunks in {elapsed:.2f}s "
+              f"({chunks_per_sec:.1f} chunks/sec, batch_size={batch_size})")
+        return {
+            "chunks": len(chunks),
+            "batch_size": batch_size,
+            "embed_seconds": round(elapsed, 3),
+            "chunks_per_sec": round(chunks_per_sec, 1),
+            "upsert": upsert
+        }
+
+    def _index_lexical(self, vectors, namespace):
+        for vector in vectors:
+            metadata = vector["metadata"]
+            self.lexical.add((vector["id"], namespace), metadata["content"], {
+                "subject_key": metadata["subject_key"],
+                "grade_key": metadata["grade_key"]
             })
-        
-        self.index.upsert(embeddings)
\ No newline at end of file
+
+    @staticmethod
+    def _by_namespace(vectors):
+        """Groups vectors by the namespace of their subject"""
+        groups = {}
+        for vector in vectors:
+            groups.setdefault(subject_namespace(vector["metadata"]["subject"]), []).append(vector)
+        return groups
+
+    def delete_ids(self, keys, batch_size: int = 1000):
+        """Deletes (id, namespace) vectors in request-sized batches per namespace"""
+        by_namespace = {}
+        for cid, namespace in keys:
+            by_namespace.setdefault(namespace, []).append(cid)
+        for namespace, ids in by_namespace.items():
+            for i in range(0, len(ids), batch_size):
+                if namespace:
+                    self.index.delete(ids=ids[i:i + batch_size], namespace=namespace)
+                else:
+                    self.index.delete(ids=ids[i:i + batch_size])
+        self.lexical.remove((cid, namespace) for namespace, ids in by_namespace.items() for cid in ids)
+        return sum(len(ids) for ids in by_namespace.values())
+
+    def upsert_stream(self, batches):
+        """Embeds and upserts (chunks, metadata, token_ids) batches as they arrive.
+
+        Each embedded batch is handed to an UpsertWriter, so network upserts
+        overlap with embedding the next batch. Only a bounded number of
+        batches is held in memory and the first vectors are searchable long
+        before the document has been fully read.
+        """
+        start = time.perf_counter()
+        stats = {"chunks": 0, "batches": 0, "embed_seconds": 0.0}
+        with UpsertWriter(self.index) as writer:
+            for chunks, metadata, token_ids in batches:
+                embed_start = time.perf_counter()
+                vectors = self._build_vectors(chunks, metadata, token_ids)
+                stats["embed_seconds"] += time.perf_counter() - embed_start
+                stats["chunks"] += len(chunks)
+                stats["batches"] += 1
+                for namespace, group in self._by_namespace(vectors).items():
+                    writer.submit(group, namespace)
+                    self._index_lexical(group, namespace)
+            results = writer.flush()
+
+        elapsed = time.perf_counter() - start
+        stats["total_seconds"] = round(elapsed, 3)
+        stats["embed_seconds"] = round(stats["embed_seconds"], 3)
+        stats["first_upsert_seconds"] = min((r["completed_at"] for r in results), default=None)
+        stats["chunks_per_sec"] = round(stats["chunks"] / elapsed, 1) if elapsed > 0 else 0.0
+        stats["upsert"] = summarize(results)
+        stats["failed_ids"] = [cid for r in results for cid in r["failed_ids"]]
+        # Chunks whose upsert failed must not be returned by lexical search either
+        self.lexical.remove(stats["failed_ids"])
+        print(f"Streamed {stats['chunks']} chunks in {stats['batches']} batches "
+              f"({stats['chunks_per_sec']} chunks/sec, first upsert after {stats['first_upsert_seconds']}s, "
+              f"{stats['upsert']['failed_batches']} failed upsert batches)")
+        return stats
@@ -0,0 +1,173 @@
+# src/education_ai_system/embeddings/query_vector_table.py
+"""Precomputed query embeddings for every predefined subject/grade/topic.
+
+Retrieval only accepts queries that validate against predefined_input.yaml,
+so every possible query string is known ahead of time. This module embeds
+them all once into an on-disk float32 matrix that is memory-mapped at
+startup, turning query embedding into a dictionary lookup.
+
+Build (or rebuild) the table manually with:
+    python -m src.education_ai_system.embeddings.query_vector_table
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import yaml
+
+from src.education_ai_system.embeddings.embedding_service import get_embedding_service
+
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "predefined_input.yaml"
+DEFAULT_TABLE_DIR = Path(__file__).parent.parent / "config" / "query_vectors"
+
+
+def normalize_query_text(text: str) -> str:
+    """Matches the MiniLM tokenizer, which lowercases and ignores extra whitespace"""
+    return " ".join(text.lower().split())
+
+
+def query_text(subject: str, grade_level: str, topic: str) -> str:
+    """Builds the query string embedded by PineconeRetrievalTool"""
+    return f"{subject} {grade_level} {topic}"
+
+
+def iter_query_texts(predefined_inputs: Dict) -> Iterator[str]:
+    """Yields the normalised query text for every predefined combination"""
+    seen = set()
+    for subject in predefined_inputs.get("subjects", []):
+        for grade in subject.get("grade_levels", []):
+            for topic in grade.get("topics", []):
+                key = normalize_query_text(query_text(subject["name"], grade["name"], topic))
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class QueryVectorTable:
+    """Memory-mapped lookup table of precomputed query vectors"""
+
+    def __init__(self, table_dir: Path = None, config_path: Path = CONFIG_PATH):
+        self.table_dir = Path(table_dir or os.getenv("QUERY_VECTOR_TABLE_DIR", DEFAULT_TABLE_DIR))
+        self.config_path = Path(config_path)
+        self.matrix_path = self.table_dir / "vectors.npy"
+        self.index_path = self.table_dir / "index.json"
+        self._vectors: Optional[np.ndarray] = None
+        self._rows: Dict[str, int] = {}
+        self._config_mtime: Optional[float] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def build(self) -> int:
+        """Embeds every predefined combination and writes the table to disk"""
+        with open(self.config_path, "r") as f:
+            predefined_inputs = yaml.safe_load(f)
+        texts = list(iter_query_texts(predefined_inputs))
+        embedder = get_embedding_service()
+        vectors = embedder.embed(texts).astype(np.float32)
+
+        self.table_dir.mkdir(parents=True, exist_ok=True)
+        # Write to temp files first so a concurrent reader never sees a half-built table
+        tmp_matrix = self.table_dir / "vectors.tmp.npy"
+        tmp_index = self.table_dir / "index.tmp.json"
+        np.save(tmp_matrix, vectors)
+        with open(tmp_index, "w") as f:
+            json.dump({
+                "config_sha256": _file_hash(self.config_path),
+                "model_name": embedder.model_name,
+                "backend": embedder.backend_name,
+                "dimension": int(vectors.shape[1]),
+                "keys": texts
+            }, f)
+        os.replace(tmp_matrix, self.matrix_path)
+        os.replace(tmp_index, self.index_path)
+        print(f"Built query vector table with {len(texts)} entries at {self.table_dir}")
+        return len(texts)
+
+    def _is_stale(self) -> bool:
+        if not (self.matrix_path.exists() and self.index_path.exists()):
+            return True
+        with open(self.index_path, "r") as f:
+            index = json.load(f)
+        embedder = get_embedding_service()
+        return (index.get("config_sha256") != _file_hash(self.config_path)
+                or index.get("model_name") != embedder.model_name
+                or index.get("backend", "torch") != embedder.backend_name)
+
+    def load(self, rebuild_if_stale: bool = True) -> bool:
+        """Memory-maps the table, rebuilding it first if the YAML has changed"""
+        with self._lock:
+            try:
+                self._config_mtime = self.config_path.stat().st_mtime
+                if self._is_stale():
+                    if not rebuild_if_stale:
+                        return False
+                    self.build()
+                with open(self.index_path, "r") as f:
+                    keys: List[str] = json.load(f)["keys"]
+                self._vectors = np.load(self.matrix_path, mmap_mode="r")
+                self._rows = {key: row for row, key in enumerate(keys)}
+                return True
+            except Exception as e:
+                print(f"Query vector table unavailable, falling back to the model: {e}")
+                self._vectors = None
+                self._rows = {}
+                return False
+
+    def lookup(self, text: str) -> Optional[List[float]]:
+        """Returns the precomputed vector for a query, or None if it is not in the table"""
+        try:
+            if self.config_path.stat().st_mtime != self._config_mtime:
+                # The catalog was edited while running; rebuild before answering
+                self.load()
+        except OSError:
+            pass
+        if self._vectors is None:
+            self.misses += 1
+            return None
+        row = self._rows.get(normalize_query_text(text))
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._vectors[row].tolist()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._rows), "hits": self.hits, "misses": self.misses}
+
+
+_table: Optional[QueryVectorTable] = None
+_table_lock = threading.Lock()
+
+
+def get_query_vector_table() -> QueryVectorTable:
+    """Returns the shared table, loading (and rebuilding if needed) on first use"""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                table = QueryVectorTable()
+                table.load()
+                _table = table
+    return _table
+
+
+def lookup_or_embed(text: str) -> Tuple[List[float], bool]:
+    """Returns (vector, was_precomputed), using the model only as a fallback"""
+    vector = get_query_vector_table().lookup(text)
+    if vector is not None:
+        return vector, True
+    return get_embedding_service().embed_query(text), False
+
+
+if __name__ == "__main__":
+    QueryVectorTable().build()
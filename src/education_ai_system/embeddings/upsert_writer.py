@@ -0,0 +1,149 @@
+# src/education_ai_system/embeddings/upsert_writer.py
+"""Size-aware, concurrent batched upserts.
+
+Vectors are split into requests bounded by both vector count and serialized
+byte size, sent on a small thread pool with bounded parallelism, and retried
+with exponential backoff. The writer only needs an object with an
+``upsert(vectors=...)`` method, so it works against a Pinecone ``Index`` or
+any local fake index.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+# Pinecone rejects upsert requests over 2MB or 1000 vectors
+PINECONE_MAX_REQUEST_BYTES = 2 * 1024 * 1024
+
+
+def vector_size(vector: Dict) -> int:
+    """Approximate serialized size of one vector in an upsert request"""
+    return len(json.dumps(vector, separators=(",", ":")).encode("utf-8")) + 1
+
+
+class UpsertWriter:
+    def __init__(self, index, max_batch_vectors: int = None, max_batch_bytes: int = None,
+                 max_workers: int = None, max_retries: int = 3, backoff_seconds: float = 0.5,
+                 namespace: str = None):
+        self.index = index
+        self.max_batch_vectors = max_batch_vectors or int(os.getenv("UPSERT_BATCH_VECTORS", "100"))
+        # Leave headroom for the request envelope
+        self.max_batch_bytes = max_batch_bytes or int(os.getenv(
+            "UPSERT_BATCH_BYTES", str(int(PINECONE_MAX_REQUEST_BYTES * 0.9))))
+        self.max_workers = max_workers or int(os.getenv("UPSERT_MAX_WORKERS", "4"))
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.namespace = namespace
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="upsert")
+        # Bound in-flight batches so a fast producer cannot queue the whole document
+        self._slots = threading.BoundedSemaphore(self.max_workers * 2)
+        self._futures: List[Future] = []
+        self._batch_counter = 0
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def split(self, vectors: List[Dict]) -> List[List[Dict]]:
+        """Splits vectors into batches bounded by count and serialized bytes"""
+        return [batch for batch, _ in self._split_sized(vectors)]
+
+    def _split_sized(self, vectors: List[Dict]) -> List[Tuple[List[Dict], int]]:
+        batches, current, current_bytes = [], [], 0
+        for vector in vectors:
+            size = vector_size(vector)
+            if size > self.max_batch_bytes:
+                raise ValueError(f"Vector {vector.get('id')} is {size} bytes, over the {self.max_batch_bytes} byte limit")
+            if current and (len(current) >= self.max_batch_vectors or current_bytes + size > self.max_batch_bytes):
+                batches.append((current, current_bytes))
+                current, current_bytes = [], 0
+            current.append(vector)
+            current_bytes += size
+        if current:
+            batches.append((current, current_bytes))
+        return batches
+
+    def _send(self, batch_number: int, batch: List[Dict], nbytes: int, namespace: str) -> Dict:
+        attempts = 0
+        start = time.perf_counter()
+        try:
+            while True:
+                attempts += 1
+                try:
+                    if namespace:
+                        self.index.upsert(vectors=batch, namespace=namespace)
+                    else:
+                        self.index.upsert(vectors=batch)
+                    error = None
+                    break
+                except Exception as e:
+                    if attempts > self.max_retries:
+                        error = str(e)
+                        break
+                    delay = self.backoff_seconds * (2 ** (attempts - 1))
+                    time.sleep(delay + random.uniform(0, delay / 2))
+            finished = time.perf_counter()
+            return {
+                "batch": batch_number,
+                "namespace": namespace or "",
+                "vectors": len(batch),
+                "bytes": nbytes,
+                "attempts": attempts,
+                "seconds": round(finished - start, 4),
+                "completed_at": round(finished - self._started, 4),
+                "status": "error" if error else "success",
+                "error": error,
+                "failed_ids": [(v["id"], namespace or "") for v in batch] if error else []
+            }
+        finally:
+            self._slots.release()
+
+    def submit(self, vectors: List[Dict], namespace: str = None) -> List[Future]:
+        """Queues vectors for upsert, blocking while too many batches are in flight"""
+        namespace = self.namespace if namespace is None else namespace
+        futures = []
+        for batch, nbytes in self._split_sized(vectors):
+            self._slots.acquire()
+            with self._lock:
+                self._batch_counter += 1
+                batch_number = self._batch_counter
+            future = self._executor.submit(self._send, batch_number, batch, nbytes, namespace)
+            futures.append(future)
+            self._futures.append(future)
+        return futures
+
+    def flush(self) -> List[Dict]:
+        """Waits for every submitted batch and returns per-batch results in submission order"""
+        futures, self._futures = self._futures, []
+        return [future.result() for future in futures]
+
+    def write(self, vectors: List[Dict], namespace: str = None) -> List[Dict]:
+        """Upserts vectors and waits for completion"""
+        self.submit(vectors, namespace)
+        return self.flush()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def summarize(results: List[Dict]) -> Dict:
+    """Aggregates per-batch results into totals for API responses"""
+    failed = [r for r in results if r["status"] != "success"]
+    return {
+        "batches": len(results),
+        "vectors_upserted": sum(r["vectors"] for r in results if r["status"] == "success"),
+        "failed_batches": len(failed),
+        "retries": sum(r["attempts"] - 1 for r in results),
+        "max_batch_seconds": max((r["seconds"] for r in results), default=0.0),
+        "errors": [r["error"] for r in failed][:5],
+        "timings": [{key: r[key] for key in ("batch", "vectors", "bytes", "attempts", "seconds", "status")}
+                    for r in results]
+    }
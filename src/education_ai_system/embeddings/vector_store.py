@@ -0,0 +1,482 @@
+# src/education_ai_system/embeddings/vector_store.py
+"""Pluggable vector store behind PineconeManager and PineconeRetrievalTool.
+
+Both callers only use the subset of the Pinecone ``Index`` API described by
+``VectorStore``, so ``VECTOR_STORE_BACKEND`` can swap the hosted index for a
+local, in-process store without touching the routes:
+
+* ``pinecone`` (default) - the hosted Pinecone index.
+* ``local`` - ``LocalVectorStore``: a memory-mapped float32 matrix searched
+  with one exact cosine matrix product, for offline runs and benchmarks.
+  ``LOCAL_VECTOR_INDEX=ivf`` adds an approximate IVF index on top for large
+  stores (see ivf_index.py).
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol, Set, Tuple
+
+import numpy as np
+
+from src.education_ai_system.embeddings.embedding_service import EMBEDDING_DIMENSION
+from src.education_ai_system.embeddings.ivf_index import IVFIndex
+from src.education_ai_system.embeddings import pinecone_client
+
+DEFAULT_BACKEND = "pinecone"
+
+
+class VectorStore(Protocol):
+    """The part of the Pinecone Index API the application relies on"""
+
+    def upsert(self, vectors: List[Dict], namespace: str = None) -> Any: ...
+
+    def query(self, vector: List[float], top_k: int, include_metadata: bool = False,
+              namespace: str = None, filter: Dict = None) -> Dict: ...
+
+    def delete(self, ids: List[str], namespace: str = None) -> Any: ...
+
+    def fetch(self, ids: List[str], namespace: str = None) -> Any: ...
+
+    def describe_index_stats(self) -> Dict: ...
+
+
+class LocalVectorStore:
+    """Exact cosine search over a memory-mapped float32 matrix.
+
+    Layout of the store directory:
+
+    * ``vectors.f32`` - unit-normalised rows, one slot per vector, grown by
+      doubling and memory-mapped so only touched pages are resident.
+    * ``columns.json`` - slot-aligned columns: ids, namespaces and one list
+      per metadata field (the columnar sidecar).
+    * ``journal.jsonl`` - upserts/deletes since the last snapshot, replayed
+      on load so writes never rewrite the whole sidecar.
+
+    * ``ivf.npz`` - IVF centroids and cell assignments, when enabled.
+
+    Deleted slots are tombstoned and reused by later upserts.
+    """
+
+    name = "local"
+
+    def __init__(self, path: str, dimension: int = EMBEDDING_DIMENSION, compact_every: int = None,
+                 index: str = None):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dimension = dimension
+        self.compact_every = compact_every or int(os.getenv("LOCAL_VECTOR_STORE_COMPACT_EVERY", "50000"))
+        self._lock = threading.RLock()
+        self._vectors_path = self.path / "vectors.f32"
+        self._columns_path = self.path / "columns.json"
+        self._journal_path = self.path / "journal.jsonl"
+        self._ivf_path = self.path / "ivf.npz"
+        index = (index or os.getenv("LOCAL_VECTOR_INDEX", "exact")).lower()
+        if index not in ("exact", "ivf"):
+            raise ValueError(f"Unknown LOCAL_VECTOR_INDEX '{index}'. Expected 'exact' or 'ivf'")
+        self.ann = IVFIndex(dimension) if index == "ivf" else None
+        # Background IVF retrain, and the slots written or deleted while it runs
+        self._training: Optional[threading.Thread] = None
+        self._retrain_dirty: Set[int] = set()
+        self._load()
+
+    # ----- persistence -------------------------------------------------
+
+    def _load(self):
+        self._ids: List[Optional[str]] = []
+        self._namespaces: List[str] = []
+        self._columns: Dict[str, List] = {}
+        if self._columns_path.exists():
+            with open(self._columns_path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved["dimension"] != self.dimension:
+                raise ValueError(f"Store at {self.path} has dimension {saved['dimension']}, expected {self.dimension}")
+            self._ids = saved["ids"]
+            self._namespaces = saved["namespaces"]
+            self._columns = saved["metadata"]
+
+        self._open_matrix(max(len(self._ids), 1024))
+        self._journal_entries = 0
+        replayed = set()
+        if self._journal_path.exists():
+            with open(self._journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A crash mid-write leaves at most one partial trailing line
+                        break
+                    self._apply(entry)
+                    replayed.add(entry["slot"])
+                    self._journal_entries += 1
+        self._ensure_capacity(len(self._ids))
+        self._journal = open(self._journal_path, "a", encoding="utf-8")
+        self._reindex()
+
+        if self.ann is not None:
+            if self.ann.load(self._ivf_path, len(self._ids)):
+                # Rows written since the last snapshot are not in the saved cells yet
+                self.ann.remove(sorted(replayed))
+                self.ann.assign(self._matrix, [slot for slot in sorted(replayed) if self._alive[slot]])
+            self._maybe_train()
+
+    def _open_matrix(self, min_rows: int):
+        row_bytes = self.dimension * 4
+        rows = self._vectors_path.stat().st_size // row_bytes if self._vectors_path.exists() else 0
+        if rows < min_rows:
+            rows = max(min_rows, rows * 2)
+            with open(self._vectors_path, "ab") as f:
+                f.truncate(rows * row_bytes)
+        self._matrix = np.memmap(self._vectors_path, dtype=np.float32, mode="r+", shape=(rows, self.dimension))
+
+    def _apply(self, entry: Dict):
+        slot = entry["slot"]
+        while len(self._ids) <= slot:
+            self._ids.append(None)
+            self._namespaces.append("")
+            for column in self._columns.values():
+                column.append(None)
+        if entry["op"] == "delete":
+            self._ids[slot] = None
+            for column in self._columns.values():
+                column[slot] = None
+            return
+        self._ids[slot] = entry["id"]
+        self._namespaces[slot] = entry["namespace"]
+        metadata = entry.get("metadata") or {}
+        for field in metadata:
+            if field not in self._columns:
+                self._columns[field] = [None] * len(self._ids)
+        for field, column in self._columns.items():
+            column[slot] = metadata.get(field)
+
+    def _reindex(self):
+        self._slot_of: Dict[Tuple[str, str], int] = {}
+        self._free: List[int] = []
+        for slot, (cid, namespace) in enumerate(zip(self._ids, self._namespaces)):
+            if cid is None:
+                self._free.append(slot)
+            else:
+                self._slot_of[(namespace, cid)] = slot
+        self._free.reverse()
+        self._alive = np.array([cid is not None for cid in self._ids], dtype=bool)
+        self._namespace_codes: Dict[str, int] = {}
+        self._namespace_column = np.array([self._namespace_code(ns) for ns in self._namespaces], dtype=np.int32)
+        self._column_cache: Dict[str, np.ndarray] = {}
+
+    def _namespace_code(self, namespace: str) -> int:
+        return self._namespace_codes.setdefault(namespace, len(self._namespace_codes))
+
+    def _log(self, entries: List[Dict]):
+        for entry in entries:
+            self._journal.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._journal.flush()
+        self._journal_entries += len(entries)
+        if self._journal_entries >= self.compact_every:
+            self.snapshot()
+
+    def snapshot(self, target_dir: str = None) -> Dict:
+        """Flushes the matrix, folds the journal into the sidecar and optionally copies the store"""
+        with self._lock:
+            self._matrix.flush()
+            payload = {
+                "dimension": self.dimension,
+                "ids": self._ids,
+                "namespaces": self._namespaces,
+                "metadata": self._columns
+            }
+            tmp_path = self._columns_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self._columns_path)
+            if self.ann is not None:
+                self.ann.save(self._ivf_path)
+            self._journal.close()
+            self._journal = open(self._journal_path, "w", encoding="utf-8")
+            self._journal_entries = 0
+
+            if target_dir:
+                target = Path(target_dir)
+                target.mkdir(parents=True, exist_ok=True)
+                rows = len(self._ids)
+                np.asarray(self._matrix[:rows]).tofile(target / "vectors.f32")
+                with open(target / "columns.json", "w", encoding="utf-8") as f:
+                    json.dump(payload, f)
+                (target / "journal.jsonl").touch()
+                if self.ann is not None:
+                    self.ann.save(target / "ivf.npz")
+            return self.describe_index_stats()
+
+    def wait_for_index(self, timeout: float = None):
+        """Blocks until a running IVF retrain has swapped in its centroids"""
+        training = self._training
+        if training is not None:
+            training.join(timeout)
+
+    def close(self):
+        self.wait_for_index()
+        with self._lock:
+            self.snapshot()
+            self._journal.close()
+
+    # ----- writes ------------------------------------------------------
+
+    def _ensure_capacity(self, rows: int):
+        if rows > self._matrix.shape[0]:
+            self._matrix.flush()
+            del self._matrix
+            self._open_matrix(rows)
+
+    def upsert(self, vectors: List[Dict], namespace: str = None) -> Dict:
+        namespace = namespace or ""
+        if not vectors:
+            return {"upserted_count": 0}
+        values = np.asarray([vector["values"] for vector in vectors], dtype=np.float32)
+        if values.ndim != 2 or values.shape[1] != self.dimension:
+            raise ValueError(f"Expected vectors of dimension {self.dimension}, got shape {values.shape}")
+        norms = np.linalg.norm(values, axis=1, keepdims=True)
+        values /= np.where(norms == 0, 1, norms)
+
+        with self._lock:
+            entries = []
+            for vector, row in zip(vectors, values):
+                key = (namespace, vector["id"])
+                slot = self._slot_of.get(key)
+                if slot is None:
+                    slot = self._free.pop() if self._free else len(self._ids)
+                    self._slot_of[key] = slot
+                entry = {"op": "upsert", "slot": slot, "id": vector["id"], "namespace": namespace,
+                         "metadata": vector.get("metadata") or {}}
+                self._apply(entry)
+                entries.append(entry)
+                self._ensure_capacity(slot + 1)
+                self._matrix[slot] = row
+            self._sync_columns(entries)
+            self._matrix.flush()
+            if self.ann is not None:
+                # New rows go straight into their nearest cell; retraining happens off the write path
+                slots = [entry["slot"] for entry in entries]
+                self.ann.assign(self._matrix, slots)
+                if self._training is not None:
+                    self._retrain_dirty.update(slots)
+                self._maybe_train()
+            self._log(entries)
+        return {"upserted_count": len(vectors)}
+
+    def _maybe_train(self):
+        """Starts a background retrain when due; upserts and queries keep using the current cells meanwhile"""
+        if self._training is not None:
+            return
+        live = int(self._alive.sum())
+        if not self.ann.needs_training(live):
+            return
+        self._retrain_dirty = set()
+        self._training = threading.Thread(target=self._train, args=(self._matrix, np.flatnonzero(self._alive)),
+                                          name="ivf-train", daemon=True)
+        self._training.start()
+
+    def _train(self, matrix: np.ndarray, slots: np.ndarray):
+        try:
+            print(f"Training IVF index on {len(slots)} vectors in {self.path}")
+            # k-means and the full reassignment run without the lock; numpy releases the GIL in the products
+            centroids = self.ann.fit(matrix, slots)
+            cells = self.ann.nearest(matrix, slots, centroids)
+            with self._lock:
+                self.ann.install(centroids, slots, cells)
+                # Rows rewritten or deleted while training ran are placed against the new centroids
+                dirty = sorted(self._retrain_dirty)
+                self.ann.remove(dirty)
+                self.ann.assign(self._matrix, [slot for slot in dirty if slot < len(self._alive) and self._alive[slot]])
+                self.ann.save(self._ivf_path)
+            print(f"✅ IVF index trained on {len(slots)} vectors in {self.path}")
+        except Exception as e:
+            print(f"❌ IVF training failed for {self.path}: {e}")
+        finally:
+            with self._lock:
+                self._training = None
+                self._retrain_dirty = set()
+
+    def delete(self, ids: List[str], namespace: str = None) -> Dict:
+        namespace = namespace or ""
+        with self._lock:
+            entries = []
+            for cid in ids:
+                slot = self._slot_of.pop((namespace, cid), None)
+                if slot is None:
+                    continue
+                self._free.append(slot)
+                self._matrix[slot] = 0
+                entries.append({"op": "delete", "slot": slot})
+            for entry in entries:
+                self._apply(entry)
+            self._sync_columns(entries)
+            if self.ann is not None:
+                self.ann.remove([entry["slot"] for entry in entries])
+                if self._training is not None:
+                    self._retrain_dirty.update(entry["slot"] for entry in entries)
+            if entries:
+                self._log(entries)
+        return {}
+
+    def _sync_columns(self, entries: List[Dict]):
+        # Keep the numpy views used by query() in step with the python columns
+        size = len(self._ids)
+        if len(self._alive) < size:
+            self._alive = np.concatenate([self._alive, np.zeros(size - len(self._alive), dtype=bool)])
+            self._namespace_column = np.concatenate(
+                [self._namespace_column, np.zeros(size - len(self._namespace_column), dtype=np.int32)])
+        for entry in entries:
+            slot = entry["slot"]
+            self._alive[slot] = entry["op"] == "upsert"
+            if entry["op"] == "upsert":
+                self._namespace_column[slot] = self._namespace_code(entry["namespace"])
+        self._column_cache.clear()
+
+    # ----- reads -------------------------------------------------------
+
+    def _column_array(self, field: str) -> np.ndarray:
+        array = self._column_cache.get(field)
+        if array is None:
+            column = self._columns.get(field, [None] * len(self._ids))
+            array = np.empty(len(column), dtype=object)
+            array[:] = column
+            self._column_cache[field] = array
+        return array
+
+    def _filter_mask(self, filter: Dict) -> np.ndarray:
+        """Pinecone-style metadata filter on scalar fields ($eq, $ne, $in, $nin, implicit $eq)"""
+        mask = np.ones(len(self._ids), dtype=bool)
+        for field, condition in filter.items():
+            column = self._column_array(field)
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+            for op, value in condition.items():
+                if op == "$eq":
+                    mask &= column == value
+                elif op == "$ne":
+                    mask &= column != value
+                elif op == "$in":
+                    mask &= np.isin(column, list(value))
+                elif op == "$nin":
+                    mask &= ~np.isin(column, list(value))
+                else:
+                    raise ValueError(f"Unsupported filter operator '{op}' for the local vector store")
+        return mask
+
+    def query(self, vector: List[float], top_k: int, include_metadata: bool = False,
+              namespace: str = None, filter: Dict = None, nprobe: int = None) -> Dict:
+        """Top-k cosine matches; nprobe overrides LOCAL_IVF_NPROBE when the IVF index is enabled"""
+        namespace = namespace or ""
+        q = np.asarray(vector, dtype=np.float32)
+        q = q / (np.linalg.norm(q) or 1.0)
+        with self._lock:
+            size = len(self._ids)
+            code = self._namespace_codes.get(namespace)
+            if code is None or size == 0:
+                return {"matches": [], "namespace": namespace}
+            mask = self._alive[:size] & (self._namespace_column[:size] == code)
+            if filter:
+                mask &= self._filter_mask(filter)
+            candidates = np.flatnonzero(mask)
+            if not len(candidates):
+                return {"matches": [], "namespace": namespace}
+            if self.ann is not None and self.ann.is_trained and len(candidates) >= self.ann.min_vectors:
+                probed = self.ann.candidates(q, nprobe)
+                probed = probed[mask[probed]]
+                # A tight namespace/filter can leave the probed cells short; keep the exact scan then
+                if len(probed) >= top_k:
+                    candidates = probed
+            if len(candidates) * 4 < size:
+                # Small namespace or tight filter: gather the rows first
+                scores = self._matrix[candidates] @ q
+            else:
+                scores = (self._matrix[:size] @ q)[candidates]
+            k = min(top_k, len(candidates))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            matches = []
+            for position in top:
+                slot = int(candidates[position])
+                match = {"id": self._ids[slot], "score": float(scores[position])}
+                if include_metadata:
+                    match["metadata"] = {field: column[slot] for field, column in self._columns.items()
+                                         if column[slot] is not None}
+                matches.append(match)
+        return {"matches": matches, "namespace": namespace}
+
+    def fetch(self, ids: List[str], namespace: str = None) -> Dict:
+        """Stored (normalised) values and metadata for ids, shaped like a Pinecone fetch response"""
+        namespace = namespace or ""
+        vectors = {}
+        with self._lock:
+            for cid in ids:
+                slot = self._slot_of.get((namespace, cid))
+                if slot is None:
+                    continue
+                vectors[cid] = {
+                    "id": cid,
+                    "values": self._matrix[slot].tolist(),
+                    "metadata": {field: column[slot] for field, column in self._columns.items()
+                                 if column[slot] is not None}
+                }
+        return {"vectors": vectors, "namespace": namespace}
+
+    def describe_index_stats(self) -> Dict:
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for cid, namespace in zip(self._ids, self._namespaces):
+                if cid is not None:
+                    counts[namespace] = counts.get(namespace, 0) + 1
+            return {
+                "dimension": self.dimension,
+                "total_vector_count": sum(counts.values()),
+                "capacity": int(self._matrix.shape[0]),
+                "namespaces": {ns: {"vector_count": count} for ns, count in counts.items()},
+                "index": ({**self.ann.stats(), "training": self._training is not None}
+                          if self.ann is not None else {"type": "exact"})
+            }
+
+
+# One LocalVectorStore per directory so ingestion and retrieval share the same matrix
+_local_stores: Dict[str, LocalVectorStore] = {}
+_local_stores_lock = threading.Lock()
+
+
+def vector_store_backend() -> str:
+    return os.getenv("VECTOR_STORE_BACKEND", DEFAULT_BACKEND).lower()
+
+
+def vector_index_name() -> str:
+    """Index name shared by ingestion and retrieval; it also names the local store and lexical index.
+
+    PINECONE_INDEX_NAME wins; PINECONE_INDEX is still read for deployments
+    that only configured the ingestion side.
+    """
+    return os.getenv("PINECONE_INDEX_NAME") or os.getenv("PINECONE_INDEX") or "ai-teach"
+
+
+def open_vector_store(index_name: str, dimension: int = EMBEDDING_DIMENSION) -> VectorStore:
+    """Returns the configured store for an index name (a Pinecone Index or a LocalVectorStore)"""
+    backend = vector_store_backend()
+    if backend == "pinecone":
+        return pinecone_client.get_index(index_name, dimension)
+    if backend != "local":
+        raise ValueError(f"Unknown VECTOR_STORE_BACKEND '{backend}'. Expected 'pinecone' or 'local'")
+    path = str(Path(os.getenv("LOCAL_VECTOR_STORE_DIR", "vector_store")) / index_name)
+    with _local_stores_lock:
+        store = _local_stores.get(path)
+        if store is None:
+            store = LocalVectorStore(path, dimension)
+            _local_stores[path] = store
+            print(f"Opened local vector store at {path}")
+        return store
+
+
+def vector_store_stats() -> Dict:
+    """Connection-pool and call statistics for Pinecone, or sizes of the open local stores"""
+    if vector_store_backend() == "pinecone":
+        return {"backend": "pinecone", **pinecone_client.pool_stats()}
+    with _local_stores_lock:
+        stores = dict(_local_stores)
+    return {"backend": "local", "stores": {path: store.describe_index_stats() for path, store in stores.items()}}
@@ -2,6 +2,8 @@ from langchain_groq import ChatGroq  # Changed from langchain_openai
 from src.education_ai_system.tools.pinecone_exa_tools import PineconeRetrievalTool
 from src.education_ai_system.utils.validators import load_prompt
 from src.education_ai_system.utils.supabase_manager import SupabaseManager
+from src.education_ai_system.utils.executors import run_blocking
+import asyncio
 import json
 import re
 from langchain.output_parsers import PydanticOutputParser
@@ -10,6 +12,10 @@ from langchain_core.pydantic_v1 import ValidationError
 from pydantic import BaseModel, Field, confloat, conint
 from typing import Dict
 
+def _write_debug_file(path: str, text: str):
+    with open(path, "w") as f:
+        f.write(text)
+
 # Define nested models
 class MetricScore(BaseModel):
     score: conint(ge=0, le=5) = Field(..., description="Score from 0 to 5")
@@ -28,7 +34,7 @@ class EvaluationResult(BaseModel):
     overall_accuracy: confloat(ge=0, le=5)
 
 class ContentEvaluator:
-    def __init__(self):
+    def __init__(self, supabase: SupabaseManager = None):
         # Replace OpenAI with Groq API
         self.llm = ChatGroq(
             temperature=0.1,
@@ -36,6 +42,8 @@ class ContentEvaluator:
             max_tokens=4096
         )
         self.retriever = PineconeRetrievalTool()
+        # Shared with the routes when given, instead of a new client per evaluation
+        self.supabase = supabase or SupabaseManager()
 
         # Initialize parser with our model
         self.parser = PydanticOutputParser(pydantic_object=EvaluationResult)
@@ -65,15 +73,20 @@ class ContentEvaluator:
 
     # evaluation_service.py
     def evaluate_content_by_context(self, content_type: str, context_id: str) -> dict:
+        """Blocking wrapper for callers outside the event loop"""
+        return asyncio.run(self.aevaluate_content_by_context(content_type, context_id))
+
+    async def aevaluate_content_by_context(self, content_type: str, context_id: str) -> dict:
+        """Database reads run on the bounded database pool and the LLM call on Groq's async client"""
         print(f"\n=== STARTING EVALUATION FOR {content_type.upper()} ===")
         print(f"Context ID: {context_id}")
         
         try:
-            supabase = SupabaseManager()
+            supabase = self.supabase
             
             # Retrieve context
             print("Fetching context from database...")
-            context_data = supabase.get_context_by_id(context_id)
+            context_data = await run_blocking("database", supabase.get_context_by_id, context_id)
             if not context_data:
                 print("❌ ERROR: Context not found in database")
                 return {"status": "error", "message": "Context not found"}
@@ -85,14 +98,15 @@ class ContentEvaluator:
             # Retrieve content using context ID
             print(f"Fetching {content_type} content using context ID...")
             if content_type == "scheme_of_work":
-                content_data = supabase.get_scheme_by_context(context_id)
+                fetch_content = supabase.get_scheme_by_context
             elif content_type == "lesson_plan":
-                content_data = supabase.get_lesson_plan_by_context(context_id)
+                fetch_content = supabase.get_lesson_plan_by_context
             elif content_type == "lesson_notes":
-                content_data = supabase.get_lesson_notes_by_context(context_id)
+                fetch_content = supabase.get_lesson_notes_by_context
             else:
                 print("❌ ERROR: Invalid content type specified")
                 return {"status": "error", "message": "Invalid content type"}
+            content_data = await run_blocking("database", fetch_content, context_id)
             
             if not content_data:
                 print("❌ ERROR: Content not found for given context")
@@ -121,13 +135,12 @@ class ContentEvaluator:
             print("===== END PROMPT =====\n")
             
             # Write prompt to file
-            with open("evaluation_prompt_debug.txt", "w") as f:
-                f.write(formatted_prompt)
+            await asyncio.to_thread(_write_debug_file, "evaluation_prompt_debug.txt", formatted_prompt)
             
             print("Sending prompt to LLM for evaluation...")
             
             try:
-                response = self.llm.invoke(formatted_prompt)
+                response = await self.llm.ainvoke(formatted_prompt)
             except Exception as e:
                 return {
                     "status": "error",
@@ -150,8 +163,7 @@ class ContentEvaluator:
             print("===== END RESPONSE =====\n")
             
             # Write full response to file for debugging
-            with open("llm_response_debug.txt", "w") as f:
-                f.write(response.content)
+            await asyncio.to_thread(_write_debug_file, "llm_response_debug.txt", response.content)
             
             print("Parsing evaluation response with Pydantic...")
             
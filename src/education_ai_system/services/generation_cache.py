@@ -0,0 +1,166 @@
+# src/education_ai_system/services/generation_cache.py
+"""Two-tier cache of model completions for ContentGenerator.
+
+Identical requests (same content type, model settings and fully formatted
+prompt, retrieved context included) used to pay the full model latency
+every time. Completions are now kept in an in-memory LRU, backed by a SQLite
+file so they survive restarts and are shared by every worker on the host.
+
+Keys are sha256 hashes of content type, model settings and the prompt with
+whitespace collapsed. Entries expire after GENERATION_CACHE_TTL_SECONDS.
+Each tier evicts least recently used entries beyond its size limit:
+GENERATION_CACHE_MEMORY_ENTRIES in memory and GENERATION_CACHE_DISK_ENTRIES
+on disk. The cache is disabled with GENERATION_CACHE_ENABLED=false.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+def generation_cache_enabled() -> bool:
+    return os.getenv("GENERATION_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+class GenerationCache:
+    def __init__(self, path: str = None, memory_entries: int = None, disk_entries: int = None,
+                 ttl_seconds: float = None):
+        self.path = Path(path or os.getenv("GENERATION_CACHE_DIR", "generation_cache"))
+        self.memory_entries = memory_entries or int(os.getenv("GENERATION_CACHE_MEMORY_ENTRIES", "256"))
+        self.disk_entries = disk_entries or int(os.getenv("GENERATION_CACHE_DISK_ENTRIES", "5000"))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("GENERATION_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path / "completions.sqlite3"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, content_type TEXT, model TEXT, text TEXT, "
+            "created_at REAL, last_used REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS completions_last_used ON completions (last_used)")
+        self._db.commit()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.stores = 0
+        self.expired = 0
+        self.memory_evictions = 0
+        self.disk_evictions = 0
+
+    @staticmethod
+    def make_key(content_type: str, model: str, prompt: str) -> str:
+        normalized = " ".join(prompt.split())
+        return hashlib.sha256(f"{content_type}\x00{model}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, text = entry
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return text
+                del self._memory[key]
+
+            row = self._db.execute("SELECT text, created_at FROM completions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            text, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._db.execute("DELETE FROM completions WHERE key = ?", (key,))
+                self._db.commit()
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE completions SET last_used = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self._remember(key, created_at, text)
+            self.disk_hits += 1
+            return text
+
+    def record_bypass(self):
+        with self._lock:
+            self.bypassed += 1
+
+    def put(self, key: str, content_type: str, model: str, text: str):
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, text)
+            self._db.execute(
+                "INSERT OR REPLACE INTO completions (key, content_type, model, text, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, content_type, model, text, now, now)
+            )
+            self.expired += self._db.execute(
+                "DELETE FROM completions WHERE created_at < ?", (now - self.ttl_seconds,)).rowcount
+            excess = self._db.execute("SELECT COUNT(*) FROM completions").fetchone()[0] - self.disk_entries
+            if excess > 0:
+                self.disk_evictions += self._db.execute(
+                    "DELETE FROM completions WHERE key IN "
+                    "(SELECT key FROM completions ORDER BY last_used LIMIT ?)", (excess,)).rowcount
+            self._db.commit()
+            self.stores += 1
+
+    def _remember(self, key: str, created_at: float, text: str):
+        self._memory[key] = (created_at, text)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self.memory_evictions += 1
+
+    def clear(self) -> int:
+        with self._lock:
+            self._memory.clear()
+            removed = self._db.execute("DELETE FROM completions").rowcount
+            self._db.commit()
+            return removed
+
+    def stats(self) -> Dict:
+        with self._lock:
+            disk = self._db.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_entries": len(self._memory),
+                "max_memory_entries": self.memory_entries,
+                "disk_entries": disk,
+                "max_disk_entries": self.disk_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "bypassed": self.bypassed,
+                "stores": self.stores,
+                "expired": self.expired,
+                "memory_evictions": self.memory_evictions,
+                "disk_evictions": self.disk_evictions
+            }
+
+
+_cache: Optional[GenerationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_generation_cache() -> Optional[GenerationCache]:
+    """The shared cache, opened on first use; None when GENERATION_CACHE_ENABLED is off"""
+    global _cache
+    if not generation_cache_enabled():
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = GenerationCache()
+    return _cache
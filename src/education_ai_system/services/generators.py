@@ -1,10 +1,13 @@
-from langchain_openai import ChatOpenAI
-from langchain_groq import ChatGroq
 from src.education_ai_system.utils.validators import load_prompt
+from src.education_ai_system.utils.executors import run_blocking
+from src.education_ai_system.services.generation_cache import get_generation_cache
 import yaml
 
 class ContentGenerator:
     def __init__(self):
+        # Imported here so the API can start without loading langchain
+        from langchain_groq import ChatGroq
+
         # self.llm = ChatOpenAI(model_name="gpt-4o", temperature=0.7)
         self.llm = ChatGroq(temperature=0.1,
                             model_name="llama3-70b-8192",
@@ -16,12 +19,71 @@ class ContentGenerator:
             "lesson_notes": load_prompt("lesson_notes")
         }
 
-    def generate(self, content_type: str, context: dict):
+    @property
+    def model_key(self) -> str:
+        """Model settings that change the output; part of the generation cache key"""
+        return f"{self.llm.model_name}|temperature={self.llm.temperature}|max_tokens={self.llm.max_tokens}"
+
+    def _cache_lookup(self, content_type: str, prompt: str, bypass_cache: bool, cache_info: dict):
+        """Returns (cache, key, cached text or None); bypass skips the lookup but the fresh result is still stored"""
+        if cache_info is not None:
+            cache_info["cached"] = False
+        cache = get_generation_cache()
+        if cache is None:
+            return None, None, None
+        key = cache.make_key(content_type, self.model_key, prompt)
+        if bypass_cache:
+            cache.record_bypass()
+            return cache, key, None
+        text = cache.get(key)
+        if cache_info is not None and text is not None:
+            cache_info["cached"] = True
+        return cache, key, text
+
+    def generate(self, content_type: str, context: dict, bypass_cache: bool = False, cache_info: dict = None):
+        prompt = self._build_prompt(content_type, context)
+        cache, key, cached = self._cache_lookup(content_type, prompt, bypass_cache, cache_info)
+        if cached is not None:
+            return cached
+        try:
+            text = self.llm.invoke(prompt).content
+        except Exception as e:
+            return f"Error generating content: {str(e)}"
+        if cache is not None and text:
+            cache.put(key, content_type, self.model_key, text)
+        return text
+
+    async def agenerate(self, content_type: str, context: dict, bypass_cache: bool = False,
+                        cache_info: dict = None):
+        """generate() on the model's native async client, so the event loop keeps serving while it waits"""
         prompt = self._build_prompt(content_type, context)
+        cache, key, cached = await run_blocking(
+            "database", self._cache_lookup, content_type, prompt, bypass_cache, cache_info)
+        if cached is not None:
+            return cached
         try:
-            return self.llm.invoke(prompt).content
+            text = (await self.llm.ainvoke(prompt)).content
         except Exception as e:
             return f"Error generating content: {str(e)}"
+        if cache is not None and text:
+            await run_blocking("database", cache.put, key, content_type, self.model_key, text)
+        return text
+
+    async def astream(self, content_type: str, context: dict, bypass_cache: bool = False, cache_info: dict = None):
+        """A cache hit is yielded as one piece; a streamed completion is cached once it is complete"""
+        prompt = self._build_prompt(content_type, context)
+        cache, key, cached = await run_blocking(
+            "database", self._cache_lookup, content_type, prompt, bypass_cache, cache_info)
+        if cached is not None:
+            yield cached
+            return
+        parts = []
+        async for chunk in self.llm.astream(prompt):
+            if chunk.content:
+                parts.append(chunk.content)
+                yield chunk.content
+        if cache is not None and parts:
+            await run_blocking("database", cache.put, key, content_type, self.model_key, "".join(parts))
 
     def _build_prompt(self, content_type: str, context: dict):
         template = self.prompts[content_type]
@@ -0,0 +1,179 @@
+# src/education_ai_system/services/ingestion_jobs.py
+"""Background PDF ingestion jobs.
+
+Uploads are spooled to disk and handed to a small worker pool, so the API
+handler returns a job ID immediately instead of blocking the event loop on
+extraction, inference and upserts. Job state is kept in memory and can be
+polled through /api/embeddings/jobs/{job_id}.
+"""
+
+import logging
+import os
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.education_ai_system.data_processing.pdf_extractor import count_pages
+
+logger = logging.getLogger("IngestionJobs")
+
+TERMINAL_STAGES = ("completed", "failed")
+
+
+def _safe_count_pages(path: Path) -> int:
+    # A broken file is reported by the pipeline itself; it only loses its share of the progress bar
+    try:
+        return count_pages(str(path))
+    except Exception:
+        return 0
+
+
+class IngestionJob:
+    def __init__(self, files: List[Tuple[str, Path]], bulk: bool = False):
+        self.id = str(uuid.uuid4())
+        self.files = files
+        self.bulk = bulk
+        self.filename = files[0][0] if len(files) == 1 else f"{len(files)} files"
+        self.spool_path = files[0][1]
+        self.stage = "queued"
+        self.total_pages = None
+        self.pages_processed = 0
+        self.chunks_processed = 0
+        self.chunks_skipped = 0
+        self.error = None
+        self.result = None
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def progress(self) -> float:
+        if self.stage == "completed":
+            return 1.0
+        if not self.total_pages:
+            return 0.0
+        return round(min(self.pages_processed / self.total_pages, 0.99), 3)
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.id,
+            "filename": self.filename,
+            "files": [name for name, _ in self.files],
+            "stage": self.stage,
+            "progress": self.progress,
+            "total_pages": self.total_pages,
+            "pages_processed": self.pages_processed,
+            "chunks_processed": self.chunks_processed,
+            "chunks_skipped": self.chunks_skipped,
+            "error": self.error,
+            "result": self.result,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+
+class IngestionJobManager:
+    def __init__(self, service_factory: Callable, workers: int = None, spool_dir: str = None,
+                 history: int = None):
+        self._service_factory = service_factory
+        self._service = None
+        self._service_lock = threading.Lock()
+        self.spool_dir = Path(spool_dir or os.getenv("INGEST_SPOOL_DIR", "ingest_spool"))
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers or int(os.getenv("INGEST_WORKERS", "2"))
+        self.history = history or int(os.getenv("INGEST_JOB_HISTORY", "500"))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ingest")
+        self._jobs: "OrderedDict[str, IngestionJob]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_service(self):
+        # Built on the first job, inside a worker, so model loading never runs on the event loop
+        with self._service_lock:
+            if self._service is None:
+                self._service = self._service_factory()
+            return self._service
+
+    def spool_path(self, filename: str) -> Path:
+        """Unique on-disk location for an upload before it is enqueued"""
+        return self.spool_dir / f"{uuid.uuid4().hex}_{Path(filename).name}"
+
+    def submit(self, filename: str, spool_path: Path) -> IngestionJob:
+        return self._enqueue(IngestionJob([(filename, spool_path)]))
+
+    def submit_bulk(self, files: List[Tuple[str, Path]]) -> IngestionJob:
+        """Queues several spooled PDFs as one job sharing a single pipeline"""
+        return self._enqueue(IngestionJob(files, bulk=True))
+
+    def _enqueue(self, job: IngestionJob) -> IngestionJob:
+        with self._lock:
+            self._jobs[job.id] = job
+            # Drop the oldest finished jobs once the history is full
+            while len(self._jobs) > self.history:
+                oldest_id, oldest = next(iter(self._jobs.items()))
+                if oldest.stage not in TERMINAL_STAGES:
+                    break
+                self._jobs.pop(oldest_id)
+        self._executor.submit(self._run, job)
+        logger.info(f"Queued ingestion job {job.id} for {job.filename}")
+        return job
+
+    def get(self, job_id: str) -> Optional[IngestionJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> list:
+        with self._lock:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def _run(self, job: IngestionJob):
+        job.started_at = datetime.now().isoformat()
+        start = time.perf_counter()
+        try:
+            job.stage = "loading"
+            service = self._get_service()
+            job.total_pages = sum(_safe_count_pages(path) for _, path in job.files)
+            job.stage = "processing"
+
+            def on_progress(pages: int = None, chunks: int = None, skipped: int = None, stage: str = None):
+                if pages is not None:
+                    job.pages_processed = pages
+                if chunks is not None:
+                    job.chunks_processed = chunks
+                if skipped is not None:
+                    job.chunks_skipped = skipped
+                if stage is not None:
+                    job.stage = stage
+
+            if job.bulk:
+                job.result = service.process_and_store_pdfs(
+                    [(str(path), name) for name, path in job.files],
+                    progress=on_progress,
+                    extract_workers=int(os.getenv("BULK_EXTRACT_WORKERS", "1"))
+                )
+            else:
+                job.result = service.process_and_store_pdf(
+                    str(job.spool_path), document_id=job.filename, progress=on_progress
+                )
+            job.stage = "completed"
+            logger.info(f"✅ Ingestion job {job.id} completed in {time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            job.stage = "failed"
+            job.error = str(e)
+            logger.error(f"❌ Ingestion job {job.id} failed: {e}\n{traceback.format_exc()}")
+        finally:
+            job.finished_at = datetime.now().isoformat()
+            for _, path in job.files:
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"⚠️ Could not remove spooled upload {path}: {e}")
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,160 @@
+# src/education_ai_system/services/lesson_plan_batches.py
+"""Background generation of every week's lesson plan for one scheme.
+
+Teachers used to call /api/content/lesson-plan once per week, one after
+another. A batch generates the weeks concurrently on the event loop, with
+at most ``concurrency`` model calls in flight, and then stores every plan
+with a single bulk insert. Per-week progress can be polled through
+/api/content/lesson-plans/batch/{job_id}.
+
+With the default cap of 8, a 13-week term takes about two generations'
+worth of time.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("LessonPlanBatches")
+
+TERMINAL_STAGES = ("completed", "partial", "failed")
+
+
+def batch_concurrency(requested: int = None) -> int:
+    """Requested cap, else LESSON_PLAN_BATCH_CONCURRENCY, clamped to LESSON_PLAN_BATCH_MAX_CONCURRENCY"""
+    default = int(os.getenv("LESSON_PLAN_BATCH_CONCURRENCY", "8"))
+    ceiling = int(os.getenv("LESSON_PLAN_BATCH_MAX_CONCURRENCY", "16"))
+    return max(1, min(requested or default, ceiling))
+
+
+class LessonPlanBatch:
+    def __init__(self, scheme_id: str, weeks: List[str], concurrency: int):
+        self.id = str(uuid.uuid4())
+        self.scheme_id = scheme_id
+        self.concurrency = concurrency
+        self.stage = "queued"
+        # week -> {"state": queued|generating|generated|saved|failed, ...}
+        self.weeks: "OrderedDict[str, Dict]" = OrderedDict(
+            (week, {"week": week, "state": "queued"}) for week in weeks)
+        self.error = None
+        self.created_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+        self.seconds = None
+
+    @property
+    def progress(self) -> float:
+        if self.stage in TERMINAL_STAGES:
+            return 1.0
+        done = sum(entry["state"] in ("generated", "saved", "failed") for entry in self.weeks.values())
+        # Saving is the last step, so generated-but-unsaved plans never show as 100%
+        return round(min(done / len(self.weeks), 0.99), 3) if self.weeks else 0.0
+
+    def to_dict(self) -> Dict:
+        states = [entry["state"] for entry in self.weeks.values()]
+        return {
+            "job_id": self.id,
+            "scheme_of_work_id": self.scheme_id,
+            "stage": self.stage,
+            "progress": self.progress,
+            "concurrency": self.concurrency,
+            "total_weeks": len(self.weeks),
+            "weeks_saved": states.count("saved"),
+            "weeks_failed": states.count("failed"),
+            "weeks": list(self.weeks.values()),
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "seconds": self.seconds
+        }
+
+
+class LessonPlanBatchManager:
+    def __init__(self, history: int = None):
+        self.history = history or int(os.getenv("LESSON_PLAN_BATCH_HISTORY", "200"))
+        self._jobs: "OrderedDict[str, LessonPlanBatch]" = OrderedDict()
+        # Running tasks are referenced here so they are not garbage collected mid-batch
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def submit(self, job: LessonPlanBatch,
+               generate: Callable[[str], Awaitable[Tuple[str, bool]]],
+               persist: Callable[[List[Tuple[str, str]]], Awaitable[List[Optional[str]]]]) -> LessonPlanBatch:
+        """Starts the batch on the running loop.
+
+        generate(week) returns (content, served_from_cache). persist([(week, content), ...])
+        stores all plans at once and returns their ids in the same order.
+        """
+        self._jobs[job.id] = job
+        while len(self._jobs) > self.history:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if oldest.stage not in TERMINAL_STAGES:
+                break
+            self._jobs.pop(oldest_id)
+        task = asyncio.get_running_loop().create_task(self._run(job, generate, persist))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.id, None))
+        logger.info(f"Queued lesson plan batch {job.id}: {len(job.weeks)} weeks, concurrency {job.concurrency}")
+        return job
+
+    def get(self, job_id: str) -> Optional[LessonPlanBatch]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> list:
+        return [job.to_dict() for job in self._jobs.values()]
+
+    async def _run(self, job: LessonPlanBatch, generate, persist):
+        job.started_at = datetime.now().isoformat()
+        job.stage = "generating"
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(job.concurrency)
+        contents: Dict[str, str] = {}
+
+        async def run_week(week: str):
+            entry = job.weeks[week]
+            async with semaphore:
+                entry["state"] = "generating"
+                week_start = time.perf_counter()
+                try:
+                    content, cached = await generate(week)
+                    if not content or content.startswith("Error generating content:"):
+                        raise RuntimeError(content or "The model returned no content")
+                    contents[week] = content
+                    entry.update(state="generated", cached=cached)
+                except Exception as e:
+                    entry.update(state="failed", error=str(e))
+                    logger.error(f"❌ Week {week} of batch {job.id} failed: {e}")
+                finally:
+                    entry["seconds"] = round(time.perf_counter() - week_start, 2)
+
+        try:
+            await asyncio.gather(*(run_week(week) for week in job.weeks))
+
+            generated = [(week, contents[week]) for week in job.weeks if week in contents]
+            if generated:
+                job.stage = "saving"
+                ids = await persist(generated)
+                for (week, _), plan_id in zip(generated, ids or []):
+                    if plan_id:
+                        job.weeks[week].update(state="saved", lesson_plan_id=plan_id)
+                for week, _ in generated:
+                    if job.weeks[week]["state"] != "saved":
+                        job.weeks[week].update(state="failed", error="Bulk insert did not return an id")
+
+            saved = sum(entry["state"] == "saved" for entry in job.weeks.values())
+            job.stage = "completed" if saved == len(job.weeks) else "partial" if saved else "failed"
+            logger.info(f"✅ Lesson plan batch {job.id}: {saved}/{len(job.weeks)} weeks saved "
+                        f"in {time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            job.stage = "failed"
+            job.error = str(e)
+            logger.error(f"❌ Lesson plan batch {job.id} failed: {e}\n{traceback.format_exc()}")
+        finally:
+            job.seconds = round(time.perf_counter() - start, 2)
+            job.finished_at = datetime.now().isoformat()
@@ -1,4 +1,11 @@
+import os
+import re
+from itertools import islice
+from pathlib import Path
 from src.education_ai_system.embeddings.pinecone_manager import PineconeManager
+from src.education_ai_system.embeddings.chunk_manifest import ChunkManifest, chunk_id
+from src.education_ai_system.embeddings.namespaces import normalize_key, subject_namespace
+from src.education_ai_system.tools.retrieval_cache import invalidate_for_ingestion
 from src.education_ai_system.data_processing import (
     pdf_extractor,
     text_chunker,
@@ -6,12 +13,166 @@ from src.education_ai_system.data_processing import (
 )
 
 class VectorizationService:
-    def __init__(self):
+    def __init__(self, chunking_mode: str = None, manifest: ChunkManifest = None):
         self.pinecone_manager = PineconeManager()
+        self.manifest = manifest or ChunkManifest()
+        # "tokens" matches the embedder's window; "words" keeps the original 512-word chunks
+        self.chunking_mode = chunking_mode or os.getenv("CHUNKING_MODE", "tokens")
+        self.token_overlap = int(os.getenv("CHUNK_TOKEN_OVERLAP", "0"))
+        self.document_tag_pages = int(os.getenv("DOCUMENT_TAG_PAGES", "3"))
 
-    # Remove @staticmethod decorator
-    def process_and_store_pdf(self, pdf_path: str):  # Add 'self' parameter
-        text, _ = pdf_extractor.extract_text_and_tables(pdf_path)
-        chunks = text_chunker.split_text_into_chunks(text)
-        metadata = [metadata_extractor.extract_metadata(chunk) for chunk in chunks]
-        self.pinecone_manager.upsert_content(chunks, metadata)
\ No newline at end of file
+    def process_and_store_pdf(self, pdf_path: str, window: int = None, document_id: str = None,
+                              progress=None):
+        """Streams pages -> chunks -> embedding -> upsert, one window of chunks at a time.
+
+        Only chunks that are not already indexed are embedded and upserted;
+        chunks that disappeared since the last ingestion of the same document
+        are deleted afterwards. ``progress`` is called with page/chunk counts
+        and stage changes as the document flows through.
+        """
+        document_id = document_id or Path(pdf_path).name
+        result = self.process_and_store_pdfs([(pdf_path, document_id)], window=window, progress=progress)
+        document = result["documents"][0]
+        if document["status"] == "error":
+            raise RuntimeError(document["error"])
+        stats = result["pipeline"]
+        stats.update({
+            "deleted": document["deleted"],
+            "skipped_unchanged": document["skipped_unchanged"],
+            "document_id": document_id,
+            "pages": document["pages"],
+            "chunking_mode": self.chunking_mode
+        })
+        return stats
+
+    def process_and_store_pdfs(self, documents, window: int = None, progress=None, extract_workers: int = None):
+        """Ingests several PDFs through one shared pipeline.
+
+        ``documents`` is a list of (pdf_path, document_id). Chunks from all
+        documents feed the same embedding batches and pipelined upserts, so
+        small files do not each pay for a partly filled batch. Pages of each
+        file are extracted on ``extract_workers`` processes. Subject and grade
+        are tagged once per document, from its name and first pages, and shared
+        by all its chunks. A file that fails to extract is reported and skipped
+        without stopping the others; chunks it upserted before failing are still
+        recorded in the manifest.
+        """
+        progress = progress or (lambda **kwargs: None)
+        window = window or self.pinecone_manager.batch_size
+        already_indexed = self.manifest.indexed_keys()
+        lexical = self.pinecone_manager.lexical
+        # (subject, grade) pairs with new chunks, for retrieval cache invalidation
+        touched = set()
+        deleted_namespaces = set()
+        reports = [{
+            "document_id": document_id,
+            "status": "success",
+            "pages": 0,
+            "chunks": 0,
+            "skipped_unchanged": 0,
+            "deleted": 0,
+            "error": None,
+            "_seen_keys": []
+        } for _, document_id in documents]
+        totals = {"pages": 0, "chunks": 0, "skipped": 0}
+
+        def page_texts(pdf_path, report):
+            for page_number, text, _ in pdf_extractor.iter_pages(pdf_path, workers=extract_workers):
+                report["pages"] = page_number
+                totals["pages"] += 1
+                progress(pages=totals["pages"])
+                yield text
+
+        def new_chunks():
+            tagger = metadata_extractor.get_tagger()
+            for (pdf_path, document_id), report in zip(documents, reports):
+                try:
+                    # Subject and grade are decided once from the title pages, then shared by every chunk
+                    document_tags = self._document_tags(tagger, pdf_path, document_id)
+                    for text, token_ids in self._iter_chunks(page_texts(pdf_path, report)):
+                        meta = tagger.tag_in_document(tagger.mentions(text), document_tags)
+                        key = (chunk_id(text), subject_namespace(meta[0]))
+                        report["_seen_keys"].append(key)
+                        report["chunks"] += 1
+                        totals["chunks"] += 1
+                        if key in already_indexed:
+                            if key not in lexical:
+                                # Backfill chunks indexed before the lexical index existed
+                                lexical.add(key, text, {"subject_key": normalize_key(meta[0]),
+                                                        "grade_key": normalize_key(meta[1])})
+                            report["skipped_unchanged"] += 1
+                            totals["skipped"] += 1
+                            progress(chunks=totals["chunks"], skipped=totals["skipped"])
+                            continue
+                        already_indexed.add(key)
+                        touched.add((meta[0], meta[1]))
+                        progress(chunks=totals["chunks"])
+                        yield text, token_ids, meta
+                except Exception as e:
+                    report["status"] = "error"
+                    report["error"] = f"{type(e).__name__}: {e}"
+
+        stats = self.pinecone_manager.upsert_stream(self._metadata_batches(new_chunks(), window))
+        progress(stage="finalizing")
+        # Leave failed chunks out of the manifest so the next ingestion retries them
+        failed_keys = set(stats.pop("failed_ids"))
+        for report in reports:
+            upserted_keys = [key for key in report.pop("_seen_keys") if key not in failed_keys]
+            if report["status"] == "error":
+                # Chunks upserted before the failure stay recorded, so a retry or removal can clean them up
+                self.manifest.add_keys(report["document_id"], upserted_keys)
+                continue
+            stale_keys = self.manifest.replace_document(report["document_id"], upserted_keys)
+            report["deleted"] = self.pinecone_manager.delete_ids(stale_keys)
+            deleted_namespaces.update(namespace for _, namespace in stale_keys)
+        lexical.save()
+        stats["cache_entries_invalidated"] = invalidate_for_ingestion(touched, deleted_namespaces)
+        stats["pages"] = totals["pages"]
+        stats["chunking_mode"] = self.chunking_mode
+        return {"pipeline": stats, "documents": reports}
+
+    def _document_tags(self, tagger, pdf_path, document_id):
+        """Document-level subject and grade from its file name and first DOCUMENT_TAG_PAGES pages.
+
+        Curriculum PDFs name their subject and class on the opening pages, so
+        this short pre-read is enough and the chunk stream itself stays unbuffered.
+        """
+        # Underscores and dashes would hide names like civic_education_primary_4.pdf from the matcher
+        texts = [re.sub(r"[^0-9A-Za-z]+", " ", str(Path(document_id).with_suffix("")))]
+        pages = pdf_extractor.iter_pages(pdf_path, workers=1)
+        try:
+            texts.extend(text for _, text, _ in islice(pages, self.document_tag_pages))
+        finally:
+            pages.close()
+        return tagger.tag_document(tagger.mentions(text) for text in texts)
+
+    def _iter_chunks(self, texts):
+        """Yields (chunk_text, token_ids); token_ids is None in word mode"""
+        if self.chunking_mode == "words":
+            for chunk in text_chunker.iter_chunks(texts):
+                yield chunk, None
+            return
+        if self.chunking_mode != "tokens":
+            raise ValueError(f"Unknown chunking mode '{self.chunking_mode}'")
+        embedder = self.pinecone_manager.embedder
+        yield from text_chunker.iter_token_chunks(
+            texts,
+            embedder.tokenize_with_offsets,
+            max_tokens=embedder.content_tokens,
+            overlap=self.token_overlap
+        )
+
+    @staticmethod
+    def _metadata_batches(chunks, window: int):
+        chunks = iter(chunks)
+        while True:
+            batch = list(islice(chunks, window))
+            if not batch:
+                return
+            texts = [text for text, _, _ in batch]
+            token_ids = [ids for _, ids, _ in batch]
+            yield (
+                texts,
+                [meta for _, _, meta in batch],
+                None if token_ids[0] is None else token_ids
+            )
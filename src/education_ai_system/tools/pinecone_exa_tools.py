@@ -1,28 +1,29 @@
 # src/education_ai_system/tools/pinecone_exa_tools.py
 
 from langchain.tools import BaseTool
-import os
 import json
-import torch
-from transformers import AutoTokenizer, AutoModel
 from pydantic import Field, ConfigDict
 from typing import List, Optional, Dict, Any
 from dotenv import load_dotenv
-import pinecone
 from src.education_ai_system.utils.validators import validate_user_input, load_predefined_inputs
+from src.education_ai_system.embeddings.query_vector_table import lookup_or_embed
+from src.education_ai_system.embeddings.vector_store import open_vector_store, vector_index_name
+from src.education_ai_system.embeddings.lexical_index import get_lexical_index
+from src.education_ai_system.embeddings.hybrid_retrieval import hybrid_query, retrieval_settings
+from src.education_ai_system.tools.retrieval_cache import get_retrieval_cache
+from src.education_ai_system.embeddings.namespaces import (
+    DEFAULT_NAMESPACE, UNASSIGNED_NAMESPACE, normalize_key, partitioning_enabled, subject_namespace
+)
+from src.education_ai_system.data_processing.metadata_extractor import UNKNOWN_GRADE
 
 # Load environment variables
 load_dotenv()
 
-# Initialize tokenizer and model for embeddings
-tokenizer = AutoTokenizer.from_pretrained("sentence-transformers/all-MiniLM-L6-v2")
-model = AutoModel.from_pretrained("sentence-transformers/all-MiniLM-L6-v2")
-
 class PineconeRetrievalTool(BaseTool):
     """Tool to retrieve relevant context from Pinecone vector database based on user query."""
     index: Optional[Any] = Field(default=None)  # Simplified type hint
+    lexical_index: Optional[Any] = Field(default=None)  # BM25 index built during ingestion
     predefined_inputs: Dict = Field(default_factory=load_predefined_inputs)
-    pc: Optional[Any] = Field(default=None)  # Pinecone client field
     stored_context: Optional[str] = None  # Store context for future use
     
     # Updated Pydantic config (v2 style)
@@ -37,34 +38,21 @@ class PineconeRetrievalTool(BaseTool):
         )
         super().__init__(name=name, description=description, **kwargs)
 
-        # Initialize Pinecone client AFTER super()
-        api_key = os.getenv("PINECONE_API_KEY")
-        index_name = os.getenv("PINECONE_INDEX_NAME", "ai-teach")
-        
-        if not api_key:
-            raise ValueError("Error: Pinecone API key is missing. Check your environment variables.")
+        # Initialize the vector store AFTER super()
+        self._connect()
 
-        self.pc = pinecone.Pinecone(api_key=api_key)
+    def _connect(self):
+        """Opens the shared vector index; retried on the next query if it fails"""
+        index_name = vector_index_name()
 
-        # Initialize Pinecone index
+        # Pinecone index or local store, depending on VECTOR_STORE_BACKEND
         try:
-            # Use Pinecone instance to list and create index if needed
-            available_indexes = self.pc.list_indexes().names()
-            if index_name not in available_indexes:
-                print(f"Index '{index_name}' does not exist. Creating it now...")
-                spec = pinecone.ServerlessSpec(cloud="aws", region="us-west-2")
-                self.pc.create_index(
-                    name=index_name,
-                    dimension=384,
-                    metric="cosine",
-                    spec=spec
-                )
-                print(f"Index '{index_name}' created successfully.")
-            else:
-                print(f"Index '{index_name}' found.")
-
-            self.index = self.pc.Index(index_name)
-            print(f"Successfully connected to Pinecone index: {index_name}")
+            self.index = open_vector_store(index_name)
+            print(f"Successfully connected to vector index: {index_name}")
+            self.lexical_index = get_lexical_index(index_name)
+        except ValueError:
+            # Missing API key or unknown backend is a configuration error, not a transient one
+            raise
         except Exception as e:
             print(f"Error initializing Pinecone index '{index_name}': {e}")
             self.index = None
@@ -82,6 +70,17 @@ class PineconeRetrievalTool(BaseTool):
 
     def _validate_and_retrieve(self, query: Dict[str, str], num_results: int = 3) -> Dict:
         """Validates the query and retrieves context from Pinecone"""
+        # Only valid results are cached, so a hit needs neither validation, embedding nor a query
+        cache = get_retrieval_cache()
+        cache_key = None
+        if cache.enabled and all(query.get(field) for field in ("subject", "grade_level", "topic")):
+            cache_key = cache.make_key(query, num_results, self._cache_variant())
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.stored_context = cached["context"]
+                return {**cached, "cached": True}
+        generation = cache.generation
+
         # Validate user input
         if not validate_user_input(query):
             return {
@@ -95,17 +94,13 @@ class PineconeRetrievalTool(BaseTool):
 
         # Query Pinecone
         try:
+            if not self.index:
+                # The tool is long-lived, so recover from an index that was unreachable at startup
+                self._connect()
             if not self.index:
                 raise ValueError("Pinecone index is not initialized.")
                 
-            # Updated query format for new SDK
-            response = self.index.query(
-                vector=query_vector,
-                top_k=num_results,
-                include_metadata=True
-            )
-
-            matches = response.get("matches", [])
+            matches, scope = self._query_matches(query, query_vector, num_results)
 
             if not matches:
                 return {"status": "invalid", "message": "No relevant data found.", "alternatives": []}
@@ -139,16 +134,48 @@ class PineconeRetrievalTool(BaseTool):
                 for match in matches
             ]
 
-            return {
+            result = {
                 "status": "valid",
                 "context": context,  # The actual retrieved context
                 "matches": serializable_matches,  # Serialized matches for JSON compatibility
-                "alternatives": alternatives
+                "alternatives": alternatives,
+                "scope": scope
             }
+            if cache_key is not None:
+                cache.put(cache_key, result, generation)
+            return result
 
         except Exception as e:
             return {"status": "error", "message": f"Error querying Pinecone: {e}"}
 
+    @staticmethod
+    def _cache_variant() -> str:
+        # Results differ by retrieval mode and partitioning, so they never share an entry
+        return f"{retrieval_settings()['mode']}|{partitioning_enabled()}"
+
+    def _query_matches(self, query: Dict[str, str], query_vector: List[float], num_results: int):
+        """Queries the subject's namespace filtered to the grade, falling back to the whole index.
+
+        Chunks whose subject or grade could not be tagged live in the unassigned
+        namespace or under the unknown grade key, so both scopes include them.
+        """
+        settings = retrieval_settings()
+        if partitioning_enabled():
+            namespaces = [subject_namespace(query["subject"]), UNASSIGNED_NAMESPACE]
+            grade_filter = {"grade_key": {"$in": [normalize_key(query["grade_level"]), normalize_key(UNKNOWN_GRADE)]}}
+            response = hybrid_query(self.index, self.lexical_index, query_vector, query["topic"], num_results,
+                                    filter=grade_filter, settings=settings, namespaces=namespaces)
+            if response["matches"]:
+                return response["matches"], {"namespace": namespaces[0], "namespaces": namespaces,
+                                             "filtered": True, "mode": response["mode"]}
+
+        # Vectors ingested before partitioning live unfiltered in the default namespace
+        namespaces = [DEFAULT_NAMESPACE, UNASSIGNED_NAMESPACE] if partitioning_enabled() else [DEFAULT_NAMESPACE]
+        response = hybrid_query(self.index, self.lexical_index, query_vector, query["topic"], num_results,
+                                settings=settings, namespaces=namespaces)
+        return response["matches"], {"namespace": "", "namespaces": namespaces, "filtered": False,
+                                     "mode": response["mode"]}
+
     def _run(self, query: str) -> str:
         """Runs the tool with JSON input"""
         try:
@@ -166,11 +193,9 @@ class PineconeRetrievalTool(BaseTool):
             return json.dumps({"status": "error", "message": f"Unexpected error: {str(e)}"})
 
     def _get_query_embedding(self, text: str) -> List[float]:
-        """Generates embeddings for a query text"""
-        inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True)
-        with torch.no_grad():
-            query_embedding = model(**inputs).last_hidden_state.mean(dim=1).cpu().numpy().squeeze()
-        return query_embedding.tolist()
+        """Looks up the precomputed query vector, embedding with the shared encoder on a miss"""
+        vector, _ = lookup_or_embed(text)
+        return vector
 
 # Rebuild the model to resolve Pydantic's forward references
 PineconeRetrievalTool.model_rebuild()
@@ -0,0 +1,137 @@
+# src/education_ai_system/tools/retrieval_cache.py
+"""Process-wide TTL/LRU cache of PineconeRetrievalTool results.
+
+Routes build a new PineconeRetrievalTool per request, so the cache lives at
+module level and every tool instance shares it. A hit skips both the query
+embedding and the vector-store round trip. Entries are dropped by the
+ingestion pipeline when new content lands for their subject/grade.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.education_ai_system.embeddings.namespaces import (
+    UNASSIGNED_NAMESPACE, normalize_key, partitioning_enabled, subject_namespace
+)
+from src.education_ai_system.data_processing.metadata_extractor import UNKNOWN_GRADE
+
+CacheKey = Tuple[str, str, str, int, str]
+
+
+class RetrievalCache:
+    def __init__(self, max_entries: int = None, ttl_seconds: float = None):
+        self.max_entries = max_entries or int(os.getenv("RETRIEVAL_CACHE_SIZE", "1024"))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("RETRIEVAL_CACHE_TTL_SECONDS", "3600"))
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation so a lookup that raced with ingestion is not cached
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(query: Dict[str, str], top_k: int, variant: str = "") -> CacheKey:
+        return (normalize_key(query["subject"]), normalize_key(query["grade_level"]),
+                normalize_key(query["topic"]), top_k, variant)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: CacheKey) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: CacheKey, value: Dict, generation: int = None):
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, subject: str = None, grade_level: str = None, namespace: str = None) -> int:
+        """Drops entries matching the given subject/grade/namespace; no arguments clears everything"""
+        subject = normalize_key(subject) if subject is not None else None
+        grade_level = normalize_key(grade_level) if grade_level is not None else None
+        with self._lock:
+            self._generation += 1
+            stale = [key for key in self._entries
+                     if (subject is None or key[0] == subject)
+                     and (grade_level is None or key[1] == grade_level)
+                     and (namespace is None or subject_namespace(key[0]) == namespace)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+
+_cache = RetrievalCache()
+
+
+def get_retrieval_cache() -> RetrievalCache:
+    return _cache
+
+
+def invalidate_for_ingestion(subject_grades: Iterable[Tuple[str, str]], deleted_namespaces: Iterable[str]) -> int:
+    """Drops cached results that newly ingested or deleted chunks could change"""
+    subject_grades, deleted_namespaces = set(subject_grades), set(deleted_namespaces)
+    if not subject_grades and not deleted_namespaces:
+        return 0
+    if not partitioning_enabled():
+        # Every chunk shares the default namespace, so any change can affect any query
+        return _cache.invalidate()
+    if UNASSIGNED_NAMESPACE in deleted_namespaces or any(
+            subject_namespace(subject) == UNASSIGNED_NAMESPACE for subject, _ in subject_grades):
+        # Every subject's queries also search the unassigned namespace
+        return _cache.invalidate()
+    dropped = 0
+    for subject, grade_level in subject_grades:
+        # Chunks with an unknown grade match queries for every grade of their subject
+        unknown_grade = normalize_key(grade_level) == normalize_key(UNKNOWN_GRADE)
+        dropped += _cache.invalidate(subject, None if unknown_grade else grade_level)
+    for namespace in deleted_namespaces:
+        dropped += _cache.invalidate(namespace=namespace)
+    return dropped
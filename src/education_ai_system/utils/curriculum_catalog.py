@@ -0,0 +1,175 @@
+# src/education_ai_system/utils/curriculum_catalog.py
+"""In-memory index of predefined_input.yaml.
+
+validate_user_input used to re-read and re-parse the YAML on every request
+and scan its lists for a match. The catalog is parsed once into hash maps
+keyed by normalised names (case and extra whitespace ignored) and reloaded
+only when the file's mtime changes. It also answers prefix and fuzzy
+suggestions for the subject, grade level and topic dropdowns.
+"""
+
+import difflib
+import logging
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from src.education_ai_system.embeddings.namespaces import normalize_key
+
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "predefined_input.yaml"
+SUGGESTION_FIELDS = ("subject", "grade_level", "topic")
+
+logger = logging.getLogger("CurriculumCatalog")
+
+
+class _Suggester:
+    """Prefix and fuzzy matching over one list of names (subjects, or a grade's topics, ...)"""
+
+    def __init__(self, names: List[str]):
+        self.names = list(dict.fromkeys(names))
+        self._canonical = {normalize_key(name): name for name in self.names}
+        # Every word-boundary suffix, sorted, so "demo" finds "Democracy" and "law" finds "Rule of Law"
+        self._suffixes: List[Tuple[str, int]] = sorted(
+            (" ".join(words[i:]), position)
+            for position, words in enumerate(key.split() for key in self._canonical)
+            for i in range(len(words))
+        )
+        self._suffix_keys = [suffix for suffix, _ in self._suffixes]
+
+    def suggest(self, text: str, limit: int) -> List[Dict]:
+        query = normalize_key(text)
+        if not query:
+            return [{"name": name, "match": "all"} for name in self.names[:limit]]
+
+        positions = []
+        start = bisect_left(self._suffix_keys, query)
+        for suffix, position in self._suffixes[start:]:
+            if not suffix.startswith(query):
+                break
+            positions.append(position)
+        # Names that start with the text come before names with a later word starting with it
+        ranked = sorted(dict.fromkeys(positions),
+                        key=lambda p: (not normalize_key(self.names[p]).startswith(query), p))
+        results = [{"name": self.names[p], "match": "prefix"} for p in ranked[:limit]]
+
+        if len(results) < limit:
+            seen = {result["name"] for result in results}
+            for key in difflib.get_close_matches(query, list(self._canonical), n=limit, cutoff=0.6):
+                name = self._canonical[key]
+                if name not in seen and len(results) < limit:
+                    results.append({"name": name, "match": "fuzzy"})
+        return results
+
+
+class CurriculumCatalog:
+    def __init__(self, config_path: Path = CONFIG_PATH):
+        self.config_path = Path(config_path)
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self.data: Dict = {}
+        self.loads = 0
+        self._load()
+
+    def _load(self):
+        try:
+            mtime = self.config_path.stat().st_mtime
+            with open(self.config_path, "r") as f:
+                data = yaml.safe_load(f) or {}
+        except Exception as e:
+            raise RuntimeError(f"Failed to load predefined inputs: {str(e)}")
+
+        # subject key -> grade key -> topic key -> canonical topic name
+        index: Dict[str, Dict[str, Dict[str, str]]] = {}
+        grade_names: Dict[Tuple[str, str], str] = {}
+        suggesters: Dict[Tuple, _Suggester] = {}
+        all_grades, all_topics = [], []
+        for subject in data.get("subjects", []):
+            subject_key = normalize_key(subject["name"])
+            grades = index.setdefault(subject_key, {})
+            subject_topics = []
+            for grade in subject.get("grade_levels", []):
+                grade_key = normalize_key(grade["name"])
+                grade_names.setdefault((subject_key, grade_key), grade["name"])
+                # A few entries historically used a singular 'topic' key
+                topics = grade.get("topics") or grade.get("topic") or []
+                grades.setdefault(grade_key, {}).update({normalize_key(topic): topic for topic in topics})
+                suggesters[("topic", subject_key, grade_key)] = _Suggester(topics)
+                subject_topics.extend(topics)
+                all_grades.append(grade["name"])
+            suggesters[("grade_level", subject_key)] = _Suggester(
+                [grade["name"] for grade in subject.get("grade_levels", [])])
+            suggesters[("topic", subject_key)] = _Suggester(subject_topics)
+            all_topics.extend(subject_topics)
+        suggesters[("subject",)] = _Suggester([subject["name"] for subject in data.get("subjects", [])])
+        suggesters[("grade_level",)] = _Suggester(all_grades)
+        suggesters[("topic",)] = _Suggester(all_topics)
+
+        # Swap everything in at once so readers never see a half-built catalog
+        self.data, self._index, self._grade_names, self._suggesters = data, index, grade_names, suggesters
+        self._mtime = mtime
+        self.loads += 1
+        logger.info(f"✅ Loaded curriculum catalog: {len(index)} subjects, {len(all_topics)} topics")
+
+    def refresh(self):
+        """Reloads the YAML if it changed on disk; a broken edit keeps the previous catalog"""
+        try:
+            mtime = self.config_path.stat().st_mtime
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            try:
+                self._load()
+            except RuntimeError as e:
+                logger.error(f"❌ Keeping previous curriculum catalog: {e}")
+                self._mtime = mtime
+
+    def is_valid(self, subject: str, grade_level: str, topic: str) -> bool:
+        self.refresh()
+        topics = self._index.get(normalize_key(subject), {}).get(normalize_key(grade_level))
+        return topics is not None and normalize_key(topic) in topics
+
+    def suggest(self, field: str, text: str = "", subject: str = None, grade_level: str = None,
+                limit: int = 10) -> List[Dict]:
+        """Names for a dropdown field starting with (or close to) text, scoped by subject/grade when given"""
+        if field not in SUGGESTION_FIELDS:
+            raise ValueError(f"Unknown field '{field}'. Expected one of {', '.join(SUGGESTION_FIELDS)}")
+        self.refresh()
+        scope = (field,)
+        if field != "subject" and subject:
+            scope += (normalize_key(subject),)
+            if field == "topic" and grade_level:
+                scope += (normalize_key(grade_level),)
+        suggester = self._suggesters.get(scope)
+        if suggester is None:
+            raise KeyError(f"Unknown subject or grade level: {subject}, {grade_level}")
+        return suggester.suggest(text, limit)
+
+    def stats(self) -> Dict:
+        return {
+            "subjects": len(self._index),
+            "grade_levels": len(self._grade_names),
+            "topics": sum(len(topics) for grades in self._index.values() for topics in grades.values()),
+            "loads": self.loads,
+            "mtime": self._mtime
+        }
+
+
+_catalog: Optional[CurriculumCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> CurriculumCatalog:
+    """The shared catalog, parsed on first use"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = CurriculumCatalog()
+    return _catalog
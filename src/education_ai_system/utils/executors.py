@@ -0,0 +1,85 @@
+# src/education_ai_system/utils/executors.py
+"""Bounded thread pools for blocking calls made from async route handlers.
+
+The Supabase client, the vector store and the query embedder are all
+synchronous. Called directly inside an ``async def`` handler they block the
+event loop, and every other request on the worker waits. ``run_blocking``
+hands such a call to a named pool instead:
+
+* ``database``  - Supabase reads and writes (``DATABASE_EXECUTOR_WORKERS``, default 16)
+* ``retrieval`` - query embedding plus vector/lexical search (``RETRIEVAL_EXECUTOR_WORKERS``, default 8)
+
+Separate pools keep slow retrievals from starving quick database writes.
+Each pool's size bounds how many of its calls run at once; extra calls
+queue inside the pool rather than spawning threads.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+_POOL_SIZES = {
+    "database": ("DATABASE_EXECUTOR_WORKERS", "16"),
+    "retrieval": ("RETRIEVAL_EXECUTOR_WORKERS", "8"),
+}
+
+_lock = threading.Lock()
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_counters: Dict[str, Dict[str, int]] = {}
+
+
+def get_executor(name: str) -> ThreadPoolExecutor:
+    executor = _executors.get(name)
+    if executor is not None:
+        return executor
+    if name not in _POOL_SIZES:
+        raise ValueError(f"Unknown executor '{name}'. Expected one of {', '.join(_POOL_SIZES)}")
+    with _lock:
+        if name not in _executors:
+            env_var, default = _POOL_SIZES[name]
+            _executors[name] = ThreadPoolExecutor(max_workers=int(os.getenv(env_var, default)),
+                                                  thread_name_prefix=f"{name}-io")
+            _counters[name] = {"submitted": 0, "running": 0, "completed": 0, "failed": 0}
+        return _executors[name]
+
+
+def _tracked(name: str, fn: Callable, *args, **kwargs):
+    counters = _counters[name]
+    with _lock:
+        counters["running"] += 1
+    try:
+        return fn(*args, **kwargs)
+    except Exception:
+        with _lock:
+            counters["failed"] += 1
+        raise
+    finally:
+        with _lock:
+            counters["running"] -= 1
+            counters["completed"] += 1
+
+
+async def run_blocking(name: str, fn: Callable, *args, **kwargs):
+    """Runs fn(*args, **kwargs) on the named pool and awaits its result without blocking the loop"""
+    executor = get_executor(name)
+    with _lock:
+        _counters[name]["submitted"] += 1
+    call = functools.partial(_tracked, name, fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+
+def executor_stats() -> Dict[str, Dict]:
+    with _lock:
+        return {
+            name: {
+                "max_workers": _executors[name]._max_workers,
+                "running": counters["running"],
+                "queued": counters["submitted"] - counters["completed"] - counters["running"],
+                "completed": counters["completed"],
+                "failed": counters["failed"]
+            }
+            for name, counters in _counters.items()
+        }
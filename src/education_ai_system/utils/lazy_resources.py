@@ -0,0 +1,107 @@
+# src/education_ai_system/utils/lazy_resources.py
+"""Lazily created, process-wide application resources.
+
+Route modules used to build their Groq, Supabase and Pinecone clients at
+import time, so uvicorn could not bind a port until every one of them was
+ready. A LazyResource stands in for such an object: it is created on first
+attribute access (or by the warm-up task) and then behaves like the real
+thing, so route code keeps calling ``generator.generate(...)`` unchanged.
+
+Every resource is registered by name, which lets main.py warm them up in
+the background and report readiness separately from liveness.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import traceback
+from typing import Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger("LazyResources")
+
+
+class LazyResource:
+    def __init__(self, name: str, factory: Callable):
+        self._name = name
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+        self._state = "pending"
+        self._seconds = None
+        self._error = None
+
+    def get(self):
+        """Creates the resource on first use; later calls return the same instance"""
+        if self._instance is not None:
+            return self._instance
+        with self._lock:
+            if self._instance is None:
+                self._state = "loading"
+                start = time.perf_counter()
+                try:
+                    instance = self._factory()
+                except Exception as e:
+                    self._state = "failed"
+                    self._error = f"{type(e).__name__}: {e}"
+                    raise
+                finally:
+                    self._seconds = round(time.perf_counter() - start, 3)
+                self._instance = instance
+                self._state = "ready"
+                self._error = None
+                logger.info(f"✅ {self._name} ready in {self._seconds:.2f}s")
+        return self._instance
+
+    async def aget(self):
+        """get() for async handlers: a first-use creation runs in a thread instead of on the event loop"""
+        if self._instance is not None:
+            return self._instance
+        return await asyncio.to_thread(self.get)
+
+    def __getattr__(self, attribute):
+        # Only reached for attributes LazyResource itself does not define
+        return getattr(self.get(), attribute)
+
+    @property
+    def ready(self) -> bool:
+        return self._instance is not None
+
+    def status(self) -> Dict:
+        return {"state": self._state, "seconds": self._seconds, "error": self._error}
+
+
+_resources: Dict[str, LazyResource] = {}
+_resources_lock = threading.Lock()
+
+
+def lazy_resource(name: str, factory: Callable) -> LazyResource:
+    """Registers a resource, or returns the already registered one so modules share a single instance"""
+    with _resources_lock:
+        resource = _resources.get(name)
+        if resource is None:
+            resource = LazyResource(name, factory)
+            _resources[name] = resource
+        return resource
+
+
+def warm_up(names: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+    """Creates registered resources one by one; a failure is recorded and does not stop the others"""
+    with _resources_lock:
+        targets = [(name, resource) for name, resource in _resources.items() if names is None or name in names]
+    for name, resource in targets:
+        try:
+            resource.get()
+        except Exception as e:
+            logger.error(f"❌ Warm-up of {name} failed: {e}\n{traceback.format_exc()}")
+    return resource_status()
+
+
+def resource_status() -> Dict[str, Dict]:
+    with _resources_lock:
+        return {name: resource.status() for name, resource in _resources.items()}
+
+
+def all_ready() -> bool:
+    with _resources_lock:
+        return all(resource.ready for resource in _resources.values())
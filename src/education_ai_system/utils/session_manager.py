@@ -27,6 +27,14 @@ class SessionManager:
         self.current_lesson_plan_id = lesson_plan_id
         return lesson_plan_id
 
+    def create_lesson_plans(self, scheme_id: str, items: list) -> list:
+        """Bulk variant of create_lesson_plan; one insert for a whole batch of weeks"""
+        for data in items:
+            if "week" not in data:
+                data["week"] = "1"
+        
+        return self.supabase.create_lesson_plans(scheme_id, items)
+
     def get_lesson_plan(self, lesson_plan_id: str) -> dict:
         return self.supabase.get_lesson_plan(lesson_plan_id)
 
@@ -1,22 +1,27 @@
 # src/education_ai_system/utils/supabase_manager.py
 import os
-from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("SupabaseManager")
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 load_dotenv()
 
 class SupabaseManager:
     def __init__(self):
         logger.info("Initializing Supabase client")
         try:
-            self.client: Client = create_client(
+            # Imported on first use so the API can bind its port before the client library loads
+            from supabase import create_client
+
+            self.client: "Client" = create_client(
                 os.getenv("SUPABASE_URL"),
                 os.getenv("SUPABASE_KEY")
             )
@@ -134,19 +139,7 @@ class SupabaseManager:
                 raise ValueError("Missing required fields in lesson plan data")
             
             # Prepare the data to be inserted
-            insert_data = {
-                "scheme_id": scheme_id,
-                "payload": data["payload"],
-                "content": data["content"]
-            }
-            
-            # Add week only if column exists
-            if hasattr(self, '_week_column_exists') and self._week_column_exists:
-                insert_data["week"] = data.get("week", "1")
-            
-            # Check if "context_id" is in the data and include it
-            if "context_id" in data:
-                insert_data["context_id"] = data["context_id"]
+            insert_data = self._lesson_plan_row(scheme_id, data)
             
             # Insert the data into the table
             response = self.client.table('lesson_plans').insert(insert_data).execute()
@@ -166,6 +159,50 @@ class SupabaseManager:
             logger.error(f"❌ Lesson plan creation error: {str(e)}")
             return None
 
+    def _lesson_plan_row(self, scheme_id: str, data: dict) -> dict:
+        row = {
+            "scheme_id": scheme_id,
+            "payload": data["payload"],
+            "content": data["content"]
+        }
+        
+        # Add week only if column exists
+        if hasattr(self, '_week_column_exists') and self._week_column_exists:
+            row["week"] = data.get("week", "1")
+        
+        # Check if "context_id" is in the data and include it
+        if "context_id" in data:
+            row["context_id"] = data["context_id"]
+        return row
+
+    def create_lesson_plans(self, scheme_id: str, items: list) -> list:
+        """Inserts several lesson plans in one request; returns their IDs in the order given"""
+        logger.info(f"Creating {len(items)} lesson plans for scheme ID: {scheme_id}")
+        try:
+            if not scheme_id:
+                raise ValueError("Scheme ID is required")
+            if not items:
+                return []
+            if any(field not in data for data in items for field in ("payload", "content")):
+                raise ValueError("Missing required fields in lesson plan data")
+            
+            rows = [self._lesson_plan_row(scheme_id, data) for data in items]
+            response = self.client.table('lesson_plans').insert(rows).execute()
+            
+            if response.data and len(response.data) == len(rows):
+                plan_ids = [row['id'] for row in response.data]
+                logger.info(f"✅ {len(plan_ids)} lesson plans created")
+                return plan_ids
+            logger.error("❌ Bulk lesson plan creation failed: No data returned")
+            return [None] * len(items)
+        except Exception as e:
+            if "Could not find the 'week' column" in str(e):
+                logger.warning("⚠️ 'week' column not found. Creating without week information")
+                self._week_column_exists = False
+                return self.create_lesson_plans(scheme_id, items)  # Retry without week
+            logger.error(f"❌ Bulk lesson plan creation error: {str(e)}")
+            return [None] * len(items)
+
     def get_lesson_plan(self, lesson_plan_id: str) -> dict:
         logger.info(f"Fetching lesson plan with ID: {lesson_plan_id}")
         try:
@@ -0,0 +1,121 @@
+# src/education_ai_system/utils/week_index.py
+"""Week table parsed once from a generated scheme of work (or lesson plan).
+
+Lesson-plan and lesson-notes requests used to re-scan the whole scheme
+markdown for every lookup. WeekIndex parses it a single time, when the
+scheme is created, into {week: topic, sub-topics, offsets}. The result is
+stored with the scheme, so later requests only do a dictionary lookup and
+a string slice.
+
+Two layouts are recognised, matching what the prompts ask the model for:
+
+* table rows - ``| 3 | Civic Responsibilities | Voting, community service |``
+  (the first cell may also read ``Week 3`` or a range such as ``7-8``)
+* section headers - ``## WEEK 3: Civic Responsibilities`` followed by the
+  week's text up to the next week header
+"""
+
+import re
+from typing import Dict, List, Optional
+
+INDEX_VERSION = 1
+
+_WEEK_CELL = re.compile(r"^(?:week\s*)?(\d{1,2})(?:\s*(?:-|–|to)\s*(\d{1,2}))?$", re.IGNORECASE)
+_WEEK_HEADER = re.compile(r"^[#*\s]*week\s+(\d{1,2})\b[\s:.)*\-–]*(.*)$", re.IGNORECASE)
+
+
+def normalize_week(week) -> str:
+    """'Week 03', 3 and '3' all become '3'"""
+    digits = "".join(filter(str.isdigit, str(week)))
+    return str(int(digits)) if digits else ""
+
+
+def _split_subtopics(cell: str) -> List[str]:
+    parts = re.split(r"\s*(?:<br\s*/?>|;|,|•)\s*", cell)
+    return [part.strip(" *-") for part in parts if part.strip(" *-")]
+
+
+class WeekIndex:
+    def __init__(self, weeks: Dict[str, Dict] = None, main_topic: str = None):
+        # week -> {"topic", "subtopics", "start", "end"}; start/end are character offsets into the content
+        self._weeks = weeks or {}
+        self.main_topic = main_topic
+
+    @classmethod
+    def from_content(cls, content: str) -> "WeekIndex":
+        """Single pass over the markdown; table rows give topics, headers give section bounds"""
+        weeks: Dict[str, Dict] = {}
+        headers = []
+        main_topic = None
+        position = 0
+        for line in (content or "").splitlines(keepends=True):
+            start, position = position, position + len(line)
+            stripped = line.strip()
+
+            if stripped.startswith("|"):
+                cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+                match = _WEEK_CELL.match(cells[0].strip("* ")) if cells else None
+                if not match:
+                    continue
+                first = int(match.group(1))
+                last = int(match.group(2) or first)
+                for number in range(first, max(first, last) + 1):
+                    entry = weeks.setdefault(str(number), {"start": start, "end": position})
+                    entry.setdefault("topic", cells[1].strip("* ") if len(cells) > 1 else "")
+                    entry.setdefault("subtopics", _split_subtopics(cells[2]) if len(cells) > 2 else [])
+                continue
+
+            match = _WEEK_HEADER.match(stripped)
+            if match:
+                headers.append((match.group(1), start, match.group(2).strip(" *")))
+            elif main_topic is None and "TOPIC:" in line:
+                main_topic = line.split("TOPIC:", 1)[1].strip()
+
+        # A header section runs to the next week header (or the end of the content)
+        for i, (number, start, title) in enumerate(headers):
+            end = headers[i + 1][1] if i + 1 < len(headers) else len(content)
+            entry = weeks.setdefault(str(int(number)), {"topic": title, "subtopics": []})
+            entry["start"], entry["end"] = start, end
+            if not entry.get("topic"):
+                entry["topic"] = title
+        return cls(weeks, main_topic)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> Optional["WeekIndex"]:
+        if not data or data.get("version") != INDEX_VERSION:
+            return None
+        return cls(data.get("weeks", {}), data.get("main_topic"))
+
+    @classmethod
+    def for_record(cls, record: Dict) -> "WeekIndex":
+        """Index stored with a scheme/lesson-plan row, parsed on the fly for rows created before it existed"""
+        payload = record.get("payload") or {}
+        index = cls.from_dict(payload.get("week_index")) if isinstance(payload, dict) else None
+        return index if index is not None else cls.from_content(record.get("content") or "")
+
+    def to_dict(self) -> Dict:
+        return {"version": INDEX_VERSION, "weeks": self._weeks, "main_topic": self.main_topic}
+
+    def weeks(self) -> List[str]:
+        return sorted(self._weeks, key=int)
+
+    def get(self, week) -> Optional[Dict]:
+        return self._weeks.get(normalize_week(week))
+
+    def topic(self, week) -> Optional[str]:
+        entry = self.get(week)
+        return entry.get("topic") if entry else None
+
+    def topic_or_default(self, week) -> str:
+        """Week topic, else the content's TOPIC: line, else 'General Topic'"""
+        return self.topic(week) or self.main_topic or "General Topic"
+
+    def section(self, content: str, week) -> str:
+        """The week's slice of the content the index was built from, or '' if the week is absent"""
+        entry = self.get(week)
+        if not entry or not content:
+            return ""
+        return content[entry["start"]:entry["end"]]
+
+    def __len__(self):
+        return len(self._weeks)
@@ -3,13 +3,77 @@ import streamlit as st
 import requests
 import tempfile
 import os
+import json
+import time
 from datetime import datetime
-import yaml
 from src.education_ai_system.utils.validators import extract_weeks_from_scheme, extract_week_topic
+from src.education_ai_system.utils.curriculum_catalog import get_catalog
 
 # Configuration
 API_BASE_URL = "http://localhost:8001"  # Update if deployed
 
+def wait_for_ingestion_job(job_id, status_container, poll_seconds=1.0):
+    """Polls a background ingestion job until it completes or fails"""
+    placeholder = status_container.empty()
+    while True:
+        job = requests.get(f"{API_BASE_URL}/api/embeddings/jobs/{job_id}").json()
+        placeholder.write(
+            f"{job.get('filename')}: {job.get('stage')} "
+            f"({int(job.get('progress', 0) * 100)}%, {job.get('chunks_processed', 0)} chunks)"
+        )
+        if job.get("stage") in ("completed", "failed") or "detail" in job:
+            placeholder.empty()
+            return job
+        time.sleep(poll_seconds)
+
+@st.cache_data(ttl=60)
+def catalog_options(field, subject=None, grade_level=None):
+    """Dropdown options from the API's curriculum catalog, or the local YAML if the API is unreachable"""
+    params = {"field": field, "limit": 200}
+    if subject:
+        params["subject"] = subject
+    if grade_level:
+        params["grade_level"] = grade_level
+    try:
+        response = requests.get(f"{API_BASE_URL}/api/content/catalog/suggest", params=params, timeout=5)
+        response.raise_for_status()
+        suggestions = response.json()["suggestions"]
+    except (requests.RequestException, KeyError, ValueError):
+        try:
+            suggestions = get_catalog().suggest(field, "", subject, grade_level, 200)
+        except KeyError:
+            suggestions = []
+    return [suggestion["name"] for suggestion in suggestions]
+
+def stream_content(path, payload):
+    """Posts to a /stream endpoint, rendering tokens as they arrive; returns (status_code, final response body)"""
+    try:
+        response = requests.post(f"{API_BASE_URL}{path}", json=payload, stream=True, timeout=(10, 300))
+    except requests.RequestException as e:
+        return 503, {"detail": str(e)}
+    if response.status_code != 200:
+        return response.status_code, response.json()
+
+    placeholder = st.empty()
+    text, event, result = "", None, None
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith("event: "):
+            event = line[len("event: "):]
+        elif line.startswith("data: "):
+            data = json.loads(line[len("data: "):])
+            if event == "token":
+                text += data["text"]
+                placeholder.markdown(text)
+            elif event == "done":
+                result = data
+            elif event == "error":
+                placeholder.empty()
+                return 500, data
+    placeholder.empty()
+    if result is None:
+        return 500, {"detail": "Stream ended before generation completed"}
+    return 200, result
+
 def main():
     st.title("AI-Teacher's Content Assistant")
     st.markdown("**Nigerian Educational Content Generation System**")
@@ -110,42 +174,49 @@ def main():
                     progress_bar = st.progress(0)
                     status_container = st.container()
                     
-                    for i, uploaded_file in enumerate(uploaded_files):
-                        try:
-                            # Save file to temp directory
-                            file_path = os.path.join(temp_dir, uploaded_file.name)
-                            with open(file_path, "wb") as f:
-                                f.write(uploaded_file.getbuffer())
-                            
-                            # Display processing status
-                            status_container.write(f"Processing {uploaded_file.name}...")
-                            
-                            # Send file to API
-                            with open(file_path, "rb") as f:
-                                files = {"file": (uploaded_file.name, f, "application/pdf")}
-                                response = requests.post(
-                                    f"{API_BASE_URL}/api/embeddings/process_pdf",
-                                    files=files
-                                )
-                            
-                            # Update progress
-                            progress = (i + 1) / len(uploaded_files)
-                            progress_bar.progress(progress)
-                            
-                            if response.status_code == 200:
-                                result = response.json()
-                                processing_status[uploaded_file.name] = {
-                                    "status": "success",
-                                    "details": f"Processed {result.get('num_pages', 0)} pages"
-                                }
-                                processed_files.append(uploaded_file.name)
-                            else:
-                                error = response.json().get('detail', 'Unknown error')
+                    try:
+                        # Send every file to the bulk endpoint in one request
+                        status_container.write(f"Uploading {len(uploaded_files)} files...")
+                        files = [
+                            ("files", (uploaded_file.name, uploaded_file.getvalue(), "application/pdf"))
+                            for uploaded_file in uploaded_files
+                        ]
+                        response = requests.post(f"{API_BASE_URL}/api/embeddings/process_pdfs", files=files)
+
+                        if response.status_code == 200 and response.json().get("job_id"):
+                            # Ingestion runs in the background; poll the job until it finishes
+                            job = wait_for_ingestion_job(response.json()["job_id"], status_container)
+                            progress_bar.progress(1.0)
+                            documents = (job.get("result") or {}).get("documents", [])
+                            for document in documents:
+                                if document.get("status") == "success":
+                                    processing_status[document["document_id"]] = {
+                                        "status": "success",
+                                        "details": f"Processed {document.get('pages', 0)} pages, "
+                                                   f"{document.get('chunks', 0)} chunks"
+                                    }
+                                    processed_files.append(document["document_id"])
+                                else:
+                                    processing_status[document["document_id"]] = {
+                                        "status": "error",
+                                        "details": f"Failed: {document.get('error', 'Unknown error')}"
+                                    }
+                            if not documents:
+                                for uploaded_file in uploaded_files:
+                                    processing_status[uploaded_file.name] = {
+                                        "status": "error",
+                                        "details": f"Failed: {job.get('error', 'Unknown error')}"
+                                    }
+                        else:
+                            body = response.json()
+                            error = body.get('detail', body.get('message', 'Unknown error'))
+                            for uploaded_file in uploaded_files:
                                 processing_status[uploaded_file.name] = {
                                     "status": "error",
                                     "details": f"Failed: {error}"
                                 }
-                        except Exception as e:
+                    except Exception as e:
+                        for uploaded_file in uploaded_files:
                             processing_status[uploaded_file.name] = {
                                 "status": "error",
                                 "details": f"Processing error: {str(e)}"
@@ -335,55 +406,20 @@ def main():
             st.warning("No evaluation data available. Generate content first.")
 
 def show_scheme_creation_ui():
-    # Load predefined inputs from YAML
-    with open("src/education_ai_system/config/predefined_input.yaml", "r") as file:
-        predefined_data = yaml.safe_load(file)
-    
     st.markdown("### Scheme of Work Parameters")
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        # Get subject options from YAML
-        subject_options = [subject["name"] for subject in predefined_data["subjects"]]
-        subject = st.selectbox("Subject", subject_options)
+        subject = st.selectbox("Subject", catalog_options("subject"))
     
     with col2:
-        # Find the selected subject
-        selected_subject = next(
-            (s for s in predefined_data["subjects"] if s["name"] == subject), 
-            None
-        )
-        
-        if selected_subject:
-            # Get grade levels based on selected subject
-            grade_options = [grade["name"] for grade in selected_subject["grade_levels"]]
-            grade_level = st.selectbox("Grade Level", grade_options)
-        else:
-            grade_level = st.selectbox("Grade Level", [])
+        # Grade levels offered for the selected subject
+        grade_options = catalog_options("grade_level", subject) if subject else []
+        grade_level = st.selectbox("Grade Level", grade_options)
     
     with col3:
-        if selected_subject and grade_level:
-            # Find the selected grade level
-            selected_grade = next(
-                (g for g in selected_subject["grade_levels"] if g["name"] == grade_level), 
-                None
-            )
-            
-            if selected_grade:
-                # Get topics - handle both 'topics' and 'topic' keys
-                if "topics" in selected_grade:
-                    topic_options = selected_grade["topics"]
-                elif "topic" in selected_grade:
-                    # Handle singular 'topic' key (like in Primary Five)
-                    topic_options = selected_grade["topic"]
-                else:
-                    topic_options = []
-                    
-                topic = st.selectbox("Topic", topic_options)
-            else:
-                topic = st.selectbox("Topic", [])
-        else:
-            topic = st.selectbox("Topic", [])
+        topic_options = catalog_options("topic", subject, grade_level) if subject and grade_level else []
+        topic = st.selectbox("Topic", topic_options)
     
     if st.button("Generate Scheme of Work"):
         payload = {
@@ -393,14 +429,10 @@ def show_scheme_creation_ui():
         }
         
         try:
-            with st.spinner("Generating scheme of work..."):
-                response = requests.post(
-                    f"{API_BASE_URL}/api/content/scheme-of-work",
-                    json=payload
-                )
-                
-            if response.status_code == 200:
-                result = response.json()
+            # Tokens are shown as they are generated; result is the saved content's response
+            status_code, result = stream_content("/api/content/scheme-of-work/stream", payload)
+
+            if status_code == 200:
                 st.session_state.generated_content['scheme']['content'] = {
                     'id': result['scheme_of_work_id'],
                     'content': result['scheme_of_work_output'],
@@ -442,7 +474,7 @@ def show_scheme_creation_ui():
                 
                 st.rerun()
             else:
-                st.error(f"Error generating scheme: {response.json().get('detail', 'Unknown error')}")
+                st.error(f"Error generating scheme: {result.get('detail', 'Unknown error')}")
         except Exception as e:
             st.error(f"API Connection Error: {str(e)}")
 
@@ -507,14 +539,10 @@ def show_lesson_plan_creation_ui():
         }
         
         try:
-            with st.spinner("Generating lesson plan..."):
-                response = requests.post(
-                    f"{API_BASE_URL}/api/content/lesson-plan",
-                    json=payload
-                )
-                
-            if response.status_code == 200:
-                result = response.json()
+            # Tokens are shown as they are generated; result is the saved content's response
+            status_code, result = stream_content("/api/content/lesson-plan/stream", payload)
+
+            if status_code == 200:
                 content_data = {
                     'id': result['lesson_plan_id'],
                     'content': result['lesson_plan_output'],
@@ -567,7 +595,7 @@ def show_lesson_plan_creation_ui():
                 
                 st.rerun()
             else:
-                error_msg = f"Error generating lesson plan: {response.json().get('detail', 'Unknown error')}"
+                error_msg = f"Error generating lesson plan: {result.get('detail', 'Unknown error')}"
                 st.error(error_msg)
                 # Store error in evaluation field for visibility
                 st.session_state.generated_content['lesson_plan']['evaluation'] = {
@@ -622,14 +650,10 @@ def show_lesson_notes_creation_ui():
         }
         
         try:
-            with st.spinner("Generating lesson notes..."):
-                response = requests.post(
-                    f"{API_BASE_URL}/api/content/lesson-notes",
-                    json=payload
-                )
-                
-            if response.status_code == 200:
-                result = response.json()
+            # Tokens are shown as they are generated; result is the saved content's response
+            status_code, result = stream_content("/api/content/lesson-notes/stream", payload)
+
+            if status_code == 200:
                 
                 # Handle context_id safely
                 content_data = {
@@ -683,7 +707,7 @@ def show_lesson_notes_creation_ui():
                 
                 st.rerun()
             else:
-                error_msg = f"Error generating notes: {response.json().get('detail', 'Unknown error')}"
+                error_msg = f"Error generating notes: {result.get('detail', 'Unknown error')}"
                 st.error(error_msg)
                 st.session_state.generated_content['lesson_notes']['evaluation'] = {
                     'status': 'error',